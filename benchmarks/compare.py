@@ -0,0 +1,248 @@
+# benchmarks/compare.py
+"""
+Comparaison de deux runs de benchmarks/pipeline_stages.py (gate de régression).
+
+Pour chaque (taille, étape) présente dans les deux fichiers :
+- débit : ratio des médianes de lignes/s (candidat / référence), avec un
+  intervalle de confiance bootstrap (rééchantillonnage des répétitions
+  de chaque côté)
+- mémoire : différence des médianes de hausse du pic RSS, avec son
+  intervalle bootstrap
+
+Une étape est en régression si la dégradation médiane dépasse la
+tolérance ET si l'intervalle de confiance exclut « pas de changement »
+(ratio < 1 pour le débit, différence > 0 pour la mémoire) : le bruit
+entre répétitions ne fait pas échouer le gate.
+
+Code de sortie : 0 sans régression, 1 si au moins une régression.
+
+Usage :
+    python benchmarks/compare.py baseline.json candidate.json --tolerance 0.05
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+SUPPORTED_SCHEMA_VERSIONS = (1,)
+
+
+@dataclass(frozen=True)
+class StageComparison:
+    size: str
+    stage: str
+    baseline_rows_per_s: float
+    candidate_rows_per_s: float
+    throughput_ratio: float
+    throughput_ci: Tuple[float, float]
+    baseline_peak_rss_mb: float
+    candidate_peak_rss_mb: float
+    memory_delta_mb: float
+    memory_delta_ci: Tuple[float, float]
+    throughput_regression: bool
+    memory_regression: bool
+
+    @property
+    def regression(self) -> bool:
+        return self.throughput_regression or self.memory_regression
+
+
+# ======================================================================
+# Statistiques
+# ======================================================================
+def bootstrap_median_ci(
+    baseline: Sequence[float],
+    candidate: Sequence[float],
+    statistic: str,
+    confidence: float = 0.95,
+    n_resamples: int = 10_000,
+    seed: int = 0,
+) -> Tuple[float, Tuple[float, float]]:
+    """
+    Statistique des médianes (statistic="ratio" : candidat / référence,
+    "difference" : candidat - référence) et son intervalle de confiance
+    par bootstrap percentile, les deux échantillons étant rééchantillonnés
+    indépendamment.
+    """
+    baseline = np.asarray(baseline, dtype=np.float64)
+    candidate = np.asarray(candidate, dtype=np.float64)
+    rng = np.random.default_rng(seed)
+
+    def combine(b: np.ndarray, c: np.ndarray) -> np.ndarray:
+        if statistic == "ratio":
+            return np.divide(c, b, out=np.full_like(c, np.nan), where=b != 0)
+        return c - b
+
+    point = float(combine(np.array([np.median(baseline)]), np.array([np.median(candidate)]))[0])
+
+    b_medians = np.median(rng.choice(baseline, size=(n_resamples, len(baseline))), axis=1)
+    c_medians = np.median(rng.choice(candidate, size=(n_resamples, len(candidate))), axis=1)
+    resampled = combine(b_medians, c_medians)
+
+    alpha = (1 - confidence) / 2
+    low, high = np.nanquantile(resampled, [alpha, 1 - alpha])
+    return point, (float(low), float(high))
+
+
+# ======================================================================
+# Comparaison
+# ======================================================================
+def load_results(path: Path) -> Dict[str, Any]:
+    with open(path, encoding="utf-8") as f:
+        suite = json.load(f)
+    if suite.get("schema_version") not in SUPPORTED_SCHEMA_VERSIONS:
+        raise ValueError(f"{path} : schema_version non supporté ({suite.get('schema_version')})")
+    return suite
+
+
+def compare_suites(
+    baseline: Dict[str, Any],
+    candidate: Dict[str, Any],
+    tolerance: float = 0.05,
+    memory_tolerance: float = 0.10,
+    memory_floor_mb: float = 5.0,
+    confidence: float = 0.95,
+    n_resamples: int = 10_000,
+    stages: Optional[Sequence[str]] = None,
+) -> List[StageComparison]:
+    """
+    tolerance        : baisse de débit tolérée (0.05 = -5 % de lignes/s)
+    memory_tolerance : hausse de pic RSS tolérée, relative à la référence
+    memory_floor_mb  : hausse absolue toujours tolérée (pics proches de 0)
+    """
+    comparisons = []
+
+    for size, baseline_stages in baseline["results"].items():
+        candidate_stages = candidate["results"].get(size)
+        if candidate_stages is None:
+            continue
+
+        for stage, baseline_entry in baseline_stages.items():
+            if stage not in candidate_stages or (stages and stage not in stages):
+                continue
+            b_runs = baseline_entry["runs"]
+            c_runs = candidate_stages[stage]["runs"]
+
+            ratio, ratio_ci = bootstrap_median_ci(
+                [r["rows_per_s"] for r in b_runs],
+                [r["rows_per_s"] for r in c_runs],
+                "ratio",
+                confidence,
+                n_resamples,
+            )
+            b_rss = [r["peak_rss_delta_mb"] for r in b_runs]
+            c_rss = [r["peak_rss_delta_mb"] for r in c_runs]
+            rss_delta, rss_ci = bootstrap_median_ci(b_rss, c_rss, "difference", confidence, n_resamples)
+
+            memory_allowance = max(memory_floor_mb, memory_tolerance * float(np.median(b_rss)))
+
+            comparisons.append(
+                StageComparison(
+                    size=size,
+                    stage=stage,
+                    baseline_rows_per_s=float(np.median([r["rows_per_s"] for r in b_runs])),
+                    candidate_rows_per_s=float(np.median([r["rows_per_s"] for r in c_runs])),
+                    throughput_ratio=ratio,
+                    throughput_ci=ratio_ci,
+                    baseline_peak_rss_mb=float(np.median(b_rss)),
+                    candidate_peak_rss_mb=float(np.median(c_rss)),
+                    memory_delta_mb=rss_delta,
+                    memory_delta_ci=rss_ci,
+                    throughput_regression=ratio < 1 - tolerance and ratio_ci[1] < 1,
+                    memory_regression=rss_delta > memory_allowance and rss_ci[0] > 0,
+                )
+            )
+
+    return comparisons
+
+
+# ======================================================================
+# CLI
+# ======================================================================
+def _print_report(comparisons: List[StageComparison]) -> None:
+    print(
+        f"{'size':<8}{'stage':<12}{'rows/s base':>13}{'rows/s cand':>13}"
+        f"{'ratio':>8}{'CI':>17}{'ΔRSS MB':>10}{'CI':>17}  verdict"
+    )
+    for c in comparisons:
+        verdict = []
+        if c.throughput_regression:
+            verdict.append(f"DÉBIT -{(1 - c.throughput_ratio) * 100:.1f}%")
+        if c.memory_regression:
+            verdict.append(f"MÉMOIRE +{c.memory_delta_mb:.1f} MB")
+        print(
+            f"{c.size:<8}{c.stage:<12}{c.baseline_rows_per_s:>13.0f}{c.candidate_rows_per_s:>13.0f}"
+            f"{c.throughput_ratio:>8.3f}{f'[{c.throughput_ci[0]:.3f}, {c.throughput_ci[1]:.3f}]':>17}"
+            f"{c.memory_delta_mb:>10.1f}{f'[{c.memory_delta_ci[0]:.1f}, {c.memory_delta_ci[1]:.1f}]':>17}"
+            f"  {', '.join(verdict) or 'ok'}"
+        )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("baseline", type=Path, help="Résultats de référence (JSON)")
+    parser.add_argument("candidate", type=Path, help="Résultats à évaluer (JSON)")
+    parser.add_argument("--tolerance", type=float, default=0.05, help="Baisse de débit tolérée (0.05 = 5 %%)")
+    parser.add_argument("--memory-tolerance", type=float, default=0.10, help="Hausse de pic RSS tolérée (relative)")
+    parser.add_argument("--memory-floor-mb", type=float, default=5.0, help="Hausse de pic RSS toujours tolérée (MB)")
+    parser.add_argument("--confidence", type=float, default=0.95)
+    parser.add_argument("--resamples", type=int, default=10_000)
+    parser.add_argument("--stages", nargs="+", default=None, help="Étapes à comparer (défaut : toutes)")
+    parser.add_argument("--json", dest="json_path", type=Path, default=None, help="Rapport JSON")
+    args = parser.parse_args(argv)
+
+    baseline = load_results(args.baseline)
+    candidate = load_results(args.candidate)
+
+    for suite, path in ((baseline, args.baseline), (candidate, args.candidate)):
+        short = [size for size, stages in suite["results"].items() if any(len(e["runs"]) < 3 for e in stages.values())]
+        if short:
+            print(f"Attention : {path} a moins de 3 répétitions pour {short}, intervalles peu fiables", file=sys.stderr)
+
+    comparisons = compare_suites(
+        baseline,
+        candidate,
+        tolerance=args.tolerance,
+        memory_tolerance=args.memory_tolerance,
+        memory_floor_mb=args.memory_floor_mb,
+        confidence=args.confidence,
+        n_resamples=args.resamples,
+        stages=args.stages,
+    )
+    if not comparisons:
+        print("Aucune (taille, étape) commune aux deux fichiers.", file=sys.stderr)
+        return 2
+
+    _print_report(comparisons)
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "baseline": str(args.baseline),
+                    "candidate": str(args.candidate),
+                    "tolerance": args.tolerance,
+                    "memory_tolerance": args.memory_tolerance,
+                    "comparisons": [{**asdict(c), "regression": c.regression} for c in comparisons],
+                },
+                f,
+                indent=2,
+            )
+
+    regressions = [c for c in comparisons if c.regression]
+    if regressions:
+        print(f"{len(regressions)} régression(s) détectée(s).")
+        return 1
+    print("Aucune régression.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
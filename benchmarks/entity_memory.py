@@ -0,0 +1,131 @@
+# benchmarks/entity_memory.py
+"""
+Benchmark mémoire / construction des entités « record-at-a-time ».
+
+Pour chaque entité (RawMemberRecord, MemberRecord, FeatureVector, Prediction),
+compare la version slottée du domaine à une copie sans slots (même champs,
+frozen=True, avec __dict__ par instance) :
+- octets par instance (tracemalloc, valeurs partagées entre instances)
+- temps de construction
+
+Usage :
+    python benchmarks/entity_memory.py --n 1000000
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+from dataclasses import fields, make_dataclass
+from datetime import date
+from typing import Any, Callable, Dict, List
+
+from churn_gym.domain.entities.feature_vector import FeatureVector
+from churn_gym.domain.entities.member_record import MemberRecord
+from churn_gym.domain.entities.prediction import Prediction
+from churn_gym.domain.entities.raw_member_record import RawMemberRecord
+
+
+# Valeurs d'exemple par type de champ (partagées entre instances)
+_SAMPLE_VALUES: Dict[str, Any] = {
+    "member_id": "123456",
+    "name": "Shanza",
+    "gender": "female",
+    "address": "Street 111, City 18",
+    "phone_number": "039-19243328",
+    "membership_type": "Monthly",
+    "favorite_exercise": "Squats",
+    "join_date": date(2023, 12, 4),
+    "last_visit_date": date(2024, 2, 14),
+    "visit_recency_bucket": "stale",
+    "tenure_bucket": "short",
+    "churn_label": 1,
+    "risk_level": "high",
+    "churn": 0,
+}
+_DEFAULT_FLOAT = 42.5
+
+
+def _sample_kwargs(cls: type) -> Dict[str, Any]:
+    return {f.name: _SAMPLE_VALUES.get(f.name, _DEFAULT_FLOAT) for f in fields(cls)}
+
+
+def _unslotted_twin(cls: type) -> type:
+    """Même dataclass (frozen) mais avec un __dict__ par instance."""
+    return make_dataclass(
+        f"{cls.__name__}Dict",
+        [(f.name, f.type) for f in fields(cls)],
+        frozen=True,
+    )
+
+
+def _measure(factory: Callable[[], Any], n: int) -> Dict[str, float]:
+    # 1. Temps de construction (sans tracemalloc, qui fausse le chrono)
+    gc.collect()
+    start = time.perf_counter()
+    instances: List[Any] = [factory() for _ in range(n)]
+    elapsed = time.perf_counter() - start
+    del instances
+
+    # 2. Mémoire
+    gc.collect()
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    instances = [factory() for _ in range(n)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # On retire le coût de la liste elle-même (un pointeur par élément)
+    list_overhead = instances.__sizeof__()
+    bytes_per_record = (current - baseline - list_overhead) / n
+
+    del instances
+    gc.collect()
+
+    return {
+        "bytes_per_record": round(bytes_per_record, 1),
+        "construction_s": round(elapsed, 4),
+        "ns_per_record": round(elapsed / n * 1e9, 1),
+    }
+
+
+def run(n: int) -> Dict[str, Dict[str, Dict[str, float]]]:
+    results: Dict[str, Dict[str, Dict[str, float]]] = {}
+
+    for cls in (RawMemberRecord, MemberRecord, FeatureVector, Prediction):
+        kwargs = _sample_kwargs(cls)
+        twin = _unslotted_twin(cls)
+
+        results[cls.__name__] = {
+            "dict": _measure(lambda: twin(**kwargs), n),
+            "slots": _measure(lambda: cls(**kwargs), n),
+        }
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--n", type=int, default=1_000_000, help="Nombre d'instances par entité")
+    parser.add_argument("--json", dest="json_path", default=None, help="Fichier de sortie JSON")
+    args = parser.parse_args()
+
+    results = run(args.n)
+
+    print(f"{'entity':<18}{'variant':<8}{'bytes/rec':>12}{'ns/rec':>10}")
+    for entity, variants in results.items():
+        for variant, metrics in variants.items():
+            print(
+                f"{entity:<18}{variant:<8}"
+                f"{metrics['bytes_per_record']:>12}{metrics['ns_per_record']:>10}"
+            )
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump({"n": args.n, "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+# benchmarks/parquet_loading.py
+"""
+Benchmark chargement CSV (PandasCSVLoader) vs Parquet (ArrowParquetLoader).
+
+Le CSV d'exemple est répliqué jusqu'à `--rows` lignes (member_id uniques),
+converti une fois en Parquet, puis chaque variante est chargée en
+RawMemberBatch dans un processus neuf :
+- temps de chargement (meilleur de `--repeat`)
+- pic de RSS du processus au-delà de la ligne de base après imports
+  (ru_maxrss)
+
+Les données sont aussi générées dans un processus à part : sous Linux,
+ru_maxrss d'un processus lancé hérite du pic de son parent.
+
+Variantes : csv, parquet (colonnes du pipeline), parquet_all_columns,
+parquet_join_date_filter (une année de Join_Date).
+
+Usage :
+    python benchmarks/parquet_loading.py --rows 1000000 --json parquet_loading.json
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+from churn_gym.infrastructure.data_sources.csv_loader_pandas import PandasCSVLoader
+from churn_gym.infrastructure.data_sources.csv_to_parquet import convert_csv_to_parquet
+from churn_gym.infrastructure.data_sources.parquet_loader_arrow import ArrowParquetLoader
+from churn_gym.infrastructure.utils.root_finder import get_repository_root
+
+
+VARIANTS = ("csv", "parquet", "parquet_all_columns", "parquet_join_date_filter")
+
+
+def _build_inputs(rows: int, workdir: Path) -> Dict[str, Path]:
+    sample = pd.read_csv(get_repository_root() / "data/gym_churn.csv", dtype=str)
+    repeats = -(-rows // len(sample))
+    frame = pd.concat([sample] * repeats, ignore_index=True).iloc[:rows]
+    frame["Member_ID"] = np.arange(1, rows + 1).astype(str)
+
+    csv_path = workdir / "members.csv"
+    parquet_path = workdir / "members.parquet"
+    frame.to_csv(csv_path, index=False)
+    convert_csv_to_parquet(csv_path, parquet_path)
+    return {"csv": csv_path, "parquet": parquet_path}
+
+
+def _loader(variant: str, inputs: Dict[str, str]):
+    if variant == "csv":
+        return PandasCSVLoader(inputs["csv"])
+    if variant == "parquet":
+        return ArrowParquetLoader(inputs["parquet"])
+    if variant == "parquet_all_columns":
+        return ArrowParquetLoader(inputs["parquet"], columns=None)
+    if variant == "parquet_join_date_filter":
+        return ArrowParquetLoader(
+            inputs["parquet"], join_date_range=(date(2023, 1, 1), date(2023, 12, 31))
+        )
+    raise ValueError(f"Variante inconnue : {variant}")
+
+
+def _worker(variant: str, inputs: Dict[str, str], repeat: int) -> Dict[str, float]:
+    # Exécuté dans un processus dédié : ru_maxrss ne mesure que cette variante.
+    # pyarrow est importé avant la ligne de base dans toutes les variantes :
+    # on mesure les données chargées, pas le coût d'import des bibliothèques.
+    import pyarrow.dataset  # noqa: F401
+
+    baseline_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        batch = _loader(variant, inputs).load_batch()
+        timings.append(time.perf_counter() - start)
+        rows = len(batch)
+        del batch
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    return {
+        "rows": rows,
+        "load_s": round(min(timings), 4),
+        "rows_per_s": round(rows / min(timings), 1),
+        "peak_rss_delta_mb": round((peak_kb - baseline_kb) / 1024, 1),
+    }
+
+
+def _subprocess_json(*args: str) -> dict:
+    output = subprocess.run(
+        [sys.executable, __file__, *args],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def run(rows: int, repeat: int) -> Dict[str, Dict[str, float]]:
+    with tempfile.TemporaryDirectory() as tmp:
+        inputs = _subprocess_json("--prepare", tmp, "--rows", str(rows))
+        sizes = {k: round(Path(v).stat().st_size / 1024**2, 1) for k, v in inputs.items()}
+
+        results = {}
+        for variant in VARIANTS:
+            results[variant] = _subprocess_json(
+                "--worker", variant, "--inputs", json.dumps(inputs), "--repeat", str(repeat)
+            )
+            results[variant]["file_mb"] = sizes["csv" if variant == "csv" else "parquet"]
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Nombre de membres")
+    parser.add_argument("--repeat", type=int, default=3, help="Chargements par variante")
+    parser.add_argument("--json", dest="json_path", default=None, help="Fichier de sortie JSON")
+    parser.add_argument("--worker", choices=VARIANTS, help=argparse.SUPPRESS)
+    parser.add_argument("--inputs", help=argparse.SUPPRESS)
+    parser.add_argument("--prepare", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.prepare:
+        inputs = _build_inputs(args.rows, Path(args.prepare))
+        print(json.dumps({k: str(v) for k, v in inputs.items()}))
+        return
+
+    if args.worker:
+        print(json.dumps(_worker(args.worker, json.loads(args.inputs), args.repeat)))
+        return
+
+    results = run(args.rows, args.repeat)
+
+    print(f"{'variant':<26}{'rows':>10}{'file MB':>10}{'load s':>10}{'RSS MB':>10}")
+    for variant, metrics in results.items():
+        print(
+            f"{variant:<26}{metrics['rows']:>10}{metrics['file_mb']:>10}"
+            f"{metrics['load_s']:>10}{metrics['peak_rss_delta_mb']:>10}"
+        )
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump({"rows": args.rows, "repeat": args.repeat, "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,311 @@
+# benchmarks/pipeline_stages.py
+"""
+Suite de benchmarks par étape du pipeline, sur données synthétiques.
+
+Pour chaque taille (10k / 1m / 10m ou un entier) :
+- les données sont générées une fois (synthetic_data.py) et gardées dans
+  `--data-dir` pour les runs suivants
+- chaque répétition tourne dans un processus neuf et exécute
+  load -> preprocess -> features -> train -> predict via les use cases,
+  mesurés par ResourceStageProfiler (temps mur, CPU, hausse du pic RSS,
+  lignes/s)
+- train utilise au plus `--train-rows` lignes ; predict score tout le lot
+  avec le modèle qui vient d'être entraîné
+
+Les résultats (toutes les répétitions, pas seulement la médiane) sont
+écrits en JSON pour comparaison entre deux runs (benchmarks/compare.py).
+
+Usage :
+    python benchmarks/pipeline_stages.py --sizes 10k 1m --repeat 5 \\
+        --output artifacts/benchmarks/results/baseline.json
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timezone
+from pathlib import Path
+from statistics import median
+from typing import Any, Dict, List
+
+import numpy as np
+from catboost import CatBoostClassifier, Pool
+
+from churn_gym.application.use_cases.build_features import BuildFeaturesUseCase
+from churn_gym.application.use_cases.load_dataset import LoadDatasetUseCase
+from churn_gym.application.use_cases.predict import PredictUseCase
+from churn_gym.application.use_cases.preprocess_dataset import PreprocessDatasetUseCase
+from churn_gym.domain.services.threshold_service import ThresholdConfig, ThresholdService
+from churn_gym.infrastructure.data_sources.csv_loader_pandas import PandasCSVLoader
+from churn_gym.infrastructure.ml.features.feature_frame import to_feature_frame
+from churn_gym.infrastructure.ml.features.features_selection import (
+    CATEGORICAL_FEATURES,
+    FEATURES_ALL,
+)
+from churn_gym.infrastructure.ml.features.vectorized_feature_engineering import (
+    VectorizedFeatureEngineeringPipeline,
+)
+from churn_gym.infrastructure.ml.predict.catboost_predictor import CatBoostPredictor
+from churn_gym.infrastructure.ml.preprocessing.vectorized_preprocessing_pipeline import (
+    VectorizedPreprocessingPipeline,
+)
+from churn_gym.infrastructure.profiling.stage_profiler import ResourceStageProfiler
+from churn_gym.infrastructure.utils.root_finder import get_repository_root
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from synthetic_data import SyntheticMemberGenerator, parse_size  # noqa: E402
+
+
+RESULTS_SCHEMA_VERSION = 1
+
+STAGES = ("load", "preprocess", "features", "train", "predict")
+
+# ru_maxrss est en Ko sous Linux, en octets sous macOS
+_MAXRSS_TO_MB = 1 / 1024**2 if sys.platform == "darwin" else 1 / 1024
+
+
+# ======================================================================
+# Données
+# ======================================================================
+def dataset_path(data_dir: Path, rows: int, seed: int, data_format: str) -> Path:
+    return data_dir / f"members_{rows}_seed{seed}.{data_format}"
+
+
+def ensure_dataset(data_dir: Path, rows: int, seed: int, data_format: str) -> Path:
+    csv_path = dataset_path(data_dir, rows, seed, "csv")
+    if not csv_path.exists():
+        SyntheticMemberGenerator(seed=seed).write_csv(csv_path, rows)
+
+    if data_format == "csv":
+        return csv_path
+
+    from churn_gym.infrastructure.data_sources.csv_to_parquet import convert_csv_to_parquet
+
+    parquet_path = dataset_path(data_dir, rows, seed, "parquet")
+    if not parquet_path.exists():
+        convert_csv_to_parquet(csv_path, parquet_path, sort_by_join_date=False)
+    return parquet_path
+
+
+def _repository(path: Path):
+    if path.suffix == ".parquet":
+        from churn_gym.infrastructure.data_sources.parquet_loader_arrow import ArrowParquetLoader
+
+        return ArrowParquetLoader(str(path))
+    return PandasCSVLoader(str(path))
+
+
+# ======================================================================
+# Une répétition (processus dédié)
+# ======================================================================
+def run_pipeline_once(
+    path: Path,
+    reference_date: date,
+    train_rows: int,
+    iterations: int,
+    thread_count: int,
+) -> Dict[str, Dict[str, Any]]:
+    baseline_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    profiler = ResourceStageProfiler()
+
+    raw = LoadDatasetUseCase(_repository(path), profiler).execute_batch()
+    members = PreprocessDatasetUseCase(VectorizedPreprocessingPipeline(), profiler).execute_batch(raw)
+    del raw
+    features = BuildFeaturesUseCase(VectorizedFeatureEngineeringPipeline(), profiler).execute_batch(
+        members, reference_date
+    )
+    del members
+
+    with tempfile.TemporaryDirectory() as tmp:
+        model_path = Path(tmp) / "model.cbm"
+
+        with profiler.stage("train") as stage:
+            train_batch = features.take(np.arange(min(train_rows, len(features))))
+            model = CatBoostClassifier(
+                iterations=iterations,
+                thread_count=thread_count,
+                random_seed=42,
+                allow_writing_files=False,
+                verbose=False,
+            )
+            model.fit(
+                Pool(
+                    to_feature_frame(train_batch, FEATURES_ALL),
+                    label=train_batch.churn,
+                    cat_features=CATEGORICAL_FEATURES,
+                )
+            )
+            model.save_model(model_path)
+            stage.rows = len(train_batch)
+
+        PredictUseCase(
+            CatBoostPredictor(model_path, thread_count=thread_count),
+            ThresholdService(ThresholdConfig()),
+            profiler,
+        ).execute_batch(features)
+
+    runs = {timing.stage: timing.as_dict() for timing in profiler.timings}
+    runs["total"] = {
+        "rows": len(features),
+        "wall_s": sum(t.wall_s for t in profiler.timings),
+        "cpu_s": sum(t.cpu_s for t in profiler.timings),
+        "peak_rss_delta_mb": (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - baseline_kb) * _MAXRSS_TO_MB,
+    }
+    runs["total"]["rows_per_s"] = runs["total"]["rows"] / runs["total"]["wall_s"]
+    return runs
+
+
+# ======================================================================
+# Orchestration
+# ======================================================================
+def _subprocess_json(*args: str) -> Any:
+    # Un processus par mesure : sous Linux, ru_maxrss d'un processus lancé
+    # hérite du pic de son parent, l'orchestrateur reste donc léger
+    output = subprocess.run(
+        [sys.executable, __file__, *args],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def _metadata() -> Dict[str, Any]:
+    import catboost
+    import pandas
+
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=get_repository_root(),
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "git_commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "numpy": np.__version__,
+        "pandas": pandas.__version__,
+        "catboost": catboost.__version__,
+    }
+
+
+def run_suite(args: argparse.Namespace) -> Dict[str, Any]:
+    results: Dict[str, Dict[str, Any]] = {}
+
+    for size in args.sizes:
+        rows = parse_size(size)
+        path = Path(
+            _subprocess_json(
+                "--prepare", str(args.data_dir), "--rows", str(rows),
+                "--seed", str(args.seed), "--format", args.format,
+            )
+        )
+
+        repeats: List[Dict[str, Dict[str, Any]]] = []
+        for i in range(args.repeat):
+            repeats.append(
+                _subprocess_json(
+                    "--worker", str(path),
+                    "--reference-date", args.reference_date.isoformat(),
+                    "--train-rows", str(args.train_rows),
+                    "--iterations", str(args.iterations),
+                    "--thread-count", str(args.thread_count),
+                )
+            )
+            print(f"[{size}] répétition {i + 1}/{args.repeat} : {repeats[-1]['total']['wall_s']:.2f}s", file=sys.stderr)
+
+        results[size] = {
+            stage: {
+                "rows": repeats[0][stage]["rows"],
+                "runs": [run[stage] for run in repeats],
+            }
+            for stage in (*STAGES, "total")
+        }
+
+    return {
+        "schema_version": RESULTS_SCHEMA_VERSION,
+        "meta": _metadata(),
+        "config": {
+            "sizes": list(args.sizes),
+            "repeat": args.repeat,
+            "format": args.format,
+            "seed": args.seed,
+            "reference_date": args.reference_date.isoformat(),
+            "train_rows": args.train_rows,
+            "iterations": args.iterations,
+            "thread_count": args.thread_count,
+        },
+        "results": results,
+    }
+
+
+def main() -> None:
+    root = get_repository_root()
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", nargs="+", default=["10k"], help="Tailles : 10k, 1m, 10m ou entiers")
+    parser.add_argument("--repeat", type=int, default=5, help="Répétitions par taille")
+    parser.add_argument("--format", choices=("csv", "parquet"), default="csv")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--reference-date", type=date.fromisoformat, default=date(2025, 12, 31))
+    parser.add_argument("--train-rows", type=int, default=1_000_000, help="Lignes max pour l'entraînement")
+    parser.add_argument("--iterations", type=int, default=200, help="Itérations CatBoost")
+    parser.add_argument("--thread-count", type=int, default=-1)
+    parser.add_argument("--data-dir", type=Path, default=root / "artifacts/benchmarks/data")
+    parser.add_argument("--output", type=Path, default=None, help="Fichier JSON de résultats")
+    parser.add_argument("--rows", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--prepare", type=Path, help=argparse.SUPPRESS)
+    parser.add_argument("--worker", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.prepare:
+        print(json.dumps(str(ensure_dataset(args.prepare, args.rows, args.seed, args.format))))
+        return
+
+    if args.worker:
+        runs = run_pipeline_once(
+            args.worker, args.reference_date, args.train_rows, args.iterations, args.thread_count
+        )
+        print(json.dumps(runs))
+        return
+
+    suite = run_suite(args)
+
+    output = args.output or (
+        root / "artifacts/benchmarks/results"
+        / f"pipeline_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(suite, f, indent=2)
+
+    print(f"{'size':<8}{'stage':<12}{'rows':>10}{'median s':>12}{'rows/s':>14}{'RSS MB':>10}")
+    for size, stages in suite["results"].items():
+        for stage, entry in stages.items():
+            runs = entry["runs"]
+            print(
+                f"{size:<8}{stage:<12}{entry['rows']:>10}"
+                f"{median(r['wall_s'] for r in runs):>12.3f}"
+                f"{median(r['rows_per_s'] for r in runs):>14.0f}"
+                f"{median(r['peak_rss_delta_mb'] for r in runs):>10.1f}"
+            )
+    print(f"Résultats : {output}")
+
+
+if __name__ == "__main__":
+    main()
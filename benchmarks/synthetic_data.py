@@ -0,0 +1,148 @@
+# benchmarks/synthetic_data.py
+"""
+Générateur de membres synthétiques au schéma de data/gym_churn.csv.
+
+Chaque ligne part d'une ligne de l'échantillon tirée au hasard (bootstrap),
+ce qui conserve les fréquences des catégories, les taux de valeurs
+manquantes et les liens entre colonnes (dont le churn), puis :
+- numériques : bruit gaussien (5 % de l'écart-type), arrondi à la
+  précision d'origine, borné au [min, max] observé
+- dates : Join_Date et Last_Visit_Date décalées du même nombre de jours
+  (± 90), l'ancienneté du membre est conservée
+- Member_ID séquentiel, Name / Address / Phone_Number régénérés
+
+La génération se fait par morceaux : la mémoire ne dépend pas de `rows`.
+
+Usage :
+    python benchmarks/synthetic_data.py --rows 1000000 --output artifacts/benchmarks/data/members_1m.csv
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+import numpy as np
+import pandas as pd
+
+from churn_gym.infrastructure.data_sources.csv_loader_pandas import (
+    DATE_COLUMNS,
+    DATE_FORMAT,
+    NUMERIC_COLUMNS,
+)
+from churn_gym.infrastructure.utils.root_finder import get_repository_root
+
+
+# Tailles nommées utilisées par la suite de benchmarks
+SIZES: Dict[str, int] = {"10k": 10_000, "1m": 1_000_000, "10m": 10_000_000}
+
+DEFAULT_CHUNK_SIZE = 500_000
+MAX_DATE_SHIFT_DAYS = 90
+NOISE_FRACTION = 0.05
+
+
+def parse_size(size: str) -> int:
+    """'10k' / '1m' / '10m' ou un entier."""
+    return SIZES[size.lower()] if size.lower() in SIZES else int(size)
+
+
+class SyntheticMemberGenerator:
+
+    def __init__(self, sample_path: Optional[Path] = None, seed: int = 42):
+        if sample_path is None:
+            sample_path = get_repository_root() / "data/gym_churn.csv"
+
+        # Tout en texte : les valeurs recopiées sont identiques à la source
+        self.sample = pd.read_csv(sample_path, dtype=str, keep_default_na=False, na_values=[""])
+        self.seed = seed
+
+        self._numeric: Dict[str, np.ndarray] = {
+            col: pd.to_numeric(self.sample[col]).to_numpy(dtype=np.float64)
+            for col in NUMERIC_COLUMNS
+        }
+        self._numeric_decimals = {
+            col: int(self.sample[col].dropna().str.contains(r"\.\d*[1-9]").any())
+            for col in NUMERIC_COLUMNS
+        }
+        self._dates: Dict[str, np.ndarray] = {
+            col: pd.to_datetime(self.sample[col], format=DATE_FORMAT).to_numpy(dtype="datetime64[D]")
+            for col in DATE_COLUMNS
+        }
+
+    def iter_chunks(self, rows: int, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+        # Une graine par morceau (seed, indice) : reproductible à seed et
+        # chunk_size fixés, sans état partagé entre morceaux
+        for chunk_index, start in enumerate(range(0, rows, chunk_size)):
+            rng = np.random.default_rng([self.seed, chunk_index])
+            yield self._chunk(start, min(chunk_size, rows - start), rng)
+
+    def _chunk(self, start: int, n: int, rng: np.random.Generator) -> pd.DataFrame:
+        template = rng.integers(0, len(self.sample), size=n)
+        frame = self.sample.iloc[template].reset_index(drop=True)
+
+        member_id = np.arange(start + 1, start + n + 1)
+        frame["Member_ID"] = member_id.astype(str)
+        has_name = frame["Name"].notna()
+        frame.loc[has_name, "Name"] = "Member " + frame.loc[has_name, "Member_ID"]
+        frame["Address"] = (
+            "Street " + pd.Series(rng.integers(1, 200, n)).astype(str)
+            + ", City " + pd.Series(rng.integers(1, 50, n)).astype(str)
+        )
+        frame["Phone_Number"] = [
+            f"03{a}-{b:08d}" for a, b in zip(rng.integers(0, 10, n), rng.integers(0, 10**8, n))
+        ]
+
+        for col, values in self._numeric.items():
+            source = values[template]
+            noisy = source + rng.normal(0.0, NOISE_FRACTION * np.nanstd(values), n)
+            noisy = np.clip(np.round(noisy, self._numeric_decimals[col]), np.nanmin(values), np.nanmax(values))
+            frame[col] = _format_numeric(noisy, self._numeric_decimals[col])
+
+        shift = rng.integers(-MAX_DATE_SHIFT_DAYS, MAX_DATE_SHIFT_DAYS + 1, n).astype("timedelta64[D]")
+        for col, values in self._dates.items():
+            shifted = values[template] + shift
+            formatted = np.datetime_as_string(shifted, unit="D").astype(object)  # AAAA-MM-JJ
+            formatted[np.isnat(shifted)] = None
+            frame[col] = formatted
+
+        return frame[self.sample.columns]
+
+    def write_csv(self, path: Path, rows: int, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.tmp")
+
+        for i, chunk in enumerate(self.iter_chunks(rows, chunk_size)):
+            chunk.to_csv(tmp_path, mode="w" if i == 0 else "a", header=i == 0, index=False)
+        tmp_path.replace(path)
+        return path
+
+
+def _format_numeric(values: np.ndarray, decimals: int) -> np.ndarray:
+    # Entiers écrits sans ".0" (comme Avg_Workout_Duration_Min dans le CSV), NaN -> vide
+    formatted = np.full(len(values), None, dtype=object)
+    present = ~np.isnan(values)
+    if decimals == 0:
+        formatted[present] = values[present].astype(np.int64).astype(str)
+    else:
+        formatted[present] = np.char.mod(f"%.{decimals}f", values[present])
+    return formatted
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", default="10k", help="Nombre de membres (10k, 1m, 10m ou entier)")
+    parser.add_argument("--output", required=True, type=Path, help="Fichier CSV de sortie")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    args = parser.parse_args()
+
+    rows = parse_size(args.rows)
+    start = time.perf_counter()
+    SyntheticMemberGenerator(seed=args.seed).write_csv(args.output, rows, args.chunk_size)
+    print(f"{rows} membres écrits dans {args.output} en {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,53 @@
 # src/churn_gym/application/use_cases/build_features.py
-from typing import Iterable,  List
-from churn_gym.domain.interfaces.feature_engineering_pipeline import FeatureEngineeringPipeline
+from datetime import date
+from typing import Iterable, Iterator, List, Optional
+from churn_gym.domain.interfaces.feature_engineering_pipeline import (
+    FeatureEngineeringPipeline,
+    resolve_reference_date,
+)
+from churn_gym.domain.interfaces.stage_profiler import NullStageProfiler, StageProfiler, profiled
 from churn_gym.domain.entities.member_record import MemberRecord
+from churn_gym.domain.entities.member_batch import MemberBatch
 from churn_gym.domain.entities.feature_vector import FeatureVector
+from churn_gym.domain.entities.feature_batch import FeatureBatch
 
 
 class BuildFeaturesUseCase:
 
-    def __init__(self, pipeline: FeatureEngineeringPipeline):
+    def __init__(
+        self,
+        pipeline: FeatureEngineeringPipeline,
+        profiler: Optional[StageProfiler] = None,
+    ):
         self.pipeline = pipeline
+        self.profiler = profiler or NullStageProfiler()
 
+    @profiled("features")
     def execute(
         self,
         records: Iterable[MemberRecord],
+        reference_date: Optional[date] = None,
     ) -> List[FeatureVector]:
-        return self.pipeline.run(records)
+        return self.pipeline.run(records, reference_date)
+
+    @profiled("features")
+    def execute_batch(
+        self,
+        batch: MemberBatch,
+        reference_date: Optional[date] = None,
+    ) -> FeatureBatch:
+        return self.pipeline.run_batch(batch, reference_date)
+
+    def execute_stream(
+        self,
+        batches: Iterable[MemberBatch],
+        reference_date: Optional[date] = None,
+    ) -> Iterator[FeatureBatch]:
+        """
+        Feature engineering lot par lot (générateur paresseux).
+
+        La date de référence est fixée une fois pour tout le flux.
+        """
+        reference_date = resolve_reference_date(reference_date)
+        for batch in batches:
+            yield self.execute_batch(batch, reference_date)
@@ -1,11 +1,27 @@
 # src/churn_gym/application/use_cases/load_dataset.py
-from churn_gym.domain.interfaces.dataset_repository import DatasetRepository
+from typing import Iterator, Optional
+from churn_gym.domain.entities.raw_member_batch import RawMemberBatch
+from churn_gym.domain.interfaces.dataset_repository import DEFAULT_BATCH_SIZE, DatasetRepository
+from churn_gym.domain.interfaces.stage_profiler import NullStageProfiler, StageProfiler, profiled
 
 
 class LoadDatasetUseCase:
 
-    def __init__(self, repository: DatasetRepository):
+    def __init__(self, repository: DatasetRepository, profiler: Optional[StageProfiler] = None):
         self.repository = repository
+        self.profiler = profiler or NullStageProfiler()
 
+    @profiled("load")
     def execute(self):
         return self.repository.load_raw()
+
+    @profiled("load")
+    def execute_batch(self) -> RawMemberBatch:
+        return self.repository.load_batch()
+
+    def stream(self, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[RawMemberBatch]:
+        """
+        Lecture par lots : la mémoire est bornée par batch_size,
+        pas par la taille du dataset.
+        """
+        return self.repository.iter_batches(batch_size)
@@ -1,29 +1,56 @@
 # src/churn_gym/application/use_cases/predict.py
-from typing import List
+from typing import List, Optional, Union
+
+import numpy as np
+
 from churn_gym.domain.entities.feature_vector import FeatureVector
+from churn_gym.domain.entities.feature_batch import FeatureBatch
 from churn_gym.domain.entities.prediction import Prediction
+from churn_gym.domain.entities.prediction_batch import PredictionBatch
 from churn_gym.domain.interfaces.model_predictor import ModelPredictor
+from churn_gym.domain.interfaces.stage_profiler import NullStageProfiler, StageProfiler, profiled
 from churn_gym.domain.services.threshold_service import ThresholdService
 
 
 class PredictUseCase:
 
-    def __init__(self, predictor: ModelPredictor, threshold_service: ThresholdService):
+    def __init__(
+        self,
+        predictor: ModelPredictor,
+        threshold_service: ThresholdService,
+        profiler: Optional[StageProfiler] = None,
+    ):
         self.predictor = predictor
         self.threshold_service = threshold_service
+        self.profiler = profiler or NullStageProfiler()
+
+    def execute(self, features: Union[FeatureBatch, List[FeatureVector]]) -> List[Prediction]:
+        return self.execute_batch(features).to_predictions()
+
+    @profiled("predict")
+    def execute_batch(
+        self, features: Union[FeatureBatch, List[FeatureVector]]
+    ) -> PredictionBatch:
+        """
+        Scoring de masse : probabilités et décisions calculées en un passage
+        sur des tableaux, résultat en colonnes.
+        """
+        if not isinstance(features, FeatureBatch):
+            features = FeatureBatch.from_vectors(features)
+
+        return self.decide(features, self.predictor.score_batch(features))
+
+    def decide(self, features: FeatureBatch, probs: np.ndarray) -> PredictionBatch:
+        """
+        Décisions métier pour des probabilités déjà calculées
+        (ex: scorées par un coalesceur de requêtes).
+        """
+        labels, risks = self.threshold_service.to_decisions(probs)
 
-    def execute(self, features: List[FeatureVector]) -> List[Prediction]:
-        probs = self.predictor.score(features)
-
-        preds: List[Prediction] = []
-        for p in probs:
-            label, risk, threshold_used = self.threshold_service.to_decision(p)
-            preds.append(
-                Prediction(
-                    churn_probability=p,
-                    churn_label=label,
-                    risk_level=risk,
-                    threshold_used=threshold_used,
-                )
-            )
-        return preds
+        return PredictionBatch(
+            member_id=features.member_id,
+            churn_probability=probs,
+            churn_label=labels,
+            risk_level=risks,
+            threshold_used=self.threshold_service.config.threshold,
+        )
@@ -1,15 +1,33 @@
 # src/churn_gym/application/use_cases/preprocess_dataset.py
 from churn_gym.domain.interfaces.preprocessing_pipeline import PreprocessingPipeline
 from churn_gym.domain.entities.raw_member_record import RawMemberRecord
-from typing import Iterable
+from churn_gym.domain.entities.raw_member_batch import RawMemberBatch
+from churn_gym.domain.entities.member_batch import MemberBatch
+from churn_gym.domain.interfaces.stage_profiler import NullStageProfiler, StageProfiler, profiled
+from typing import Iterable, Iterator, Optional
 
 
 class PreprocessDatasetUseCase:
 
-    def __init__(self, pipeline: PreprocessingPipeline):
+    def __init__(self, pipeline: PreprocessingPipeline, profiler: Optional[StageProfiler] = None):
         self.pipeline = pipeline
+        self.profiler = profiler or NullStageProfiler()
 
+    @profiled("preprocess")
     def execute(
         self, raw_records: Iterable[RawMemberRecord]
     ):
         return self.pipeline.run(raw_records)
+
+    @profiled("preprocess")
+    def execute_batch(self, batch: RawMemberBatch) -> MemberBatch:
+        return self.pipeline.run_batch(batch)
+
+    def execute_stream(
+        self, batches: Iterable[RawMemberBatch]
+    ) -> Iterator[MemberBatch]:
+        """
+        Préprocessing lot par lot (générateur paresseux).
+        """
+        for batch in batches:
+            yield self.execute_batch(batch)
@@ -1,12 +1,16 @@
 # src/churn_gym/application/use_cases/train_model.py
 from churn_gym.domain.interfaces.model_trainer import ModelTrainer
 from churn_gym.domain.entities.feature_vector import FeatureVector
-from typing import List
+from churn_gym.domain.entities.feature_batch import FeatureBatch
+from churn_gym.domain.interfaces.stage_profiler import NullStageProfiler, StageProfiler, profiled
+from typing import List, Optional, Union
 
 class TrainModelUseCase:
 
-    def __init__(self, trainer: ModelTrainer):
+    def __init__(self, trainer: ModelTrainer, profiler: Optional[StageProfiler] = None):
         self.trainer = trainer
+        self.profiler = profiler or NullStageProfiler()
 
-    def execute(self, features: List[FeatureVector]):
+    @profiled("train", rows="input")
+    def execute(self, features: Union[FeatureBatch, List[FeatureVector]]):
         return self.trainer.train(features)
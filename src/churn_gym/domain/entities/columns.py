@@ -0,0 +1,32 @@
+# src/churn_gym/domain/entities/columns.py
+"""
+Helpers de construction des colonnes NumPy utilisées par les entités
+« batch » (RawMemberBatch, MemberBatch, ...).
+"""
+from typing import Iterable
+
+import numpy as np
+
+
+def object_column(values: Iterable) -> np.ndarray:
+    """Colonne dtype object (textes, None si manquant)."""
+    values = list(values)
+    column = np.empty(len(values), dtype=object)
+    column[:] = values
+    return column
+
+
+def float_column(values: Iterable) -> np.ndarray:
+    """Colonne float64 (None -> NaN)."""
+    return np.array(
+        [np.nan if v is None else v for v in values],
+        dtype=np.float64,
+    )
+
+
+def date_column(values: Iterable) -> np.ndarray:
+    """Colonne datetime64[D] (None -> NaT)."""
+    return np.array(
+        [np.datetime64("NaT") if v is None else v for v in values],
+        dtype="datetime64[D]",
+    )
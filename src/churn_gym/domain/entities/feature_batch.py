@@ -0,0 +1,158 @@
+# src/churn_gym/domain/entities/feature_batch.py
+from dataclasses import dataclass, fields
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence
+
+import numpy as np
+
+from churn_gym.domain.entities.columns import float_column, object_column
+from churn_gym.domain.entities.feature_vector import FeatureVector
+
+
+# Répartition des champs de FeatureVector (hors identifiant et target)
+_CATEGORICAL_FIELDS = tuple(
+    f.name for f in fields(FeatureVector) if f.type == Optional[str]
+)
+_NUMERICAL_FIELDS = tuple(
+    f.name
+    for f in fields(FeatureVector)
+    if f.name not in ("member_id", "churn") and f.name not in _CATEGORICAL_FIELDS
+)
+
+# Features dont l'absence est représentée par None dans FeatureVector
+_OPTIONAL_NUMERICAL = ("tenure_days", "days_since_last_visit")
+
+
+@dataclass(frozen=True)
+class CategoricalColumn:
+    """
+    Colonne catégorielle encodée par dictionnaire :
+    categories[codes[i]] est la valeur de la ligne i.
+    """
+
+    codes: np.ndarray       # int32
+    categories: np.ndarray  # object (str), valeurs distinctes
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def decode(self) -> np.ndarray:
+        return self.categories[self.codes]
+
+    def take(self, indices: np.ndarray) -> "CategoricalColumn":
+        return CategoricalColumn(codes=self.codes[indices], categories=self.categories)
+
+    @classmethod
+    def concat(cls, columns: Sequence["CategoricalColumn"]) -> "CategoricalColumn":
+        """
+        Concatène des colonnes aux dictionnaires éventuellement différents :
+        les catégories sont fusionnées et les codes réindexés.
+        """
+        merged: Dict[str, int] = {}
+        remapped = []
+        for column in columns:
+            lookup = np.array(
+                [merged.setdefault(c, len(merged)) for c in column.categories.tolist()],
+                dtype=np.int32,
+            )
+            remapped.append(lookup[column.codes] if len(lookup) else column.codes)
+
+        categories = np.empty(len(merged), dtype=object)
+        categories[:] = list(merged)
+        codes = np.concatenate(remapped) if remapped else np.empty(0, dtype=np.int32)
+        return cls(codes=codes.astype(np.int32), categories=categories)
+
+    @classmethod
+    def encode(cls, values: Iterable) -> "CategoricalColumn":
+        values = np.asarray(values if isinstance(values, np.ndarray) else list(values))
+        categories, codes = np.unique(values.astype(str), return_inverse=True)
+        return cls(codes=codes.astype(np.int32), categories=categories.astype(object))
+
+
+@dataclass(frozen=True)
+class FeatureBatch:
+    """
+    Lot de features stocké en colonnes :
+    - un tableau float64 contigu par feature numérique
+    - un CategoricalColumn par feature catégorielle
+    - identifiants et target à part
+
+    Équivalent colonne par colonne d'une liste de FeatureVector,
+    sans objet Python par membre.
+    """
+
+    member_id: np.ndarray                        # object (str)
+    numerical: Mapping[str, np.ndarray]          # float64
+    categorical: Mapping[str, CategoricalColumn]
+    churn: np.ndarray                            # int64 (0 / 1)
+
+    def __len__(self) -> int:
+        return len(self.member_id)
+
+    @property
+    def feature_names(self) -> List[str]:
+        return [*self.numerical, *self.categorical]
+
+    def take(self, indices: np.ndarray) -> "FeatureBatch":
+        """
+        Sous-lot selon des indices (ou un masque booléen).
+        """
+        return FeatureBatch(
+            member_id=self.member_id[indices],
+            numerical={name: col[indices] for name, col in self.numerical.items()},
+            categorical={name: col.take(indices) for name, col in self.categorical.items()},
+            churn=self.churn[indices],
+        )
+
+    @classmethod
+    def concat(cls, batches: Sequence["FeatureBatch"]) -> "FeatureBatch":
+        """
+        Concatène plusieurs lots ayant les mêmes features.
+        """
+        first = batches[0]
+        return cls(
+            member_id=np.concatenate([b.member_id for b in batches]),
+            numerical={
+                name: np.concatenate([b.numerical[name] for b in batches])
+                for name in first.numerical
+            },
+            categorical={
+                name: CategoricalColumn.concat([b.categorical[name] for b in batches])
+                for name in first.categorical
+            },
+            churn=np.concatenate([b.churn for b in batches]),
+        )
+
+    # ------------------------------------------------------------------
+    # Vue de compatibilité (un objet par membre)
+    # ------------------------------------------------------------------
+    def to_vectors(self) -> List[FeatureVector]:
+        columns: Dict[str, list] = {
+            "member_id": self.member_id.tolist(),
+            "churn": self.churn.tolist(),
+        }
+        for name, col in self.numerical.items():
+            values = col.tolist()
+            if name in _OPTIONAL_NUMERICAL:
+                values = [None if v != v else v for v in values]
+            columns[name] = values
+        for name, cat in self.categorical.items():
+            columns[name] = cat.decode().tolist()
+
+        ordered = [columns[f.name] for f in fields(FeatureVector)]
+        return [FeatureVector(*values) for values in zip(*ordered)]
+
+    @classmethod
+    def from_vectors(cls, vectors: Iterable[FeatureVector]) -> "FeatureBatch":
+        vectors = list(vectors)
+        return cls(
+            member_id=object_column(v.member_id for v in vectors),
+            numerical={
+                name: float_column(getattr(v, name) for v in vectors)
+                for name in _NUMERICAL_FIELDS
+            },
+            categorical={
+                name: CategoricalColumn.encode(object_column(getattr(v, name) for v in vectors))
+                for name in _CATEGORICAL_FIELDS
+            },
+            churn=np.array([0 if v.churn is None else v.churn for v in vectors], dtype=np.int64),
+        )
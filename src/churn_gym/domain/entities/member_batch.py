@@ -0,0 +1,96 @@
+# src/churn_gym/domain/entities/member_batch.py
+from dataclasses import dataclass, fields, replace
+from typing import Iterable, List
+
+import numpy as np
+
+from churn_gym.domain.entities.columns import date_column, float_column, object_column
+from churn_gym.domain.entities.member_record import MemberRecord
+
+
+@dataclass(frozen=True)
+class MemberBatch:
+    """
+    Représentation colonne par colonne d'un lot de MemberRecord
+    (données préprocessées).
+
+    - textes       : dtype object
+    - numériques   : float64 (NaN si manquant)
+    - dates        : datetime64[D] (NaT si manquant)
+    - churn        : float64 (1.0 / 0.0, NaN si inconnu)
+    """
+
+    member_id: np.ndarray
+    age: np.ndarray
+    gender: np.ndarray
+    membership_type: np.ndarray
+    join_date: np.ndarray
+    last_visit_date: np.ndarray
+    favorite_exercise: np.ndarray
+    avg_workout_duration_min: np.ndarray
+    avg_calories_burned: np.ndarray
+    total_weight_lifted_kg: np.ndarray
+    visits_per_month: np.ndarray
+    churn: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.member_id)
+
+    def slice(self, start: int, stop: int) -> "MemberBatch":
+        """
+        Sous-lot [start, stop) ; les colonnes sont des vues (pas de copie).
+        """
+        return replace(
+            self,
+            **{f.name: getattr(self, f.name)[start:stop] for f in fields(self)},
+        )
+
+    def take(self, indices: np.ndarray) -> "MemberBatch":
+        """
+        Sous-lot selon des indices (ou un masque booléen).
+        """
+        return replace(
+            self,
+            **{f.name: getattr(self, f.name)[indices] for f in fields(self)},
+        )
+
+    # ------------------------------------------------------------------
+    # Vue de compatibilité (un objet par membre)
+    # ------------------------------------------------------------------
+    def to_records(self) -> List[MemberRecord]:
+        """
+        Matérialise le lot en MemberRecord.
+
+        Les numériques manquants restent NaN (comme en sortie de
+        RobustPreprocessingPipeline), les dates manquantes deviennent None.
+        """
+        columns = []
+        for f in fields(self):
+            column = getattr(self, f.name)
+            if f.name == "churn":
+                columns.append([np.nan if c != c else int(c) for c in column.tolist()])
+            elif column.dtype.kind == "M":
+                columns.append(column.astype(object).tolist())
+            else:
+                columns.append(column.tolist())
+
+        # Les champs sont déclarés dans le même ordre que MemberRecord
+        return [MemberRecord(*values) for values in zip(*columns)]
+
+    @classmethod
+    def from_records(cls, records: Iterable[MemberRecord]) -> "MemberBatch":
+        records = list(records)
+        return cls(
+            member_id=object_column(r.member_id for r in records),
+            age=float_column(r.age for r in records),
+            gender=object_column(r.gender for r in records),
+            membership_type=object_column(r.membership_type for r in records),
+            join_date=date_column(r.join_date for r in records),
+            last_visit_date=date_column(r.last_visit_date for r in records),
+            favorite_exercise=object_column(r.favorite_exercise for r in records),
+            avg_workout_duration_min=float_column(r.avg_workout_duration_min for r in records),
+            avg_calories_burned=float_column(r.avg_calories_burned for r in records),
+            total_weight_lifted_kg=float_column(r.total_weight_lifted_kg for r in records),
+            visits_per_month=float_column(r.visits_per_month for r in records),
+            churn=float_column(r.churn for r in records),
+        )
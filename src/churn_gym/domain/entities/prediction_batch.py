@@ -0,0 +1,39 @@
+# src/churn_gym/domain/entities/prediction_batch.py
+from dataclasses import dataclass
+from typing import List
+
+import numpy as np
+
+from churn_gym.domain.entities.prediction import Prediction
+
+
+@dataclass(frozen=True)
+class PredictionBatch:
+    """
+    Prédictions d'un lot de membres, stockées en colonnes
+    (pour le scoring de masse, sans un objet Prediction par membre).
+    """
+
+    member_id: np.ndarray           # object (str)
+    churn_probability: np.ndarray   # float64
+    churn_label: np.ndarray         # int64 (0 / 1)
+    risk_level: np.ndarray          # object (low / medium / high)
+    threshold_used: float
+
+    def __len__(self) -> int:
+        return len(self.churn_probability)
+
+    def to_predictions(self) -> List[Prediction]:
+        return [
+            Prediction(
+                churn_probability=p,
+                churn_label=label,
+                risk_level=risk,
+                threshold_used=self.threshold_used,
+            )
+            for p, label, risk in zip(
+                self.churn_probability.tolist(),
+                self.churn_label.tolist(),
+                self.risk_level.tolist(),
+            )
+        ]
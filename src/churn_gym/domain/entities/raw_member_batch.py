@@ -0,0 +1,101 @@
+# src/churn_gym/domain/entities/raw_member_batch.py
+from dataclasses import dataclass, fields, replace
+from typing import Iterable, List
+
+import numpy as np
+
+from churn_gym.domain.entities.columns import date_column, float_column, object_column
+from churn_gym.domain.entities.raw_member_record import RawMemberRecord
+
+
+@dataclass(frozen=True)
+class RawMemberBatch:
+    """
+    Représentation colonne par colonne d'un lot de RawMemberRecord.
+
+    Chaque champ est un tableau NumPy de même longueur :
+    - textes       : dtype object (None si manquant)
+    - numériques   : float64 (NaN si manquant)
+    - dates        : datetime64[D] (NaT si manquant)
+    - churn        : dtype object (valeur brute, None en inference)
+
+    Permet de traiter des millions de membres sans instancier
+    un objet Python par ligne.
+    """
+
+    member_id: np.ndarray
+    name: np.ndarray
+    age: np.ndarray
+    gender: np.ndarray
+    address: np.ndarray
+    phone_number: np.ndarray
+    membership_type: np.ndarray
+    join_date: np.ndarray
+    last_visit_date: np.ndarray
+    favorite_exercise: np.ndarray
+    avg_workout_duration_min: np.ndarray
+    avg_calories_burned: np.ndarray
+    total_weight_lifted_kg: np.ndarray
+    visits_per_month: np.ndarray
+    churn: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.member_id)
+
+    def slice(self, start: int, stop: int) -> "RawMemberBatch":
+        """
+        Sous-lot [start, stop) ; les colonnes sont des vues (pas de copie).
+        """
+        return replace(
+            self,
+            **{f.name: getattr(self, f.name)[start:stop] for f in fields(self)},
+        )
+
+    # ------------------------------------------------------------------
+    # Vue de compatibilité (un objet par membre)
+    # ------------------------------------------------------------------
+    def to_records(self) -> List[RawMemberRecord]:
+        """
+        Matérialise le lot en RawMemberRecord (valeurs manquantes -> None).
+        """
+        # Les champs sont déclarés dans le même ordre que RawMemberRecord
+        columns = [_to_python(getattr(self, f.name)) for f in fields(self)]
+        return [RawMemberRecord(*values) for values in zip(*columns)]
+
+    @classmethod
+    def from_records(cls, records: Iterable[RawMemberRecord]) -> "RawMemberBatch":
+        records = list(records)
+        return cls(
+            member_id=object_column(str(r.member_id) for r in records),
+            name=object_column(r.name for r in records),
+            age=float_column(r.age for r in records),
+            gender=object_column(r.gender for r in records),
+            address=object_column(r.address for r in records),
+            phone_number=object_column(r.phone_number for r in records),
+            membership_type=object_column(r.membership_type for r in records),
+            join_date=date_column(r.join_date for r in records),
+            last_visit_date=date_column(r.last_visit_date for r in records),
+            favorite_exercise=object_column(r.favorite_exercise for r in records),
+            avg_workout_duration_min=float_column(r.avg_workout_duration_min for r in records),
+            avg_calories_burned=float_column(r.avg_calories_burned for r in records),
+            total_weight_lifted_kg=float_column(r.total_weight_lifted_kg for r in records),
+            visits_per_month=float_column(r.visits_per_month for r in records),
+            churn=object_column(r.churn for r in records),
+        )
+
+
+# ----------------------------------------------------------------------
+# Helpers de conversion
+# ----------------------------------------------------------------------
+def _to_python(column: np.ndarray) -> list:
+    """
+    Convertit une colonne en liste Python, avec None pour les manquants.
+    """
+    if column.dtype.kind == "M":
+        # datetime64[D] -> datetime.date, NaT -> None
+        return column.astype("datetime64[D]").astype(object).tolist()
+
+    if column.dtype.kind == "f":
+        return [None if v != v else v for v in column.tolist()]
+
+    return column.tolist()
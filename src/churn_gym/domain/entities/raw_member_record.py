@@ -4,7 +4,7 @@ from typing import Optional
 from datetime import date
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RawMemberRecord:
     member_id: str
     name: Optional[str]
@@ -1,7 +1,12 @@
 # src/churn_gym/domain/interfaces/dataset_repository.py
 from abc import ABC, abstractmethod
-from typing import Iterable
+from typing import Iterable, Iterator
 from churn_gym.domain.entities.raw_member_record import RawMemberRecord
+from churn_gym.domain.entities.raw_member_batch import RawMemberBatch
+
+
+# Taille de lot par défaut pour la lecture en streaming
+DEFAULT_BATCH_SIZE = 50_000
 
 
 class DatasetRepository(ABC):
@@ -9,3 +14,28 @@ class DatasetRepository(ABC):
     @abstractmethod
     def load_raw(self) -> Iterable[RawMemberRecord]:
         pass
+
+    def load_batch(self) -> RawMemberBatch:
+        """
+        Charge le dataset sous forme colonne par colonne.
+
+        Implémentation par défaut : conversion de load_raw().
+        Les adaptateurs capables de lire directement en colonnes
+        doivent surcharger cette méthode.
+        """
+        return RawMemberBatch.from_records(self.load_raw())
+
+    def iter_batches(self, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[RawMemberBatch]:
+        """
+        Parcourt le dataset par lots d'au plus `batch_size` membres.
+
+        Implémentation par défaut : découpage de load_batch() (tout le
+        dataset est chargé). Les adaptateurs capables de lire par morceaux
+        doivent surcharger cette méthode pour borner la mémoire.
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size doit être strictement positif.")
+
+        batch = self.load_batch()
+        for start in range(0, len(batch), batch_size):
+            yield batch.slice(start, start + batch_size)
@@ -1,4 +1,4 @@
-from typing import Any, Mapping, Protocol
+from typing import Any, Mapping, Protocol, Sequence
 
 
 class ExperimentTracker(Protocol):
@@ -44,7 +44,7 @@ class ExperimentTracker(Protocol):
         """
         ...
 
-    def log_metrics(self, metrics: Mapping[str, float]) -> None:
+    def log_metrics(self, metrics: Mapping[str, float], step: int | None = None) -> None:
         """
         Log des métriques numériques.
 
@@ -52,6 +52,25 @@ class ExperimentTracker(Protocol):
         ----------
         metrics : Mapping[str, float]
             Exemple : {"auc": 0.87, "f1": 0.78}
+        step : int | None
+            Étape (itération) associée aux valeurs.
+        """
+        ...
+
+    def log_metric_series(
+        self, name: str, values: Sequence[float], start_step: int = 0
+    ) -> None:
+        """
+        Log d'une série complète de valeurs pour une métrique.
+
+        Parameters
+        ----------
+        name : str
+            Nom de la métrique (ex: "Logloss").
+        values : Sequence[float]
+            Une valeur par step, à partir de `start_step`.
+        start_step : int
+            Step de la première valeur.
         """
         ...
 
@@ -66,6 +85,32 @@ class ExperimentTracker(Protocol):
         """
         ...
 
+    def log_child_run(
+        self,
+        run_name: str,
+        params: Mapping[str, Any],
+        metrics: Mapping[str, float],
+    ) -> str:
+        """
+        Enregistre une run enfant terminée sous la run active
+        (ex: un essai de recherche d'hyperparamètres).
+
+        Parameters
+        ----------
+        run_name : str
+            Nom de la run enfant.
+        params : Mapping[str, Any]
+            Paramètres de l'essai.
+        metrics : Mapping[str, float]
+            Métriques finales de l'essai.
+
+        Returns
+        -------
+        str
+            Identifiant de la run enfant.
+        """
+        ...
+
     def end_run(self) -> None:
         """
         Termine la run active.
@@ -1,13 +1,40 @@
 # src/churn_gym/domain/interfaces/feature_engineering_pipeline.py
-from typing import Iterable
+from datetime import date
+from typing import Iterable, Optional
 from abc import ABC, abstractmethod
 from churn_gym.domain.entities.member_record import MemberRecord
+from churn_gym.domain.entities.member_batch import MemberBatch
+from churn_gym.domain.entities.feature_batch import FeatureBatch
+
+
+def resolve_reference_date(reference_date: Optional[date] = None) -> date:
+    """
+    Date de référence des features temporelles (days_since_last_visit, ...) :
+    celle fournie, sinon la date du jour.
+    """
+    return reference_date if reference_date is not None else date.today()
 
 
 class FeatureEngineeringPipeline(ABC):
+    """
+    Les features dépendant du temps sont calculées par rapport à
+    `reference_date` (date du jour si None) : à date fixée, la sortie
+    est déterministe et peut être mise en cache.
+    """
 
     @abstractmethod
     def run(
-        self, records: Iterable[MemberRecord]
+        self,
+        records: Iterable[MemberRecord],
+        reference_date: Optional[date] = None,
     ) -> list[MemberRecord]:
         pass
+
+    def run_batch(self, batch: MemberBatch, reference_date: Optional[date] = None) -> FeatureBatch:
+        """
+        Feature engineering d'un lot colonne par colonne.
+
+        Implémentation par défaut : passage par run() sur la vue
+        MemberRecord du lot. Les pipelines vectorisés la surchargent.
+        """
+        return FeatureBatch.from_vectors(self.run(batch.to_records(), reference_date))
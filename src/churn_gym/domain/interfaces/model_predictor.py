@@ -1,18 +1,30 @@
 # src/churn_gym/domain/interfaces/model_predictor.py
-from typing import List
+from typing import List, Union
 from abc import ABC, abstractmethod
+
+import numpy as np
+
 from churn_gym.domain.entities.feature_vector import FeatureVector
-from churn_gym.domain.entities.prediction import Prediction
+from churn_gym.domain.entities.feature_batch import FeatureBatch
 
 
 class ModelPredictor(ABC):
 
     @abstractmethod
-    def score(self, features: List[FeatureVector]) -> List[Prediction]:
+    def score(self, features: Union[FeatureBatch, List[FeatureVector]]) -> List[float]:
         """
-        Compute churn / risk scores from domain feature vectors.
+        Compute churn probabilities from domain feature vectors.
 
         Returns:
-            List[Prediction]: probability, score, priority, decision
+            List[float]: churn probability per member
+        """
+        pass
+
+    def score_batch(self, batch: FeatureBatch) -> np.ndarray:
+        """
+        Compute churn probabilities for a columnar batch.
+
+        Default implementation goes through score(); array-based
+        predictors should override it.
         """
-        pass
\ No newline at end of file
+        return np.asarray(self.score(batch), dtype=np.float64)
@@ -1,11 +1,12 @@
 # src/churn_gym/domain/interfaces/model_trainer.py
 from abc import ABC, abstractmethod
-from typing import Any, List
+from typing import Any, List, Union
 from churn_gym.domain.entities.feature_vector import FeatureVector
+from churn_gym.domain.entities.feature_batch import FeatureBatch
 
 
 class ModelTrainer(ABC):
 
     @abstractmethod
-    def train(self, features: List[FeatureVector]) -> Any:
+    def train(self, features: Union[FeatureBatch, List[FeatureVector]]) -> Any:
         pass
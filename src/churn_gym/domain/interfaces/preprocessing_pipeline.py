@@ -2,7 +2,9 @@
 from abc import ABC, abstractmethod
 from typing import Iterable
 from churn_gym.domain.entities.raw_member_record import RawMemberRecord
+from churn_gym.domain.entities.raw_member_batch import RawMemberBatch
 from churn_gym.domain.entities.member_record import MemberRecord
+from churn_gym.domain.entities.member_batch import MemberBatch
 
 
 class PreprocessingPipeline(ABC):
@@ -12,3 +14,12 @@ class PreprocessingPipeline(ABC):
         self, raw_records: Iterable[RawMemberRecord]
     ) -> list[MemberRecord]:
         pass
+
+    def run_batch(self, batch: RawMemberBatch) -> MemberBatch:
+        """
+        Préprocessing d'un lot colonne par colonne.
+
+        Implémentation par défaut : passage par run() sur la vue
+        RawMemberRecord du lot. Les pipelines vectorisés la surchargent.
+        """
+        return MemberBatch.from_records(self.run(batch.to_records()))
@@ -0,0 +1,93 @@
+# src/churn_gym/domain/interfaces/stage_profiler.py
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from functools import wraps
+from typing import Any, Callable, ContextManager, Dict, Iterator, Optional, TypeVar
+
+
+@dataclass(frozen=True)
+class StageTiming:
+    """
+    Mesures d'une exécution d'étape (load, preprocess, features, train, predict).
+
+    peak_rss_delta_mb : hausse du pic de RSS du processus pendant l'étape
+    (0 si l'étape est restée sous le pic déjà atteint).
+    """
+
+    stage: str
+    wall_s: float
+    cpu_s: float
+    peak_rss_delta_mb: float
+    rows: Optional[int] = None
+
+    @property
+    def rows_per_s(self) -> Optional[float]:
+        if self.rows is None or self.wall_s <= 0:
+            return None
+        return self.rows / self.wall_s
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {**asdict(self), "rows_per_s": self.rows_per_s}
+
+
+@dataclass
+class StageHandle:
+    """
+    Objet renvoyé par StageProfiler.stage() : mutable pour renseigner
+    le nombre de lignes une fois connu (ex: après le chargement).
+    """
+
+    name: str
+    rows: Optional[int] = None
+
+
+class StageProfiler(ABC):
+    """
+    Instrumentation des étapes du pipeline :
+
+        with profiler.stage("features") as stage:
+            features = pipeline.run_batch(batch)
+            stage.rows = len(features)
+    """
+
+    @abstractmethod
+    def stage(self, name: str, rows: Optional[int] = None) -> ContextManager[StageHandle]:
+        pass
+
+
+class NullStageProfiler(StageProfiler):
+    """Profiler par défaut des use cases : aucune mesure."""
+
+    @contextmanager
+    def stage(self, name: str, rows: Optional[int] = None) -> Iterator[StageHandle]:
+        yield StageHandle(name, rows)
+
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def profiled(name: str, rows: str = "output") -> Callable[[F], F]:
+    """
+    Décorateur de méthode de use case : exécute la méthode dans
+    `self.profiler.stage(name)`.
+
+    rows="output" : nombre de lignes = len(résultat)
+    rows="input"  : nombre de lignes = len(premier argument)
+    """
+    if rows not in ("output", "input"):
+        raise ValueError(f"rows doit valoir 'output' ou 'input' (reçu : {rows})")
+
+    def decorator(method: F) -> F:
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with self.profiler.stage(name) as stage:
+                result = method(self, *args, **kwargs)
+                counted = result if rows == "output" else (args[0] if args else None)
+                if hasattr(counted, "__len__"):
+                    stage.rows = len(counted)
+            return result
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
@@ -2,6 +2,8 @@
 from dataclasses import dataclass
 from typing import Tuple
 
+import numpy as np
+
 @dataclass(frozen=True)
 class ThresholdConfig:
     threshold: float = 0.5
@@ -9,6 +11,10 @@ class ThresholdConfig:
     high_risk: float = 0.7      # ex: >= 0.7 (indépendant du threshold de décision)
 
 
+# Niveaux de risque, dans l'ordre des seuils (medium_risk, high_risk)
+RISK_LEVELS = np.array(["low", "medium", "high"], dtype=object)
+
+
 class ThresholdService:
     """
     Convertit une probabilité en:
@@ -33,3 +39,25 @@ class ThresholdService:
             risk = "low"
 
         return label, risk, self.config.threshold
+
+    def to_decisions(self, probabilities: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Version vectorisée de to_decision pour un tableau de probabilités.
+
+        Returns
+        -------
+        labels : np.ndarray[int64]
+            1 si p >= threshold, 0 sinon.
+        risk_levels : np.ndarray[object]
+            "low" / "medium" / "high" selon les seuils medium_risk / high_risk.
+        """
+        p = np.asarray(probabilities, dtype=np.float64)
+
+        labels = (p >= self.config.threshold).astype(np.int64)
+
+        # Mêmes comparaisons que to_decision : NaN n'atteint aucun seuil -> low
+        levels = np.where(
+            p >= self.config.high_risk, 2, np.where(p >= self.config.medium_risk, 1, 0)
+        )
+
+        return labels, RISK_LEVELS[levels]
@@ -1,55 +1,119 @@
 # src/churn_gym/infrastructure/data_sources/csv_loader_pandas.py
+import numpy as np
 import pandas as pd
-from datetime import datetime
-from typing import List
+from typing import Dict, Iterator, List
 
+from churn_gym.domain.entities.raw_member_batch import RawMemberBatch
 from churn_gym.domain.entities.raw_member_record import RawMemberRecord
-from churn_gym.domain.interfaces.dataset_repository import DatasetRepository
+from churn_gym.domain.interfaces.dataset_repository import (
+    DEFAULT_BATCH_SIZE,
+    DatasetRepository,
+)
+
+
+# Colonnes CSV -> champs RawMemberRecord
+TEXT_COLUMNS: Dict[str, str] = {
+    "Member_ID": "member_id",
+    "Name": "name",
+    "Gender": "gender",
+    "Address": "address",
+    "Phone_Number": "phone_number",
+    "Membership_Type": "membership_type",
+    "Favorite_Exercise": "favorite_exercise",
+    "Churn": "churn",
+}
+
+NUMERIC_COLUMNS: Dict[str, str] = {
+    "Age": "age",
+    "Avg_Workout_Duration_Min": "avg_workout_duration_min",
+    "Avg_Calories_Burned": "avg_calories_burned",
+    "Total_Weight_Lifted_kg": "total_weight_lifted_kg",
+    "Visits_Per_Month": "visits_per_month",
+}
+
+DATE_COLUMNS: Dict[str, str] = {
+    "Join_Date": "join_date",
+    "Last_Visit_Date": "last_visit_date",
+}
+
+DATE_FORMAT = "%Y-%m-%d"
+
+# Dtypes déclarés à la lecture (les dates sont lues en texte puis converties)
+CSV_DTYPES: Dict[str, object] = {
+    **{col: "object" for col in TEXT_COLUMNS},
+    **{col: "float64" for col in NUMERIC_COLUMNS},
+    **{col: "object" for col in DATE_COLUMNS},
+}
 
 
 class PandasCSVLoader(DatasetRepository):
     """
     Infrastructure adapter:
-    - reads CSV with pandas
-    - maps rows to RawMemberRecord
+    - reads CSV with pandas (dtypes declared up front)
+    - maps columns to a RawMemberBatch (vectorized date parsing)
+    - exposes load_raw() as a RawMemberRecord view of the batch
+    - streams fixed-size batches with read_csv(chunksize=...)
     """
 
     def __init__(self, csv_path: str):
         self.csv_path = csv_path
 
     def load_raw(self) -> List[RawMemberRecord]:
-        df = pd.read_csv(self.csv_path)
-
-        # Normalize column names (defensive)
-        df.columns = [c.strip() for c in df.columns]
-
-        records: List[RawMemberRecord] = []
-
-        for _, row in df.iterrows():
-            records.append(
-                RawMemberRecord(
-                    member_id=str(row["Member_ID"]),
-                    name=row.get("Name"),
-                    age=row.get("Age"),
-                    gender=row.get("Gender"),
-                    address=row.get("Address"),
-                    phone_number=row.get("Phone_Number"),
-                    membership_type=row.get("Membership_Type"),
-                    join_date=self._parse_date(row.get("Join_Date")),
-                    last_visit_date=self._parse_date(row.get("Last_Visit_Date")),
-                    favorite_exercise=row.get("Favorite_Exercise"),
-                    avg_workout_duration_min=row.get("Avg_Workout_Duration_Min"),
-                    avg_calories_burned=row.get("Avg_Calories_Burned"),
-                    total_weight_lifted_kg=row.get("Total_Weight_Lifted_kg"),
-                    visits_per_month=row.get("Visits_Per_Month"),
-                    churn=row.get("Churn"),
-                )
-            )
-
-        return records
-
-    @staticmethod
-    def _parse_date(value):
-        if pd.isna(value):
-            return None
-        return datetime.strptime(str(value), "%Y-%m-%d").date()
+        return self.load_batch().to_records()
+
+    def load_batch(self) -> RawMemberBatch:
+        df = pd.read_csv(self.csv_path, dtype=CSV_DTYPES)
+        return to_raw_member_batch(df)
+
+    def iter_batches(self, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[RawMemberBatch]:
+        if batch_size <= 0:
+            raise ValueError("batch_size doit être strictement positif.")
+
+        with pd.read_csv(self.csv_path, dtype=CSV_DTYPES, chunksize=batch_size) as reader:
+            for chunk in reader:
+                yield to_raw_member_batch(chunk)
+
+
+# ----------------------------------------------------------------------
+# DataFrame -> RawMemberBatch
+# ----------------------------------------------------------------------
+def to_raw_member_batch(df: pd.DataFrame) -> RawMemberBatch:
+    """
+    Convertit un DataFrame au schéma du CSV membres (colonnes Member_ID,
+    Join_Date, ...) en RawMemberBatch, colonne par colonne.
+    """
+    # Normalize column names (defensive)
+    df.columns = [c.strip() for c in df.columns]
+    n_rows = len(df)
+
+    columns: Dict[str, np.ndarray] = {}
+
+    for csv_col, field in TEXT_COLUMNS.items():
+        columns[field] = _text_column(df, csv_col, n_rows)
+
+    for csv_col, field in NUMERIC_COLUMNS.items():
+        if csv_col in df.columns:
+            columns[field] = pd.to_numeric(df[csv_col]).to_numpy(dtype=np.float64)
+        else:
+            columns[field] = np.full(n_rows, np.nan)
+
+    for csv_col, field in DATE_COLUMNS.items():
+        columns[field] = _date_column(df, csv_col, n_rows)
+
+    return RawMemberBatch(**columns)
+
+
+def _text_column(df: pd.DataFrame, column: str, n_rows: int) -> np.ndarray:
+    values = np.full(n_rows, None, dtype=object)
+    if column in df.columns:
+        series = df[column]
+        mask = series.notna().to_numpy()
+        values[mask] = series.to_numpy(dtype=object)[mask]
+    return values
+
+
+def _date_column(df: pd.DataFrame, column: str, n_rows: int) -> np.ndarray:
+    if column not in df.columns:
+        return np.full(n_rows, np.datetime64("NaT"), dtype="datetime64[D]")
+    parsed = pd.to_datetime(df[column], format=DATE_FORMAT)
+    return parsed.to_numpy(dtype="datetime64[D]")
@@ -0,0 +1,108 @@
+# src/churn_gym/infrastructure/data_sources/csv_to_parquet.py
+"""
+Conversion unique du CSV membres en Parquet, lu ensuite par ArrowParquetLoader.
+
+- types fixés à la conversion (texte, float64, date32) : plus de parsing
+  au chargement
+- lignes triées par Join_Date : les statistiques min/max de chaque row
+  group sont disjointes et un filtre par plage de dates saute les row
+  groups hors plage
+
+Usage :
+    python -m churn_gym.infrastructure.data_sources.csv_to_parquet \\
+        --input data/gym_churn.csv --output data/gym_churn.parquet
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+from typing import Optional
+
+from churn_gym.infrastructure.data_sources.csv_loader_pandas import (
+    DATE_COLUMNS,
+    NUMERIC_COLUMNS,
+    TEXT_COLUMNS,
+)
+from churn_gym.infrastructure.logging.loguru_logger import LoguruLogger
+
+
+DEFAULT_ROW_GROUP_SIZE = 100_000
+
+
+def convert_csv_to_parquet(
+    csv_path: Path,
+    parquet_path: Path,
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+    compression: str = "zstd",
+    sort_by_join_date: bool = True,
+) -> int:
+    """
+    Écrit `csv_path` en Parquet et retourne le nombre de lignes converties.
+    """
+    import pyarrow as pa
+    import pyarrow.csv as pv
+    import pyarrow.parquet as pq
+
+    logger = LoguruLogger()
+    start = time.perf_counter()
+
+    column_types = {
+        **{col: pa.string() for col in TEXT_COLUMNS},
+        **{col: pa.float64() for col in NUMERIC_COLUMNS},
+        **{col: pa.date32() for col in DATE_COLUMNS},
+    }
+    table = pv.read_csv(
+        csv_path,
+        convert_options=pv.ConvertOptions(column_types=column_types, strings_can_be_null=True),
+    )
+    table = table.rename_columns([name.strip() for name in table.column_names])
+
+    if sort_by_join_date and "Join_Date" in table.column_names:
+        table = table.sort_by([("Join_Date", "ascending")])
+
+    parquet_path = Path(parquet_path)
+    parquet_path.parent.mkdir(parents=True, exist_ok=True)
+    pq.write_table(
+        table,
+        parquet_path,
+        row_group_size=row_group_size,
+        compression=compression,
+        write_statistics=True,
+    )
+
+    logger.info(
+        "CSV converti en Parquet",
+        input=str(csv_path),
+        output=str(parquet_path),
+        rows=table.num_rows,
+        row_groups=pq.ParquetFile(parquet_path).num_row_groups,
+        seconds=round(time.perf_counter() - start, 2),
+    )
+    return table.num_rows
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Conversion du CSV membres en Parquet.")
+    parser.add_argument("--input", required=True, type=Path, help="Fichier CSV")
+    parser.add_argument("--output", required=True, type=Path, help="Fichier Parquet")
+    parser.add_argument("--row-group-size", type=int, default=DEFAULT_ROW_GROUP_SIZE)
+    parser.add_argument("--compression", default="zstd")
+    parser.add_argument(
+        "--keep-order",
+        action="store_true",
+        help="Conserver l'ordre du CSV (pas de tri par Join_Date)",
+    )
+    args = parser.parse_args(argv)
+
+    convert_csv_to_parquet(
+        csv_path=args.input,
+        parquet_path=args.output,
+        row_group_size=args.row_group_size,
+        compression=args.compression,
+        sort_by_join_date=not args.keep_order,
+    )
+
+
+if __name__ == "__main__":
+    main()
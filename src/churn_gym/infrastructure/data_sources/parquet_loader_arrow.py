@@ -0,0 +1,191 @@
+# src/churn_gym/infrastructure/data_sources/parquet_loader_arrow.py
+"""
+Lecture du dataset membres depuis Parquet (pyarrow, dépendance optionnelle).
+
+Par rapport à PandasCSVLoader :
+- projection : seules les colonnes utiles au pipeline sont décodées
+  (Name, Address, Phone_Number ne sont jamais lues)
+- filtrage par plage de Join_Date poussé au scan : les row groups dont
+  les statistiques min/max sont hors plage ne sont pas lus
+- fichier mappé en mémoire, types (dates, float64) stockés dans le fichier :
+  aucun parsing de texte
+
+Le fichier est produit par csv_to_parquet.convert_csv_to_parquet.
+"""
+from __future__ import annotations
+
+from datetime import date
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from churn_gym.domain.entities.raw_member_batch import RawMemberBatch
+from churn_gym.domain.entities.raw_member_record import RawMemberRecord
+from churn_gym.domain.interfaces.dataset_repository import (
+    DEFAULT_BATCH_SIZE,
+    DatasetRepository,
+)
+from churn_gym.infrastructure.data_sources.csv_loader_pandas import (
+    DATE_COLUMNS,
+    NUMERIC_COLUMNS,
+    TEXT_COLUMNS,
+)
+
+
+# Colonnes sans usage dans le preprocessing / feature engineering
+UNUSED_COLUMNS = ("Name", "Address", "Phone_Number")
+
+# Colonnes texte à faible cardinalité, lues encodées par dictionnaire
+DICTIONARY_COLUMNS = ("Gender", "Membership_Type", "Favorite_Exercise", "Churn")
+
+# Colonnes lues par défaut
+PIPELINE_COLUMNS: Tuple[str, ...] = tuple(
+    col
+    for col in (*TEXT_COLUMNS, *NUMERIC_COLUMNS, *DATE_COLUMNS)
+    if col not in UNUSED_COLUMNS
+)
+
+
+class ArrowParquetLoader(DatasetRepository):
+    """
+    Infrastructure adapter:
+    - reads Parquet through a pyarrow dataset (projection + filter pushdown)
+    - maps Arrow columns to a RawMemberBatch without going through pandas
+    - streams record batches in iter_batches()
+
+    Les colonnes non lues sont remplies comme des colonnes absentes
+    du CSV (None / NaN / NaT).
+    """
+
+    def __init__(
+        self,
+        parquet_path: str,
+        columns: Optional[Sequence[str]] = PIPELINE_COLUMNS,
+        join_date_range: Optional[Tuple[Optional[date], Optional[date]]] = None,
+        memory_map: bool = True,
+    ):
+        """
+        columns          : colonnes à lire (None = toutes)
+        join_date_range  : (début, fin) inclusifs sur Join_Date, bornes optionnelles
+        memory_map       : lecture via mmap plutôt que par appels read()
+        """
+        self.parquet_path = str(parquet_path)
+        self.columns = list(columns) if columns is not None else None
+        self.join_date_range = join_date_range
+        self.memory_map = memory_map
+
+    def load_raw(self) -> List[RawMemberRecord]:
+        return self.load_batch().to_records()
+
+    def load_batch(self) -> RawMemberBatch:
+        table = self._dataset().to_table(columns=self.columns, filter=self._filter())
+        return arrow_to_raw_member_batch(table)
+
+    def iter_batches(self, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[RawMemberBatch]:
+        if batch_size <= 0:
+            raise ValueError("batch_size doit être strictement positif.")
+
+        scanner = self._dataset().scanner(
+            columns=self.columns,
+            filter=self._filter(),
+            batch_size=batch_size,
+        )
+        for record_batch in scanner.to_batches():
+            if record_batch.num_rows:
+                yield arrow_to_raw_member_batch(record_batch)
+
+    # ------------------------------------------------------------------
+    # Utils
+    # ------------------------------------------------------------------
+    def _dataset(self):
+        import pyarrow.dataset as ds
+        from pyarrow import fs
+
+        parquet_format = ds.ParquetFileFormat(
+            read_options=ds.ParquetReadOptions(dictionary_columns=DICTIONARY_COLUMNS)
+        )
+        return ds.dataset(
+            self.parquet_path,
+            format=parquet_format,
+            filesystem=fs.LocalFileSystem(use_mmap=self.memory_map),
+        )
+
+    def _filter(self):
+        if self.join_date_range is None:
+            return None
+
+        import pyarrow.dataset as ds
+
+        start, end = self.join_date_range
+        join_date = ds.field("Join_Date")
+        expression = None
+        if start is not None:
+            expression = join_date >= start
+        if end is not None:
+            expression = join_date <= end if expression is None else expression & (join_date <= end)
+        return expression
+
+
+# ----------------------------------------------------------------------
+# Table / RecordBatch Arrow -> RawMemberBatch
+# ----------------------------------------------------------------------
+def arrow_to_raw_member_batch(table) -> RawMemberBatch:
+    """
+    Convertit une Table (ou RecordBatch) Arrow au schéma du dataset
+    membres en RawMemberBatch, colonne par colonne.
+    """
+    import pyarrow as pa
+
+    n_rows = table.num_rows
+    names = set(table.schema.names)
+    columns: Dict[str, np.ndarray] = {}
+
+    for col, field in TEXT_COLUMNS.items():
+        if col in names:
+            columns[field] = _text_values(table.column(col))
+        else:
+            columns[field] = np.full(n_rows, None, dtype=object)
+
+    for col, field in NUMERIC_COLUMNS.items():
+        if col in names:
+            values = table.column(col).cast(pa.float64())
+            columns[field] = values.to_numpy(zero_copy_only=False).astype(np.float64, copy=False)
+        else:
+            columns[field] = np.full(n_rows, np.nan)
+
+    for col, field in DATE_COLUMNS.items():
+        if col in names:
+            values = table.column(col).cast(pa.date32())
+            columns[field] = values.to_numpy(zero_copy_only=False).astype("datetime64[D]")
+        else:
+            columns[field] = np.full(n_rows, np.datetime64("NaT"), dtype="datetime64[D]")
+
+    return RawMemberBatch(**columns)
+
+
+def _text_values(column) -> np.ndarray:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    if not pa.types.is_dictionary(column.type):
+        return np.asarray(column.cast(pa.string()).to_numpy(zero_copy_only=False), dtype=object)
+
+    # Colonne encodée par dictionnaire : un seul objet str Python par valeur
+    # distincte (comme le parser CSV de pandas), et non un par ligne
+    chunks = column.chunks if isinstance(column, pa.ChunkedArray) else [column]
+    parts = []
+    for chunk in chunks:
+        categories = np.asarray(
+            chunk.dictionary.cast(pa.string()).to_numpy(zero_copy_only=False), dtype=object
+        )
+        if len(categories) == 0:
+            parts.append(np.full(len(chunk), None, dtype=object))
+            continue
+
+        values = categories[pc.fill_null(chunk.indices, 0).to_numpy()]
+        if chunk.null_count:
+            values[chunk.is_null().to_numpy(zero_copy_only=False)] = None
+        parts.append(values)
+
+    return np.concatenate(parts) if parts else np.empty(0, dtype=object)
@@ -1,14 +1,21 @@
 # src/churn_gym/infrastructure/ml/features/advanced_feature_engineering.py
-from churn_gym.domain.interfaces.feature_engineering_pipeline import FeatureEngineeringPipeline
+from churn_gym.domain.interfaces.feature_engineering_pipeline import (
+    FeatureEngineeringPipeline,
+    resolve_reference_date,
+)
 from churn_gym.domain.entities.feature_vector import FeatureVector
 from churn_gym.domain.entities.member_record import MemberRecord
-from typing import List, Iterable
+from typing import List, Iterable, Optional
 from datetime import date
 
 class AdvancedFeatureEngineeringPipeline(FeatureEngineeringPipeline):
 
-    def run(self, records: Iterable[MemberRecord]) -> List[FeatureVector]:
-        today = date.today()
+    def run(
+        self,
+        records: Iterable[MemberRecord],
+        reference_date: Optional[date] = None,
+    ) -> List[FeatureVector]:
+        today = resolve_reference_date(reference_date)
         features = []
 
         for r in records:
@@ -0,0 +1,29 @@
+# src/churn_gym/infrastructure/ml/features/feature_frame.py
+from typing import Sequence
+
+import pandas as pd
+
+from churn_gym.domain.entities.feature_batch import FeatureBatch
+from churn_gym.infrastructure.ml.features.features_selection import FEATURES_ALL
+
+
+def to_feature_frame(
+    batch: FeatureBatch,
+    feature_names: Sequence[str] = FEATURES_ALL,
+) -> pd.DataFrame:
+    """
+    Vue DataFrame d'un FeatureBatch, colonnes dans l'ordre de `feature_names`.
+
+    Les numériques sont repris tels quels (pas de copie) et les
+    catégorielles deviennent des pd.Categorical construits à partir des
+    codes : aucune opération ligne par ligne.
+    """
+    data = {}
+    for name in feature_names:
+        if name in batch.numerical:
+            data[name] = batch.numerical[name]
+        else:
+            column = batch.categorical[name]
+            data[name] = pd.Categorical.from_codes(column.codes, categories=column.categories)
+
+    return pd.DataFrame(data, columns=list(feature_names), copy=False)
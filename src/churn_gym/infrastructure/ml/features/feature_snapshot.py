@@ -0,0 +1,218 @@
+# src/churn_gym/infrastructure/ml/features/feature_snapshot.py
+"""
+Snapshot disque d'un FeatureBatch, relu par memory-mapping.
+
+Format (un répertoire par snapshot) :
+
+    manifest.json                  features, dtypes, lignes, hash source, date de référence
+    member_id.npy                  <U (largeur fixe)
+    churn.npy                      int64
+    numerical/<feature>.npy        float64
+    categorical/<feature>.codes.npy       int32
+    categorical/<feature>.categories.npy  <U (dictionnaire)
+
+Toutes les colonnes ont un dtype fixe (pas de pickle) : open_feature_snapshot
+les ouvre avec np.load(mmap_mode="r"), sans désérialisation. Les processus
+qui ouvrent le même snapshot partagent les pages du cache système ; pour
+un pool de workers, passer le chemin du répertoire plutôt que le
+FeatureBatch (qui serait copié par pickle).
+"""
+from __future__ import annotations
+
+import json
+import os
+import shutil
+from dataclasses import asdict, dataclass
+from datetime import date
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from churn_gym.domain.entities.feature_batch import CategoricalColumn, FeatureBatch
+from churn_gym.infrastructure.logging.loguru_logger import LoguruLogger
+from churn_gym.infrastructure.utils.config_loader import load_yaml_config
+from churn_gym.infrastructure.utils.root_finder import get_repository_root
+
+
+# À incrémenter si l'organisation des fichiers change
+SNAPSHOT_FORMAT_VERSION = 1
+
+MANIFEST_FILE = "manifest.json"
+
+
+@dataclass(frozen=True)
+class FeatureSnapshotManifest:
+    """
+    Description d'un snapshot ; `numerical` / `categorical` donnent le
+    dtype stocké de chaque feature, dans l'ordre du FeatureBatch.
+    """
+
+    format_version: int
+    rows: int
+    numerical: Dict[str, str]
+    categorical: Dict[str, str]
+    source_hash: Optional[str] = None
+    reference_date: Optional[str] = None   # ISO (AAAA-MM-JJ)
+    pipeline_version: Optional[str] = None
+
+    @property
+    def feature_names(self) -> Tuple[str, ...]:
+        return (*self.numerical, *self.categorical)
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self), indent=2)
+
+    @classmethod
+    def from_json(cls, text: str) -> "FeatureSnapshotManifest":
+        return cls(**json.loads(text))
+
+
+def default_snapshot_dir(name: str) -> Path:
+    """
+    Répertoire `name` sous paths.feature_snapshot_dir.
+    """
+    root = get_repository_root()
+    cfg = load_yaml_config(root / "configs/paths.yaml")
+    return root / Path(cfg["paths"]["feature_snapshot_dir"]) / name
+
+
+# ======================================================================
+# Écriture
+# ======================================================================
+def write_feature_snapshot(
+    directory: Path,
+    features: FeatureBatch,
+    source_hash: Optional[str] = None,
+    reference_date: Optional[date] = None,
+    pipeline_version: Optional[str] = None,
+    overwrite: bool = False,
+) -> FeatureSnapshotManifest:
+    """
+    Écrit `features` dans `directory`.
+
+    Le snapshot est construit dans un répertoire temporaire voisin puis
+    renommé : un lecteur ne voit jamais de snapshot partiel.
+    """
+    directory = Path(directory)
+    if directory.exists() and not overwrite:
+        raise FileExistsError(f"Snapshot de features déjà présent : {directory}")
+
+    tmp_dir = directory.with_name(f"{directory.name}.{os.getpid()}.tmp")
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    (tmp_dir / "numerical").mkdir(parents=True)
+    (tmp_dir / "categorical").mkdir()
+
+    np.save(tmp_dir / "member_id.npy", _fixed_width_str(features.member_id))
+    np.save(tmp_dir / "churn.npy", np.asarray(features.churn, dtype=np.int64))
+
+    numerical = {}
+    for name, column in features.numerical.items():
+        values = np.ascontiguousarray(column, dtype=np.float64)
+        np.save(tmp_dir / "numerical" / f"{name}.npy", values)
+        numerical[name] = values.dtype.str
+
+    categorical = {}
+    for name, column in features.categorical.items():
+        codes = np.ascontiguousarray(column.codes, dtype=np.int32)
+        np.save(tmp_dir / "categorical" / f"{name}.codes.npy", codes)
+        np.save(tmp_dir / "categorical" / f"{name}.categories.npy", _fixed_width_str(column.categories))
+        categorical[name] = codes.dtype.str
+
+    manifest = FeatureSnapshotManifest(
+        format_version=SNAPSHOT_FORMAT_VERSION,
+        rows=len(features),
+        numerical=numerical,
+        categorical=categorical,
+        source_hash=source_hash,
+        reference_date=reference_date.isoformat() if reference_date is not None else None,
+        pipeline_version=pipeline_version,
+    )
+    (tmp_dir / MANIFEST_FILE).write_text(manifest.to_json(), encoding="utf-8")
+
+    if directory.exists():
+        shutil.rmtree(directory)
+    directory.parent.mkdir(parents=True, exist_ok=True)
+    os.replace(tmp_dir, directory)
+
+    LoguruLogger().info(
+        "Snapshot de features écrit",
+        path=str(directory),
+        rows=manifest.rows,
+        features=len(manifest.feature_names),
+    )
+    return manifest
+
+
+def _fixed_width_str(values: np.ndarray) -> np.ndarray:
+    # dtype <U : largeur fixe, lisible en mmap (pas de dtype object / pickle)
+    values = np.asarray(values, dtype=object)
+    if len(values) == 0:
+        return np.empty(0, dtype="<U1")
+    return values.astype(str)
+
+
+# ======================================================================
+# Lecture
+# ======================================================================
+def read_feature_snapshot_manifest(directory: Path) -> FeatureSnapshotManifest:
+    manifest = FeatureSnapshotManifest.from_json(
+        (Path(directory) / MANIFEST_FILE).read_text(encoding="utf-8")
+    )
+    if manifest.format_version != SNAPSHOT_FORMAT_VERSION:
+        raise ValueError(
+            f"Format de snapshot non supporté : {manifest.format_version} "
+            f"(attendu : {SNAPSHOT_FORMAT_VERSION})"
+        )
+    return manifest
+
+
+def open_feature_snapshot(
+    directory: Path,
+    mmap_mode: Optional[str] = "r",
+    expected_source_hash: Optional[str] = None,
+    expected_reference_date: Optional[date] = None,
+) -> FeatureBatch:
+    """
+    FeatureBatch dont les colonnes sont des vues memory-mappées
+    (lecture seule) sur les fichiers du snapshot.
+
+    member_id reste un tableau <U mappé ; seuls les dictionnaires des
+    catégorielles (quelques valeurs) sont chargés en objets Python.
+    `expected_*` : ValueError si le snapshot ne correspond pas à la
+    source ou à la date de référence attendues.
+    """
+    directory = Path(directory)
+    manifest = read_feature_snapshot_manifest(directory)
+
+    if expected_source_hash is not None and manifest.source_hash != expected_source_hash:
+        raise ValueError(
+            f"Snapshot {directory} obsolète : hash source {manifest.source_hash} "
+            f"!= {expected_source_hash}"
+        )
+    if expected_reference_date is not None and manifest.reference_date != expected_reference_date.isoformat():
+        raise ValueError(
+            f"Snapshot {directory} calculé au {manifest.reference_date}, "
+            f"attendu : {expected_reference_date.isoformat()}"
+        )
+
+    def load(relative: str) -> np.ndarray:
+        array = np.load(directory / relative, mmap_mode=mmap_mode, allow_pickle=False)
+        if len(array) != manifest.rows:
+            raise ValueError(f"Snapshot {directory} incohérent : {relative} ({len(array)} lignes)")
+        return array
+
+    return FeatureBatch(
+        member_id=load("member_id.npy"),
+        numerical={name: load(f"numerical/{name}.npy") for name in manifest.numerical},
+        categorical={
+            name: CategoricalColumn(
+                codes=load(f"categorical/{name}.codes.npy"),
+                categories=np.load(
+                    directory / "categorical" / f"{name}.categories.npy", allow_pickle=False
+                ).astype(object),
+            )
+            for name in manifest.categorical
+        },
+        churn=load("churn.npy"),
+    )
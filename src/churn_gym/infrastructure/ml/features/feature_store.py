@@ -0,0 +1,126 @@
+# src/churn_gym/infrastructure/ml/features/feature_store.py
+"""
+Feature store local (SQLite), une ligne par membre.
+
+Chaque ligne garde les features calculées et le hash des données
+d'entrée qui les ont produites : un membre dont le hash n'a pas changé
+n'a pas besoin d'être recalculé.
+"""
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+from typing import Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from churn_gym.domain.entities.feature_batch import FeatureBatch
+from churn_gym.infrastructure.logging.loguru_logger import LoguruLogger
+from churn_gym.infrastructure.ml.features.features_selection import (
+    CATEGORICAL_FEATURES,
+    NUMERICAL_FEATURES,
+)
+from churn_gym.infrastructure.utils.config_loader import load_yaml_config
+from churn_gym.infrastructure.utils.root_finder import get_repository_root
+
+
+class SQLiteFeatureStore:
+    """
+    Table `features(member_id PK, row_hash, <features>)` + table `meta`.
+
+    Si `pipeline_version` ou la liste des features change, le store est
+    vidé : les vecteurs stockés ne sont plus comparables.
+    """
+
+    def __init__(self, db_path: Optional[Path] = None, pipeline_version: str = "1"):
+        if db_path is None:
+            root = get_repository_root()
+            cfg = load_yaml_config(root / "configs/paths.yaml")
+            db_path = root / Path(cfg["paths"]["feature_store_db"])
+
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.pipeline_version = pipeline_version
+        self.logger = LoguruLogger()
+
+        self._conn = sqlite3.connect(self.db_path)
+        self._init_schema()
+
+    # ------------------------------------------------------------------
+    # Schéma
+    # ------------------------------------------------------------------
+    def _init_schema(self) -> None:
+        signature = f"{self.pipeline_version}|{','.join(NUMERICAL_FEATURES + CATEGORICAL_FEATURES)}"
+
+        with self._conn:
+            self._conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+            row = self._conn.execute("SELECT value FROM meta WHERE key = 'signature'").fetchone()
+
+            if row is not None and row[0] != signature:
+                self.logger.warning("Version du pipeline de features modifiée → feature store vidé")
+                self._conn.execute("DROP TABLE IF EXISTS features")
+
+            columns = ", ".join(
+                [f'"{name}" REAL' for name in NUMERICAL_FEATURES]
+                + [f'"{name}" TEXT' for name in CATEGORICAL_FEATURES]
+            )
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS features "
+                f"(member_id TEXT PRIMARY KEY, row_hash INTEGER NOT NULL, {columns})"
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('signature', ?)", (signature,)
+            )
+
+    # ------------------------------------------------------------------
+    # Lecture / écriture
+    # ------------------------------------------------------------------
+    def lookup(self, member_ids: Sequence[str]) -> pd.DataFrame:
+        """
+        Lignes stockées alignées sur `member_ids` (NaN pour les membres absents).
+        """
+        with self._conn:
+            self._conn.execute("DROP TABLE IF EXISTS temp.wanted")
+            self._conn.execute("CREATE TEMP TABLE wanted (member_id TEXT PRIMARY KEY)")
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO temp.wanted VALUES (?)",
+                ((member_id,) for member_id in member_ids),
+            )
+            stored = pd.read_sql_query(
+                "SELECT f.* FROM features f JOIN temp.wanted w USING (member_id)",
+                self._conn,
+                index_col="member_id",
+            )
+
+        # Int64 nullable : les hash 64 bits ne passent pas par float64
+        stored = stored.astype({"row_hash": "Int64"})
+        return stored.reindex(pd.Index(member_ids, dtype=object))
+
+    def upsert(self, row_hashes: np.ndarray, features: FeatureBatch) -> None:
+        """
+        Écrit (ou remplace) les features des membres de `features`.
+        """
+        frame = pd.DataFrame(
+            {
+                "member_id": features.member_id,
+                "row_hash": np.asarray(row_hashes, dtype=np.int64),
+                **{name: features.numerical[name] for name in NUMERICAL_FEATURES},
+                **{name: features.categorical[name].decode() for name in CATEGORICAL_FEATURES},
+            }
+        )
+        # NaN -> NULL
+        rows = frame.astype(object).where(frame.notna(), None).itertuples(index=False, name=None)
+
+        placeholders = ", ".join("?" * len(frame.columns))
+        columns = ", ".join(f'"{c}"' for c in frame.columns)
+        with self._conn:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO features ({columns}) VALUES ({placeholders})", rows
+            )
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM features").fetchone()[0]
+
+    def close(self) -> None:
+        self._conn.close()
@@ -0,0 +1,123 @@
+# src/churn_gym/infrastructure/ml/features/incremental_feature_engineering.py
+from dataclasses import fields
+from datetime import date
+from typing import Iterable, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from churn_gym.domain.entities.feature_batch import CategoricalColumn, FeatureBatch
+from churn_gym.domain.entities.feature_vector import FeatureVector
+from churn_gym.domain.entities.member_batch import MemberBatch
+from churn_gym.domain.entities.member_record import MemberRecord
+from churn_gym.domain.interfaces.feature_engineering_pipeline import (
+    FeatureEngineeringPipeline,
+    resolve_reference_date,
+)
+from churn_gym.infrastructure.logging.loguru_logger import LoguruLogger
+from churn_gym.infrastructure.ml.features.feature_store import SQLiteFeatureStore
+from churn_gym.infrastructure.ml.features.features_selection import (
+    CATEGORICAL_FEATURES,
+    NUMERICAL_FEATURES,
+)
+from churn_gym.infrastructure.ml.features.vectorized_feature_engineering import (
+    REFERENCE_DATE_FEATURES,
+    reference_date_features,
+)
+
+
+class IncrementalFeatureEngineeringPipeline(FeatureEngineeringPipeline):
+    """
+    Feature engineering incrémental au-dessus d'un pipeline existant.
+
+    - Hash de chaque ligne d'entrée (MemberBatch, hors member_id)
+    - Seuls les membres nouveaux ou dont le hash a changé passent par
+      le pipeline `inner` ; les autres sont relus dans le feature store
+    - Les features de REFERENCE_DATE_FEATURES sont recalculées pour tous
+      les membres en une passe vectorisée, à la date de référence demandée
+    """
+
+    def __init__(self, inner: FeatureEngineeringPipeline, store: SQLiteFeatureStore):
+        self.inner = inner
+        self.store = store
+        self.logger = LoguruLogger()
+
+    def run(
+        self,
+        records: Union[MemberBatch, Iterable[MemberRecord]],
+        reference_date: Optional[date] = None,
+    ) -> List[FeatureVector]:
+        if not isinstance(records, MemberBatch):
+            records = MemberBatch.from_records(records)
+        return self.run_batch(records, reference_date).to_vectors()
+
+    def run_batch(self, batch: MemberBatch, reference_date: Optional[date] = None) -> FeatureBatch:
+        n = len(batch)
+        reference_date = resolve_reference_date(reference_date)
+        row_hashes = member_row_hashes(batch)
+
+        stored = self.store.lookup(batch.member_id.tolist())
+        stored_hashes = stored["row_hash"]
+        is_fresh = stored_hashes.isna().to_numpy() | (
+            stored_hashes.fillna(0).to_numpy(dtype=np.int64) != row_hashes
+        )
+        fresh_idx = np.flatnonzero(is_fresh)
+        cached_idx = np.flatnonzero(~is_fresh)
+
+        self.logger.info(
+            f"Features : {len(fresh_idx)} membres recalculés, {len(cached_idx)} relus du store"
+        )
+
+        computed = None
+        if len(fresh_idx):
+            computed = self.inner.run_batch(batch.take(fresh_idx), reference_date)
+            self.store.upsert(row_hashes[fresh_idx], computed)
+
+        # =====================
+        # Assemblage dans l'ordre du lot
+        # =====================
+        numerical = {}
+        for name in NUMERICAL_FEATURES:
+            column = np.empty(n, dtype=np.float64)
+            column[cached_idx] = stored[name].to_numpy(dtype=np.float64)[cached_idx]
+            if computed is not None:
+                column[fresh_idx] = computed.numerical[name]
+            numerical[name] = column
+
+        categorical = {}
+        for name in CATEGORICAL_FEATURES:
+            values = np.empty(n, dtype=object)
+            values[cached_idx] = stored[name].to_numpy(dtype=object)[cached_idx]
+            if computed is not None:
+                values[fresh_idx] = computed.categorical[name].decode()
+            categorical[name] = CategoricalColumn.encode(values)
+
+        # =====================
+        # Rafraîchissement des features liées à la date de référence
+        # =====================
+        today = np.datetime64(reference_date, "D")
+        refreshed = reference_date_features(batch.last_visit_date, batch.visits_per_month, today)
+        for name in REFERENCE_DATE_FEATURES:
+            if name in numerical:
+                numerical[name] = refreshed[name]
+            else:
+                categorical[name] = refreshed[name]
+
+        churn = np.nan_to_num(np.asarray(batch.churn, dtype=np.float64), nan=0.0).astype(np.int64)
+
+        return FeatureBatch(
+            member_id=np.asarray(batch.member_id, dtype=object),
+            numerical=numerical,
+            categorical=categorical,
+            churn=churn,
+        )
+
+
+def member_row_hashes(batch: MemberBatch) -> np.ndarray:
+    """
+    Hash 64 bits (int64) de chaque ligne, sur tous les champs sauf member_id.
+    """
+    frame = pd.DataFrame(
+        {f.name: getattr(batch, f.name) for f in fields(batch) if f.name != "member_id"}
+    )
+    return pd.util.hash_pandas_object(frame, index=False).to_numpy().view(np.int64)
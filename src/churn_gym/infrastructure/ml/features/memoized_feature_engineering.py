@@ -0,0 +1,173 @@
+# src/churn_gym/infrastructure/ml/features/memoized_feature_engineering.py
+"""
+Mémoïsation disque des sorties du feature engineering.
+
+Clé = sha256(contenu du MemberBatch, date de référence, version du
+pipeline). À date de référence fixée, le feature engineering est
+déterministe : un lot déjà vu est relu depuis un .npz au lieu d'être
+recalculé, y compris depuis un autre processus ou un autre run.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import fields
+from datetime import date
+from pathlib import Path
+from typing import Iterable, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from churn_gym.domain.entities.feature_batch import CategoricalColumn, FeatureBatch
+from churn_gym.domain.entities.feature_vector import FeatureVector
+from churn_gym.domain.entities.member_batch import MemberBatch
+from churn_gym.domain.entities.member_record import MemberRecord
+from churn_gym.domain.interfaces.feature_engineering_pipeline import (
+    FeatureEngineeringPipeline,
+    resolve_reference_date,
+)
+from churn_gym.infrastructure.logging.loguru_logger import LoguruLogger
+from churn_gym.infrastructure.ml.features.features_selection import (
+    CATEGORICAL_FEATURES,
+    NUMERICAL_FEATURES,
+)
+from churn_gym.infrastructure.utils.config_loader import load_yaml_config
+from churn_gym.infrastructure.utils.root_finder import get_repository_root
+
+
+# À incrémenter si le format des fichiers ou le calcul de la clé change
+_CACHE_VERSION = 1
+
+
+class MemoizedFeatureEngineeringPipeline(FeatureEngineeringPipeline):
+    """
+    Cache des FeatureBatch produits par un pipeline `inner`.
+
+    `pipeline_version` doit être incrémenté à chaque changement du calcul
+    des features : les entrées des versions précédentes sont alors ignorées.
+    """
+
+    def __init__(
+        self,
+        inner: FeatureEngineeringPipeline,
+        cache_dir: Optional[Path] = None,
+        pipeline_version: str = "1",
+    ):
+        if cache_dir is None:
+            root = get_repository_root()
+            cfg = load_yaml_config(root / "configs/paths.yaml")
+            cache_dir = root / Path(cfg["paths"]["feature_cache_dir"])
+
+        self.inner = inner
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.pipeline_version = pipeline_version
+        self.logger = LoguruLogger()
+
+    def run(
+        self,
+        records: Union[MemberBatch, Iterable[MemberRecord]],
+        reference_date: Optional[date] = None,
+    ) -> List[FeatureVector]:
+        if not isinstance(records, MemberBatch):
+            records = MemberBatch.from_records(records)
+        return self.run_batch(records, reference_date).to_vectors()
+
+    def run_batch(self, batch: MemberBatch, reference_date: Optional[date] = None) -> FeatureBatch:
+        reference_date = resolve_reference_date(reference_date)
+        key = self.key(batch, reference_date)
+        path = self.path(key)
+
+        if path.exists():
+            self.logger.debug(f"Features en cache : {key[:12]}")
+            return _load_feature_batch(path)
+
+        features = self.inner.run_batch(batch, reference_date)
+        _save_feature_batch(path, features)
+        self.logger.info(
+            f"Features mises en cache : {key[:12]} ({len(batch)} lignes, "
+            f"date de référence {reference_date.isoformat()})"
+        )
+        return features
+
+    # ------------------------------------------------------------------
+    # Clés
+    # ------------------------------------------------------------------
+    def key(self, batch: MemberBatch, reference_date: date) -> str:
+        digest = hashlib.sha256()
+        digest.update(
+            json.dumps(
+                {
+                    "version": _CACHE_VERSION,
+                    "pipeline": type(self.inner).__name__,
+                    "pipeline_version": self.pipeline_version,
+                    "reference_date": reference_date.isoformat(),
+                    "features": NUMERICAL_FEATURES + CATEGORICAL_FEATURES,
+                },
+                sort_keys=True,
+            ).encode()
+        )
+        digest.update(member_batch_digest(batch).encode())
+        return digest.hexdigest()
+
+    def path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.npz"
+
+
+def member_batch_digest(batch: MemberBatch) -> str:
+    """
+    Hash (sha256) du contenu d'un lot, member_id et ordre des lignes compris.
+    """
+    frame = pd.DataFrame({f.name: getattr(batch, f.name) for f in fields(batch)})
+    row_hashes = pd.util.hash_pandas_object(frame, index=False).to_numpy()
+
+    digest = hashlib.sha256()
+    digest.update(",".join(frame.columns).encode())
+    digest.update(np.ascontiguousarray(row_hashes).tobytes())
+    return digest.hexdigest()
+
+
+# ======================================================================
+# Format disque (.npz non compressé, sans pickle)
+# ======================================================================
+def _save_feature_batch(path: Path, features: FeatureBatch) -> None:
+    arrays = {
+        "member_id": np.asarray(features.member_id, dtype=str),
+        "churn": np.asarray(features.churn, dtype=np.int64),
+    }
+    for name, column in features.numerical.items():
+        arrays[f"num__{name}"] = np.asarray(column, dtype=np.float64)
+    for name, column in features.categorical.items():
+        arrays[f"cat_codes__{name}"] = np.asarray(column.codes, dtype=np.int32)
+        arrays[f"cat_values__{name}"] = np.asarray(column.categories, dtype=str)
+
+    # Écriture dans un fichier temporaire puis renommage : un lecteur
+    # concurrent ne voit jamais de fichier partiel
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        np.savez(f, **arrays)
+    os.replace(tmp_path, path)
+
+
+def _load_feature_batch(path: Path) -> FeatureBatch:
+    with np.load(path, allow_pickle=False) as data:
+        numerical = {}
+        categorical = {}
+        for entry in data.files:
+            if entry.startswith("num__"):
+                numerical[entry[len("num__"):]] = data[entry]
+            elif entry.startswith("cat_codes__"):
+                name = entry[len("cat_codes__"):]
+                categorical[name] = CategoricalColumn(
+                    codes=data[entry],
+                    categories=data[f"cat_values__{name}"].astype(object),
+                )
+
+        return FeatureBatch(
+            member_id=data["member_id"].astype(object),
+            numerical=numerical,
+            categorical=categorical,
+            churn=data["churn"],
+        )
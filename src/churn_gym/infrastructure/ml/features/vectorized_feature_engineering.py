@@ -0,0 +1,179 @@
+# src/churn_gym/infrastructure/ml/features/vectorized_feature_engineering.py
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from churn_gym.domain.interfaces.feature_engineering_pipeline import (
+    FeatureEngineeringPipeline,
+    resolve_reference_date,
+)
+from churn_gym.domain.entities.feature_vector import FeatureVector
+from churn_gym.domain.entities.feature_batch import CategoricalColumn, FeatureBatch
+from churn_gym.domain.entities.member_batch import MemberBatch
+from churn_gym.domain.entities.member_record import MemberRecord
+from churn_gym.infrastructure.ml.features.features_selection import (
+    CATEGORICAL_FEATURES,
+    NUMERICAL_FEATURES,
+)
+
+
+UNKNOWN_CATEGORY = "unknown"
+
+# Bornes des buckets (en jours)
+TENURE_BINS = np.array([90, 365])
+TENURE_LABELS = np.array(["short", "medium", "long", UNKNOWN_CATEGORY], dtype=object)
+RECENCY_STALE_DAYS = 30
+RECENCY_LABELS = np.array(["recent", "stale", UNKNOWN_CATEGORY], dtype=object)
+
+# Features qui dépendent de la date de référence (today)
+REFERENCE_DATE_FEATURES = ("days_since_last_visit", "visit_recency_bucket", "recency_frequency_score")
+
+
+class VectorizedFeatureEngineeringPipeline(FeatureEngineeringPipeline):
+    """
+    Mêmes features que AdvancedFeatureEngineeringPipeline, calculées
+    colonne par colonne (arithmétique de dates NumPy, np.digitize pour
+    les buckets, divisions masquées pour les ratios) et renvoyées
+    sous forme de FeatureBatch.
+
+    Les numériques manquants sont des NaN (sortie du preprocessing robuste).
+    """
+
+    def run(
+        self,
+        records: Union[MemberBatch, Iterable[MemberRecord]],
+        reference_date: Optional[date] = None,
+    ) -> List[FeatureVector]:
+        if not isinstance(records, MemberBatch):
+            records = MemberBatch.from_records(records)
+        return self.run_batch(records, reference_date).to_vectors()
+
+    def run_batch(self, batch: MemberBatch, reference_date: Optional[date] = None) -> FeatureBatch:
+        """
+        Calcule les features d'un lot sous forme de FeatureBatch
+        (numériques float64, catégorielles encodées par dictionnaire).
+        """
+        today = np.datetime64(resolve_reference_date(reference_date), "D")
+
+        duration = np.asarray(batch.avg_workout_duration_min, dtype=np.float64)
+        calories = np.asarray(batch.avg_calories_burned, dtype=np.float64)
+        weight = np.asarray(batch.total_weight_lifted_kg, dtype=np.float64)
+        visits = np.asarray(batch.visits_per_month, dtype=np.float64)
+
+        # =====================
+        # 1. Calculs temporels (NaT -> NaN)
+        # =====================
+        tenure_days = _days_between(batch.join_date, batch.last_visit_date)
+
+        # =====================
+        # 2. Buckets (codes directement, sans passer par des chaînes)
+        # =====================
+        tenure_codes = np.digitize(np.nan_to_num(tenure_days), TENURE_BINS)
+        tenure_codes[np.isnan(tenure_days)] = len(TENURE_LABELS) - 1
+
+        # =====================
+        # 3. Ratios (0.0 quand le dénominateur / numérateur est nul)
+        # =====================
+        attendance_rate = np.where(visits != 0, visits / 30, 0.0)
+
+        weight_intensity = _masked_divide(weight, duration, (weight != 0) & (duration > 0))
+        calories_per_minute = _masked_divide(calories, duration, (calories != 0) & (duration != 0))
+        weight_per_visit = _masked_divide(weight, visits, (weight != 0) & (visits != 0))
+
+        # =====================
+        # 4. Features dépendant de la date de référence
+        # =====================
+        reference_features = reference_date_features(batch.last_visit_date, visits, today)
+
+        churn = np.nan_to_num(np.asarray(batch.churn, dtype=np.float64), nan=0.0).astype(np.int64)
+
+        numerical = {
+            "age": np.asarray(batch.age, dtype=np.float64),
+            "avg_workout_duration_min": duration,
+            "avg_calories_burned": calories,
+            "total_weight_lifted_kg": weight,
+            "visits_per_month": visits,
+            "tenure_days": tenure_days,
+            "days_since_last_visit": reference_features["days_since_last_visit"],
+            "calories_per_minute": calories_per_minute,
+            "weight_per_visit": weight_per_visit,
+            "attendance_rate": attendance_rate,
+            "recency_frequency_score": reference_features["recency_frequency_score"],
+            "weight_intensity": weight_intensity,
+        }
+        categorical = {
+            "gender": _encode_category(batch.gender),
+            "membership_type": _encode_category(batch.membership_type),
+            "favorite_exercise": _encode_category(batch.favorite_exercise),
+            "visit_recency_bucket": reference_features["visit_recency_bucket"],
+            "tenure_bucket": CategoricalColumn(
+                codes=tenure_codes.astype(np.int32), categories=TENURE_LABELS
+            ),
+        }
+
+        return FeatureBatch(
+            member_id=np.asarray(batch.member_id, dtype=object),
+            numerical={name: numerical[name] for name in NUMERICAL_FEATURES},
+            categorical={name: categorical[name] for name in CATEGORICAL_FEATURES},
+            churn=churn,
+        )
+
+
+def reference_date_features(
+    last_visit_date: np.ndarray,
+    visits_per_month: np.ndarray,
+    today: np.datetime64,
+) -> Dict[str, Union[np.ndarray, CategoricalColumn]]:
+    """
+    Features de REFERENCE_DATE_FEATURES, seules à changer quand la date
+    de référence (`today`) avance sans que les données du membre ne changent.
+    """
+    visits = np.asarray(visits_per_month, dtype=np.float64)
+    days_since_last_visit = _days_between(last_visit_date, today)
+
+    recency_codes = (days_since_last_visit >= RECENCY_STALE_DAYS).astype(np.int32)
+    recency_codes[np.isnan(days_since_last_visit)] = len(RECENCY_LABELS) - 1
+
+    rf_mask = ~np.isnan(days_since_last_visit) & (visits > 0)
+    recency_frequency_score = _masked_divide(
+        days_since_last_visit, _masked_divide(30.0, visits, rf_mask), rf_mask
+    )
+
+    return {
+        "days_since_last_visit": days_since_last_visit,
+        "visit_recency_bucket": CategoricalColumn(codes=recency_codes, categories=RECENCY_LABELS),
+        "recency_frequency_score": recency_frequency_score,
+    }
+
+
+# ----------------------------------------------------------------------
+# Kernels
+# ----------------------------------------------------------------------
+def _days_between(start: np.ndarray, end: np.ndarray) -> np.ndarray:
+    """Différence en jours (float64, NaN si une des dates est NaT)."""
+    delta = np.asarray(end, dtype="datetime64[D]") - np.asarray(start, dtype="datetime64[D]")
+    days = delta.astype(np.float64)
+    days[np.isnat(delta)] = np.nan
+    return days
+
+
+def _masked_divide(numerator, denominator, mask: np.ndarray) -> np.ndarray:
+    """numerator / denominator là où mask est vrai, 0.0 ailleurs."""
+    numerator, denominator = np.broadcast_arrays(
+        np.asarray(numerator, dtype=np.float64),
+        np.asarray(denominator, dtype=np.float64),
+    )
+    return np.divide(numerator, denominator, out=np.zeros(mask.shape), where=mask)
+
+
+def _encode_category(values: np.ndarray) -> CategoricalColumn:
+    """Encodage par dictionnaire (manquant / vide -> "unknown")."""
+    series = pd.Series(values, dtype=object)
+    missing = (series.isna() | (series == "")).to_numpy()
+    codes, categories = pd.factorize(series.where(~missing, UNKNOWN_CATEGORY).astype(str))
+    return CategoricalColumn(
+        codes=codes.astype(np.int32),
+        categories=np.asarray(categories, dtype=object),
+    )
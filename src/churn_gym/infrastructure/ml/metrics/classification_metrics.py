@@ -0,0 +1,216 @@
+# src/churn_gym/infrastructure/ml/metrics/classification_metrics.py
+"""
+Métriques de classification binaire, vectorisées en NumPy.
+
+Toutes les courbes reposent sur un seul tri des probabilités
+(_binary_clf_curve) : O(n log n), sans boucle Python sur les seuils.
+Les définitions suivent scikit-learn (ROC-AUC par trapèzes, PR-AUC en
+average precision, log-loss avec probabilités bornées).
+
+Le balayage de seuils (threshold_curves) donne la matrice de confusion
+de chaque seuil candidat à partir du même tri, et sert à choisir le
+seuil de décision de ThresholdConfig sans re-scorer le dataset.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from churn_gym.domain.services.threshold_service import ThresholdConfig
+
+
+# Bornage des probabilités pour la log-loss
+_EPS = 1e-15
+
+
+def _binary_clf_curve(y_true: np.ndarray, y_score: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Vrais / faux positifs cumulés pour chaque seuil distinct
+    (seuils décroissants, une entrée par valeur de score distincte).
+    """
+    y_true = np.asarray(y_true, dtype=np.float64)
+    y_score = np.asarray(y_score, dtype=np.float64)
+
+    order = np.argsort(y_score, kind="mergesort")[::-1]
+    y_score = y_score[order]
+    y_true = y_true[order]
+
+    # Dernier indice de chaque groupe de scores égaux
+    distinct = np.flatnonzero(np.diff(y_score))
+    threshold_idx = np.r_[distinct, len(y_true) - 1]
+
+    tps = np.cumsum(y_true)[threshold_idx]
+    fps = 1 + threshold_idx - tps
+    return fps, tps, y_score[threshold_idx]
+
+
+def _check_binary(y_true: np.ndarray) -> None:
+    if len(np.unique(y_true)) < 2:
+        raise ValueError("Métrique indéfinie : une seule classe présente dans y_true.")
+
+
+def roc_auc(y_true: np.ndarray, y_score: np.ndarray) -> float:
+    _check_binary(y_true)
+    fps, tps, _ = _binary_clf_curve(y_true, y_score)
+    fpr = np.r_[0.0, fps] / fps[-1]
+    tpr = np.r_[0.0, tps] / tps[-1]
+    # Règle des trapèzes explicite (np.trapz est déprécié en NumPy 2)
+    return float(np.sum(np.diff(fpr) * (tpr[1:] + tpr[:-1]) / 2))
+
+
+def pr_auc(y_true: np.ndarray, y_score: np.ndarray) -> float:
+    """
+    Aire sous la courbe précision-rappel (average precision).
+    """
+    _check_binary(y_true)
+    fps, tps, _ = _binary_clf_curve(y_true, y_score)
+    precision = tps / (tps + fps)
+    recall = tps / tps[-1]
+    return float(np.sum(np.diff(np.r_[0.0, recall]) * precision))
+
+
+def log_loss(y_true: np.ndarray, y_proba: np.ndarray) -> float:
+    y_true = np.asarray(y_true, dtype=np.float64)
+    p = np.clip(np.asarray(y_proba, dtype=np.float64), _EPS, 1 - _EPS)
+    return float(-np.mean(y_true * np.log(p) + (1 - y_true) * np.log1p(-p)))
+
+
+def f1_score(y_true: np.ndarray, y_proba: np.ndarray, threshold: float = 0.5) -> float:
+    """
+    F1 de la classe positive, prédiction positive si proba >= threshold
+    (même convention que ThresholdService).
+    """
+    y_true = np.asarray(y_true).astype(bool)
+    y_pred = np.asarray(y_proba) >= threshold
+
+    tp = np.count_nonzero(y_true & y_pred)
+    denominator = np.count_nonzero(y_true) + np.count_nonzero(y_pred)
+    return float(2 * tp / denominator) if denominator else 0.0
+
+
+def classification_metrics(
+    y_true: np.ndarray,
+    y_proba: np.ndarray,
+    threshold: float = 0.5,
+) -> Dict[str, float]:
+    """
+    ROC-AUC, PR-AUC, log-loss et F1 en un appel.
+    """
+    return {
+        "roc_auc": roc_auc(y_true, y_proba),
+        "pr_auc": pr_auc(y_true, y_proba),
+        "log_loss": log_loss(y_true, y_proba),
+        "f1": f1_score(y_true, y_proba, threshold),
+    }
+
+
+# ======================================================================
+# Balayage de seuils
+# ======================================================================
+@dataclass(frozen=True)
+class ClassificationCost:
+    """
+    Coût métier de chaque case de la matrice de confusion
+    (ex: faux positif = offre de rétention inutile,
+    faux négatif = membre perdu).
+    """
+
+    false_positive: float = 1.0
+    false_negative: float = 1.0
+    true_positive: float = 0.0
+    true_negative: float = 0.0
+
+
+@dataclass(frozen=True)
+class ThresholdCurves:
+    """
+    Une entrée par seuil candidat (décroissant) ; prédiction positive
+    si proba >= threshold. La première entrée (seuil au-dessus du score
+    max) correspond à « aucun positif ».
+    """
+
+    thresholds: np.ndarray
+    tp: np.ndarray
+    fp: np.ndarray
+    fn: np.ndarray
+    tn: np.ndarray
+    precision: np.ndarray
+    recall: np.ndarray
+    f1: np.ndarray
+    cost: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.thresholds)
+
+
+def threshold_curves(
+    y_true: np.ndarray,
+    y_proba: np.ndarray,
+    cost: ClassificationCost = ClassificationCost(),
+) -> ThresholdCurves:
+    """
+    Matrices de confusion de tous les seuils distincts en un seul tri
+    (comptes TP / FP cumulés), puis précision / rappel / F1 / coût.
+    """
+    y_true = np.asarray(y_true)
+    fps, tps, scores = _binary_clf_curve(y_true, y_proba)
+
+    # Point « aucun positif » en tête
+    thresholds = np.r_[np.nextafter(scores[0], np.inf), scores]
+    tp = np.r_[0.0, tps]
+    fp = np.r_[0.0, fps]
+
+    n_pos = float(np.count_nonzero(y_true))
+    n_neg = float(len(y_true)) - n_pos
+    fn = n_pos - tp
+    tn = n_neg - fp
+
+    predicted = tp + fp
+    precision = np.divide(tp, predicted, out=np.ones_like(tp), where=predicted > 0)
+    recall = np.divide(tp, n_pos, out=np.zeros_like(tp), where=n_pos > 0)
+    f1 = np.divide(2 * tp, n_pos + predicted, out=np.zeros_like(tp), where=(n_pos + predicted) > 0)
+
+    total_cost = (
+        cost.false_positive * fp
+        + cost.false_negative * fn
+        + cost.true_positive * tp
+        + cost.true_negative * tn
+    )
+
+    return ThresholdCurves(
+        thresholds=thresholds,
+        tp=tp,
+        fp=fp,
+        fn=fn,
+        tn=tn,
+        precision=precision,
+        recall=recall,
+        f1=f1,
+        cost=total_cost,
+    )
+
+
+def optimal_threshold_config(
+    y_true: np.ndarray,
+    y_proba: np.ndarray,
+    base: ThresholdConfig = ThresholdConfig(),
+    objective: str = "cost",
+    cost: ClassificationCost = ClassificationCost(),
+    curves: Optional[ThresholdCurves] = None,
+) -> ThresholdConfig:
+    """
+    ThresholdConfig dont le seuil de décision minimise le coût métier
+    (objective="cost") ou maximise le F1 (objective="f1") ; les seuils de
+    risque de `base` sont conservés.
+
+    À ex-aequo, le seuil le plus élevé (le moins de positifs) est retenu.
+    """
+    if objective not in ("cost", "f1"):
+        raise ValueError(f"Objectif inconnu : {objective} (attendu : cost, f1)")
+
+    curves = curves if curves is not None else threshold_curves(y_true, y_proba, cost)
+    best = int(np.argmin(curves.cost)) if objective == "cost" else int(np.argmax(curves.f1))
+
+    return replace(base, threshold=float(curves.thresholds[best]))
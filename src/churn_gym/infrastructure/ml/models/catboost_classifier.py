@@ -4,28 +4,38 @@ from __future__ import annotations
 
 import os
 from pathlib import Path
-from typing import List
+from typing import List, Optional, Tuple, Union
 
 import pandas as pd
-import matplotlib.pyplot as plt
 from catboost import CatBoostClassifier, Pool
 
 from churn_gym.domain.interfaces.model_trainer import ModelTrainer
 from churn_gym.domain.interfaces.experiment_tracker import ExperimentTracker
 from churn_gym.domain.entities.feature_vector import FeatureVector
+from churn_gym.domain.entities.feature_batch import FeatureBatch
 from churn_gym.domain.entities.model_artifact import ModelArtifact
 from churn_gym.infrastructure.logging.loguru_logger import LoguruLogger
+from churn_gym.infrastructure.ml.features.feature_frame import to_feature_frame
 from churn_gym.infrastructure.ml.features.features_selection import (
     FEATURES_ALL,
     CATEGORICAL_FEATURES,
-    TARGET_COLUMN,
     NUMERICAL_FEATURES,
 )
+from churn_gym.infrastructure.ml.models.quantized_pool_cache import QuantizedPoolCache
+from churn_gym.infrastructure.ml.pipeline.holdout_split import HoldoutConfig, holdout_split
+from churn_gym.infrastructure.ml.reports.training_reports import (
+    ReportJob,
+    TrainingReportRenderer,
+)
 from churn_gym.infrastructure.utils.config_loader import load_yaml_config
 from churn_gym.infrastructure.utils.root_finder import get_repository_root
 from churn_gym.infrastructure.tracking.run_name_generator import generate_run_name
 
 
+# Early stopping appliqué si la config CatBoost n'en définit pas
+DEFAULT_EARLY_STOPPING_ROUNDS = 50
+
+
 class CatBoostTrainer(ModelTrainer):
     """
     Trainer CatBoost avec tracking MLflow complet.
@@ -35,19 +45,36 @@ class CatBoostTrainer(ModelTrainer):
     - Logging des paramètres, métriques et artefacts
     - Génération des courbes d'entraînement
     - Calcul et visualisation des feature importances
+
+    Les figures sont déléguées à un TrainingReportRenderer (inline par
+    défaut ; parallel / deferred / disabled pour les sweeps) et rendues
+    après la sauvegarde du modèle.
+
+    Avec un QuantizedPoolCache, le Pool d'un snapshot déjà vu est
+    rechargé quantifié au lieu d'être reconstruit.
+
+    Les métriques d'évaluation sont calculées sur un holdout (HoldoutConfig,
+    stratifié par défaut) avec early stopping : l'entraînement s'arrête
+    quand la loss de validation plafonne et le modèle garde la meilleure
+    itération. holdout=None entraîne sur tout le lot, sans eval_set.
     """
 
     def __init__(
         self,
         config: dict,
         tracker: ExperimentTracker,
+        report_renderer: Optional[TrainingReportRenderer] = None,
+        pool_cache: Optional[QuantizedPoolCache] = None,
+        holdout: Optional[HoldoutConfig] = HoldoutConfig(),
     ):
         self.config = config
         self.tracker = tracker
+        self.report_renderer = report_renderer or TrainingReportRenderer("inline")
+        self.pool_cache = pool_cache
+        self.holdout = holdout
         self.logger = LoguruLogger()
 
         self.run_name = generate_run_name("CATB")
-        self.tracker.start_run(run_name=self.run_name)
 
         # Création du dossier d'artefacts
         root = get_repository_root()
@@ -62,103 +89,171 @@ class CatBoostTrainer(ModelTrainer):
     # ------------------------------------------------------------------
     # Training
     # ------------------------------------------------------------------
-    def train(self, features: List[FeatureVector]) -> ModelArtifact:
+    def train(self, features: Union[FeatureBatch, List[FeatureVector]]) -> ModelArtifact:
         self.logger.info("Début de l'entraînement CatBoost")
 
         # =============================
         # Préparation des données
         # =============================
-        df = pd.DataFrame([f.__dict__ for f in features])
+        if not isinstance(features, FeatureBatch):
+            features = FeatureBatch.from_vectors(features)
 
-        y = df[TARGET_COLUMN]
-        X = df[FEATURES_ALL]
+        feature_names = list(FEATURES_ALL)
 
-        self.logger.debug(f"Shape X={X.shape}, y={y.shape}")
-        self.logger.info(f"Nombre de features : {X.shape[1]}")
+        self.logger.debug(f"Shape X=({len(features)}, {len(feature_names)})")
+        self.logger.info(f"Nombre de features : {len(feature_names)}")
 
-        pool = Pool(
-            data=X,
-            label=y,
-            cat_features=CATEGORICAL_FEATURES,
-        )
+        if self.holdout is not None:
+            train_batch, valid_batch = holdout_split(features, self.holdout)
+            self.logger.info(
+                f"Holdout {self.holdout.strategy} : "
+                f"{len(train_batch)} train / {len(valid_batch)} validation"
+            )
+        else:
+            train_batch, valid_batch = features, None
+
+        train_pool, valid_pool = self._build_pools(train_batch, valid_batch, feature_names)
 
         # =============================
         # Modèle
         # =============================
         model = CatBoostClassifier(**self.config)
 
+        fit_params = {}
+        if valid_pool is not None:
+            fit_params = {"eval_set": valid_pool, "use_best_model": True}
+            if not {"early_stopping_rounds", "od_type", "od_wait"} & set(self.config):
+                fit_params["early_stopping_rounds"] = DEFAULT_EARLY_STOPPING_ROUNDS
+
         # =============================
         # Entraînement + Tracking MLflow
         # =============================
+        # Run démarrée ici (et non à l'instanciation) : un trainer peut être
+        # construit pendant qu'une autre run est active (ex: recherche)
+        self.tracker.start_run(run_name=self.run_name)
+
         with self.tracker:
             # 1. Paramètres
             self.tracker.log_params(self.config)
+            if self.holdout is not None:
+                self.tracker.log_params(
+                    {
+                        "holdout_strategy": self.holdout.strategy,
+                        "holdout_fraction": self.holdout.validation_fraction,
+                        "holdout_seed": self.holdout.seed,
+                    }
+                )
 
             # 2. Entraînement
-            model.fit(
-                pool,
-                verbose=100,
-                eval_set=pool,
-                use_best_model=False,
-            )
+            model.fit(train_pool, verbose=100, **fit_params)
 
             # 3. Métriques par itération
             evals_result = model.get_evals_result()
             train_metrics = evals_result.get("learn", {})
+            valid_metrics = evals_result.get("validation", {})
 
             for metric_name, values in train_metrics.items():
-                for step, value in enumerate(values):
-                    self.tracker.log_metrics({metric_name: value})
-
-            # 4. Courbes d'entraînement
-            self._log_training_curves(train_metrics)
-
-            # 5. Feature importances
-            _ = self._log_feature_importances(model, X)
-
-            # 6. Sauvegarde du modèle
+                self.tracker.log_metric_series(metric_name, values)
+            for metric_name, values in valid_metrics.items():
+                self.tracker.log_metric_series(f"val_{metric_name}", values)
+
+            if valid_pool is not None:
+                best_scores = model.get_best_score().get("validation", {})
+                self.tracker.log_metrics(
+                    {
+                        "best_iteration": model.get_best_iteration(),
+                        **{f"best_val_{name}": value for name, value in best_scores.items()},
+                    }
+                )
+
+            # 4. Courbes d'entraînement (rendu selon le mode du renderer)
+            self._submit_training_curves(train_metrics, valid_metrics)
+
+            # 5. Sauvegarde du modèle
             model_path = self.output_models_dir / f"{self.run_name.lower()}_model.cbm"
             model.save_model(model_path)
 
             self.logger.info(f"Modèle sauvegardé : {model_path}")
             self.tracker.log_artifact(str(model_path))
 
+            # 6. Feature importances
+            _ = self._log_feature_importances(model, feature_names)
+
+            # 7. Rapports prêts (inline / parallel)
+            for report_path in self.report_renderer.collect():
+                self.tracker.log_artifact(report_path)
+
         self.logger.info("Entraînement CatBoost terminé")
 
         return ModelArtifact(
             model_path=str(model_path),
             numerical_features=NUMERICAL_FEATURES,
             categorical_features=CATEGORICAL_FEATURES,
-            feature_names=list(X.columns),
+            feature_names=feature_names,
         )
 
     # ------------------------------------------------------------------
     # Utils
     # ------------------------------------------------------------------
-    def _log_training_curves(self, metrics: dict) -> None:
+    def _build_pools(
+        self,
+        train_batch: FeatureBatch,
+        valid_batch: Optional[FeatureBatch],
+        feature_names: List[str],
+    ) -> Tuple[Pool, Optional[Pool]]:
         """
-        Génère et log les courbes d'entraînement dans MLflow.
+        Pool train / validation ; via le cache, la validation est
+        quantifiée avec les bordures du train.
         """
-        for metric_name, values in metrics.items():
-            plt.figure(figsize=(8, 5))
-            plt.plot(values, label=f"train_{metric_name}")
-            plt.xlabel("Iteration")
-            plt.ylabel(metric_name)
-            plt.title(f"Training Curve - {metric_name}")
-            plt.legend()
-            plt.grid(True)
+        if self.pool_cache is not None:
+            train_key = self.pool_cache.ensure(train_batch, feature_names)
+            train_pool = Pool(f"quantized://{self.pool_cache.pool_path(train_key)}")
+            valid_pool = (
+                self.pool_cache.load(valid_batch, feature_names, reference_key=train_key)
+                if valid_batch is not None
+                else None
+            )
+            return train_pool, valid_pool
+
+        def build(batch: FeatureBatch) -> Pool:
+            return Pool(
+                data=to_feature_frame(batch, feature_names),
+                label=batch.churn,
+                cat_features=CATEGORICAL_FEATURES,
+            )
 
+        return build(train_batch), build(valid_batch) if valid_batch is not None else None
+
+    def _submit_training_curves(self, metrics: dict, valid_metrics: dict) -> None:
+        """
+        Soumet une courbe d'entraînement par métrique au renderer
+        (avec la courbe de validation quand elle existe).
+        """
+        for metric_name, values in metrics.items():
             plot_path = self.output_reports_dir / f"{self.run_name.lower()}_training_curve_{metric_name}.png"
-            plt.tight_layout()
-            plt.savefig(plot_path)
-            plt.close()
+            payload = {"metric_name": metric_name, "values": list(values)}
+            if metric_name in valid_metrics:
+                payload["validation_values"] = list(valid_metrics[metric_name])
 
-            self.tracker.log_artifact(str(plot_path))
+            self.report_renderer.submit(
+                ReportJob(kind="training_curve", output_path=str(plot_path), payload=payload)
+            )
+
+    def render_deferred_reports(self) -> List[str]:
+        """
+        Rend les figures mises de côté en mode deferred.
+
+        Le run étant clos, les fichiers sont seulement écrits dans
+        reports_dir (pas de log d'artefact).
+        """
+        paths = self.report_renderer.render_deferred()
+        self.logger.info(f"{len(paths)} rapports différés rendus")
+        return paths
 
     def _log_feature_importances(
         self,
         model: CatBoostClassifier,
-        X: pd.DataFrame,
+        feature_names: List[str],
         top_n: int = 20,
     ) -> pd.DataFrame:
         """
@@ -172,7 +267,7 @@ class CatBoostTrainer(ModelTrainer):
 
         importance_df = pd.DataFrame(
             {
-                "feature": X.columns,
+                "feature": feature_names,
                 "importance": importances,
             }
         ).sort_values("importance", ascending=False)
@@ -185,20 +280,17 @@ class CatBoostTrainer(ModelTrainer):
         # Courbe TOP N
         top_features = importance_df.head(top_n)
 
-        plt.figure(figsize=(10, 6))
-        plt.barh(
-            top_features["feature"][::-1],
-            top_features["importance"][::-1],
-        )
-        plt.xlabel("Importance")
-        plt.title(f"Top {top_n} Feature Importances (CatBoost)")
-        plt.grid(True)
-
         plot_path = self.output_reports_dir / f"{self.run_name.lower()}_feature_importances.png"
-        plt.tight_layout()
-        plt.savefig(plot_path)
-        plt.close()
-
-        self.tracker.log_artifact(str(plot_path))
+        self.report_renderer.submit(
+            ReportJob(
+                kind="feature_importances",
+                output_path=str(plot_path),
+                payload={
+                    "features": top_features["feature"].tolist(),
+                    "importances": top_features["importance"].tolist(),
+                    "top_n": top_n,
+                },
+            )
+        )
 
         return importance_df
@@ -0,0 +1,185 @@
+# src/churn_gym/infrastructure/ml/models/quantized_pool_cache.py
+"""
+Cache disque de Pool CatBoost quantifiés.
+
+Clé = sha256(contenu des features + labels, liste des features,
+paramètres de quantification, clé du pool de référence éventuel).
+Un snapshot déjà vu est rechargé via "quantized://" : ni construction
+du Pool depuis un DataFrame, ni re-quantification.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from catboost import Pool
+
+from churn_gym.domain.entities.feature_batch import FeatureBatch
+from churn_gym.infrastructure.logging.loguru_logger import LoguruLogger
+from churn_gym.infrastructure.ml.features.feature_frame import to_feature_frame
+from churn_gym.infrastructure.ml.features.features_selection import (
+    CATEGORICAL_FEATURES,
+    FEATURES_ALL,
+)
+from churn_gym.infrastructure.utils.config_loader import load_yaml_config
+from churn_gym.infrastructure.utils.root_finder import get_repository_root
+
+
+# À incrémenter si le format des fichiers ou le calcul de la clé change
+_CACHE_VERSION = 1
+
+
+class QuantizedPoolCache:
+    """
+    Cache de Pool quantifiés, partagé entre runs, essais de tuning et folds.
+
+    - `path(batch)` : chemin du Pool quantifié (construit au premier appel)
+    - `load(batch)` : Pool prêt pour fit()
+    - `reference_key` : quantifie avec les bordures d'un pool déjà en cache
+      (ex: validation quantifiée avec les bordures du train)
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        border_count: int = 254,
+        feature_border_type: str = "GreedyLogSum",
+    ):
+        if cache_dir is None:
+            root = get_repository_root()
+            cfg = load_yaml_config(root / "configs/paths.yaml")
+            cache_dir = root / Path(cfg["paths"]["pool_cache_dir"])
+
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.border_count = border_count
+        self.feature_border_type = feature_border_type
+        self.logger = LoguruLogger()
+
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Clés
+    # ------------------------------------------------------------------
+    def key(
+        self,
+        batch: FeatureBatch,
+        feature_names: Sequence[str] = FEATURES_ALL,
+        reference_key: Optional[str] = None,
+    ) -> str:
+        digest = hashlib.sha256()
+        digest.update(
+            json.dumps(
+                {
+                    "version": _CACHE_VERSION,
+                    "features": list(feature_names),
+                    "cat_features": [f for f in feature_names if f in CATEGORICAL_FEATURES],
+                    "border_count": self.border_count,
+                    "feature_border_type": self.feature_border_type,
+                    "reference_key": reference_key,
+                    "rows": len(batch),
+                },
+                sort_keys=True,
+            ).encode()
+        )
+
+        for name in feature_names:
+            digest.update(name.encode())
+            if name in batch.numerical:
+                digest.update(np.ascontiguousarray(batch.numerical[name], dtype=np.float64).tobytes())
+            else:
+                # Hash des valeurs (et non des codes) : indépendant de l'ordre du dictionnaire
+                column = batch.categorical[name]
+                value_hashes = pd.util.hash_array(np.asarray(column.categories, dtype=object))
+                digest.update(np.ascontiguousarray(value_hashes[column.codes]).tobytes())
+
+        digest.update(np.ascontiguousarray(batch.churn, dtype=np.int64).tobytes())
+        return digest.hexdigest()
+
+    def pool_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.quantized"
+
+    def borders_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.borders.tsv"
+
+    # ------------------------------------------------------------------
+    # Accès
+    # ------------------------------------------------------------------
+    def path(
+        self,
+        batch: FeatureBatch,
+        feature_names: Sequence[str] = FEATURES_ALL,
+        reference_key: Optional[str] = None,
+    ) -> Path:
+        return self.pool_path(self.ensure(batch, feature_names, reference_key))
+
+    def load(
+        self,
+        batch: FeatureBatch,
+        feature_names: Sequence[str] = FEATURES_ALL,
+        reference_key: Optional[str] = None,
+    ) -> Pool:
+        return Pool(f"quantized://{self.path(batch, feature_names, reference_key)}")
+
+    def ensure(
+        self,
+        batch: FeatureBatch,
+        feature_names: Sequence[str] = FEATURES_ALL,
+        reference_key: Optional[str] = None,
+    ) -> str:
+        """
+        Garantit la présence du pool en cache et retourne sa clé.
+        """
+        key = self.key(batch, feature_names, reference_key)
+
+        with self._lock:
+            if self.pool_path(key).exists():
+                self.logger.debug(f"Pool quantifié en cache : {key[:12]}")
+                return key
+
+            if reference_key is not None and not self.borders_path(reference_key).exists():
+                raise FileNotFoundError(
+                    f"Bordures du pool de référence absentes du cache : {reference_key}"
+                )
+
+            self._build(key, batch, feature_names, reference_key)
+            return key
+
+    def _build(
+        self,
+        key: str,
+        batch: FeatureBatch,
+        feature_names: Sequence[str],
+        reference_key: Optional[str],
+    ) -> None:
+        pool = Pool(
+            data=to_feature_frame(batch, feature_names),
+            label=batch.churn,
+            cat_features=[f for f in feature_names if f in CATEGORICAL_FEATURES],
+        )
+
+        if reference_key is None:
+            pool.quantize(
+                border_count=self.border_count,
+                feature_border_type=self.feature_border_type,
+            )
+            _atomic_write(self.borders_path(key), pool.save_quantization_borders)
+        else:
+            pool.quantize(input_borders=str(self.borders_path(reference_key)))
+
+        _atomic_write(self.pool_path(key), pool.save)
+        self.logger.info(f"Pool quantifié mis en cache : {key[:12]} ({len(batch)} lignes)")
+
+
+def _atomic_write(path: Path, writer) -> None:
+    # Écriture dans un fichier temporaire puis renommage : un lecteur
+    # concurrent ne voit jamais de fichier partiel
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    writer(str(tmp_path))
+    os.replace(tmp_path, path)
@@ -0,0 +1,233 @@
+# src/churn_gym/infrastructure/ml/pipeline/cross_validation.py
+"""
+Validation croisée k-fold stratifiée, folds entraînés en parallèle.
+
+- Folds stratifiés sur la target (même taux de churn dans chaque fold)
+- Un processus par fold, thread_count = cœurs // workers
+- Pool d'entraînement de chaque fold servi par le QuantizedPoolCache
+- Métriques vectorisées (classification_metrics), agrégées (moyenne / écart-type)
+  puis loggées en un seul appel au tracker
+"""
+from __future__ import annotations
+
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional
+
+import numpy as np
+from catboost import CatBoostClassifier, Pool
+
+from churn_gym.domain.entities.feature_batch import FeatureBatch
+from churn_gym.domain.interfaces.experiment_tracker import ExperimentTracker
+from churn_gym.infrastructure.logging.loguru_logger import LoguruLogger
+from churn_gym.infrastructure.ml.features.feature_frame import to_feature_frame
+from churn_gym.infrastructure.ml.features.features_selection import FEATURES_ALL
+from churn_gym.infrastructure.ml.metrics.classification_metrics import classification_metrics
+from churn_gym.infrastructure.ml.models.quantized_pool_cache import QuantizedPoolCache
+from churn_gym.infrastructure.tracking.run_name_generator import generate_run_name
+
+
+def stratified_kfold_indices(y: np.ndarray, n_splits: int, seed: int = 42) -> List[np.ndarray]:
+    """
+    Indices (triés) de validation de chaque fold : les lignes de chaque
+    classe sont mélangées puis distribuées en round-robin sur les folds.
+    """
+    if n_splits < 2:
+        raise ValueError("n_splits doit être >= 2.")
+
+    y = np.asarray(y)
+    rng = np.random.default_rng(seed)
+    fold_of = np.empty(len(y), dtype=np.int64)
+
+    offset = 0
+    for label in np.unique(y):
+        members = rng.permutation(np.flatnonzero(y == label))
+        if len(members) < n_splits:
+            raise ValueError(
+                f"Classe {label} : {len(members)} lignes pour {n_splits} folds."
+            )
+        # Décalage entre classes : les folds gardent des tailles équilibrées
+        fold_of[members] = (np.arange(len(members)) + offset) % n_splits
+        offset += len(members)
+
+    return [np.flatnonzero(fold_of == k) for k in range(n_splits)]
+
+
+@dataclass(frozen=True)
+class FoldResult:
+    fold: int
+    train_rows: int
+    valid_rows: int
+    metrics: Dict[str, float]
+    seconds: float
+
+
+@dataclass
+class CrossValidationResult:
+    folds: List[FoldResult] = field(default_factory=list)
+
+    @property
+    def mean(self) -> Dict[str, float]:
+        return {name: float(np.mean(values)) for name, values in self._by_metric().items()}
+
+    @property
+    def std(self) -> Dict[str, float]:
+        return {name: float(np.std(values, ddof=1)) for name, values in self._by_metric().items()}
+
+    def as_metrics(self) -> Dict[str, float]:
+        """
+        Vue à plat pour le tracker : cv_<metric>_mean / _std et cv_fold<k>_<metric>.
+        """
+        flat: Dict[str, float] = {}
+        for name, value in self.mean.items():
+            flat[f"cv_{name}_mean"] = value
+        for name, value in self.std.items():
+            flat[f"cv_{name}_std"] = value
+        for fold in self.folds:
+            for name, value in fold.metrics.items():
+                flat[f"cv_fold{fold.fold}_{name}"] = value
+        return flat
+
+    def _by_metric(self) -> Dict[str, np.ndarray]:
+        names = self.folds[0].metrics if self.folds else {}
+        return {name: np.array([f.metrics[name] for f in self.folds]) for name in names}
+
+
+# ======================================================================
+# Worker (lot complet reçu une fois par processus)
+# ======================================================================
+_features: Optional[FeatureBatch] = None
+
+
+def _init_fold_worker(features: FeatureBatch) -> None:
+    global _features
+    _features = features
+
+
+def _run_fold(
+    fold: int,
+    train_pool_path: str,
+    valid_idx: np.ndarray,
+    params: Mapping[str, Any],
+    thread_count: int,
+    threshold: float,
+) -> FoldResult:
+    start = time.perf_counter()
+
+    train_pool = Pool(f"quantized://{train_pool_path}")
+    model = CatBoostClassifier(
+        **params,
+        thread_count=thread_count,
+        allow_writing_files=False,
+        verbose=False,
+    )
+    model.fit(train_pool)
+
+    valid = _features.take(valid_idx)
+    proba = model.predict_proba(to_feature_frame(valid, FEATURES_ALL))[:, 1]
+
+    return FoldResult(
+        fold=fold,
+        train_rows=train_pool.num_row(),
+        valid_rows=len(valid),
+        metrics=classification_metrics(valid.churn, proba, threshold),
+        seconds=time.perf_counter() - start,
+    )
+
+
+# ======================================================================
+# Driver
+# ======================================================================
+class CrossValidator:
+    """
+    Évaluation k-fold d'une config CatBoost.
+
+    Usage :
+        result = CrossValidator(catboost_config, n_splits=5).run(features, tracker)
+        result.mean["roc_auc"], result.std["roc_auc"]
+    """
+
+    def __init__(
+        self,
+        config: Mapping[str, Any],
+        n_splits: int = 5,
+        max_workers: Optional[int] = None,
+        total_threads: Optional[int] = None,
+        threshold: float = 0.5,
+        seed: int = 42,
+        pool_cache: Optional[QuantizedPoolCache] = None,
+    ):
+        reserved = {"thread_count", "verbose", "allow_writing_files"}
+        self.params = {k: v for k, v in config.items() if k not in reserved}
+
+        self.n_splits = n_splits
+        self.total_threads = total_threads or os.cpu_count() or 1
+        self.max_workers = max_workers or min(n_splits, self.total_threads)
+        self.threshold = threshold
+        self.seed = seed
+        self.pool_cache = pool_cache
+        self.logger = LoguruLogger()
+
+    def run(
+        self,
+        features: FeatureBatch,
+        tracker: Optional[ExperimentTracker] = None,
+    ) -> CrossValidationResult:
+        folds = stratified_kfold_indices(features.churn, self.n_splits, self.seed)
+        thread_count = max(1, self.total_threads // self.max_workers)
+
+        self.logger.info(
+            f"Validation croisée : {self.n_splits} folds, "
+            f"{self.max_workers} workers x {thread_count} threads"
+        )
+
+        with tempfile.TemporaryDirectory(prefix="churn_gym_cv_") as tmp:
+            cache = self.pool_cache or QuantizedPoolCache(Path(tmp))
+            train_paths = [
+                str(cache.path(features.take(np.setdiff1d(np.arange(len(features)), valid_idx))))
+                for valid_idx in folds
+            ]
+
+            with ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_init_fold_worker,
+                initargs=(features,),
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        _run_fold, k, train_paths[k], valid_idx, self.params, thread_count, self.threshold
+                    )
+                    for k, valid_idx in enumerate(folds)
+                ]
+                result = CrossValidationResult(folds=[f.result() for f in futures])
+
+        for fold in result.folds:
+            self.logger.debug(f"Fold {fold.fold} : {fold.metrics} en {fold.seconds:.1f}s")
+        self.logger.info(
+            "Validation croisée terminée : "
+            + ", ".join(
+                f"{name}={result.mean[name]:.4f}±{result.std[name]:.4f}" for name in result.mean
+            )
+        )
+
+        if tracker is not None:
+            self._log(result, tracker)
+        return result
+
+    def _log(self, result: CrossValidationResult, tracker: ExperimentTracker) -> None:
+        tracker.start_run(run_name=generate_run_name("CV"))
+        with tracker:
+            tracker.log_params(
+                {
+                    **self.params,
+                    "cv_n_splits": self.n_splits,
+                    "cv_seed": self.seed,
+                    "cv_threshold": self.threshold,
+                }
+            )
+            # Un seul envoi pour toutes les métriques de tous les folds
+            tracker.log_metrics(result.as_metrics())
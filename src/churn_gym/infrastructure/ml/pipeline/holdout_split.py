@@ -0,0 +1,80 @@
+# src/churn_gym/infrastructure/ml/pipeline/holdout_split.py
+"""
+Découpage train / validation d'un FeatureBatch.
+
+Stratégies :
+- stratified  : tirage aléatoire par classe (même taux de churn des deux côtés)
+- time        : les visites les plus récentes en validation. FeatureBatch ne
+                porte plus last_visit_date : l'ordre est donné par
+                days_since_last_visit (= today - last_visit_date), équivalent
+                à date de référence fixée ; dates manquantes côté train
+- member_hash : hash de member_id, stable d'un snapshot à l'autre
+                (un membre reste toujours du même côté)
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+
+from churn_gym.domain.entities.feature_batch import FeatureBatch
+
+
+SPLIT_STRATEGIES = ("stratified", "time", "member_hash")
+
+# Résolution du tirage par hash (fraction arrondie au 1/10 000)
+_HASH_BUCKETS = 10_000
+
+
+@dataclass(frozen=True)
+class HoldoutConfig:
+    strategy: str = "stratified"
+    validation_fraction: float = 0.2
+    seed: int = 42
+
+    def __post_init__(self):
+        if self.strategy not in SPLIT_STRATEGIES:
+            raise ValueError(
+                f"Stratégie de split inconnue : {self.strategy} (attendu : {SPLIT_STRATEGIES})"
+            )
+        if not 0.0 < self.validation_fraction < 1.0:
+            raise ValueError("validation_fraction doit être dans ]0, 1[.")
+
+
+def holdout_indices(batch: FeatureBatch, config: HoldoutConfig) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Indices (triés) des lignes train et validation.
+    """
+    n = len(batch)
+
+    if config.strategy == "stratified":
+        rng = np.random.default_rng(config.seed)
+        is_valid = np.zeros(n, dtype=bool)
+        for label in np.unique(batch.churn):
+            members = np.flatnonzero(batch.churn == label)
+            n_valid = int(round(len(members) * config.validation_fraction))
+            is_valid[rng.permutation(members)[:n_valid]] = True
+
+    elif config.strategy == "time":
+        # Tri croissant de l'ancienneté de la dernière visite (NaN en dernier)
+        order = np.argsort(batch.numerical["days_since_last_visit"], kind="stable")
+        is_valid = np.zeros(n, dtype=bool)
+        is_valid[order[: int(round(n * config.validation_fraction))]] = True
+
+    else:
+        hash_key = f"{config.seed:016d}"[-16:]
+        hashes = pd.util.hash_array(np.asarray(batch.member_id, dtype=object), hash_key=hash_key)
+        is_valid = (hashes % _HASH_BUCKETS) < config.validation_fraction * _HASH_BUCKETS
+
+    return np.flatnonzero(~is_valid), np.flatnonzero(is_valid)
+
+
+def holdout_split(batch: FeatureBatch, config: HoldoutConfig) -> Tuple[FeatureBatch, FeatureBatch]:
+    train_idx, valid_idx = holdout_indices(batch, config)
+    if not len(train_idx) or not len(valid_idx):
+        raise ValueError(
+            f"Split {config.strategy} dégénéré : {len(train_idx)} train / {len(valid_idx)} validation."
+        )
+    return batch.take(train_idx), batch.take(valid_idx)
@@ -1,19 +1,25 @@
 # src/churn_gym/infrastructure/ml/predict//catboost_predictor.py
 import numpy as np
-import pandas as pd
 from typing import Union
-from catboost import CatBoostClassifier
 from churn_gym.domain.entities.feature_vector import FeatureVector
+from churn_gym.domain.entities.feature_batch import FeatureBatch
 from churn_gym.domain.interfaces.model_predictor import ModelPredictor
-from churn_gym.infrastructure.ml.features.features_selection import FEATURES_ALL, TARGET_COLUMN, CATEGORICAL_FEATURES
+from churn_gym.infrastructure.ml.features.feature_frame import to_feature_frame
+from churn_gym.infrastructure.ml.features.features_selection import FEATURES_ALL
+from churn_gym.infrastructure.ml.predict.model_cache import load_catboost_model
 from pathlib import Path
 class CatBoostPredictor(ModelPredictor):
 
-    def __init__(self, model_path: Union[str, Path]):  # categorical_features: list[str]
-        self.model = CatBoostClassifier()
-        self.model.load_model(Path(model_path))
+    def __init__(self, model_path: Union[str, Path], thread_count: int = -1):  # categorical_features: list[str]
+        # Modèle partagé au niveau du process (rechargé si le fichier change)
+        self.model = load_catboost_model(model_path)
+        self.thread_count = thread_count
 
-    def score(self, features: list[FeatureVector]) -> list[float]:
-        df = pd.DataFrame([f.__dict__ for f in features])
-        probs = self.model.predict_proba(df[FEATURES_ALL])[:, 1]
-        return [float(p) for p in probs]
+    def score(self, features: Union[FeatureBatch, list[FeatureVector]]) -> list[float]:
+        if not isinstance(features, FeatureBatch):
+            features = FeatureBatch.from_vectors(features)
+        return self.score_batch(features).tolist()
+
+    def score_batch(self, batch: FeatureBatch) -> np.ndarray:
+        X = to_feature_frame(batch, FEATURES_ALL)
+        return self.model.predict_proba(X, thread_count=self.thread_count)[:, 1]
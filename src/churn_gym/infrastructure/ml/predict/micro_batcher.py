@@ -0,0 +1,222 @@
+# src/churn_gym/infrastructure/ml/predict/micro_batcher.py
+"""
+Coalescence asynchrone des requêtes de scoring en ligne.
+
+Les requêtes concurrentes sont regroupées pendant au plus `max_wait_ms`
+(ou jusqu'à `max_batch_size` lignes), scorées en un seul appel
+predict_proba, puis les résultats sont redistribués à chaque appelant.
+
+Le prédicteur peut être fourni directement (modèle figé) ou via une
+fonction appelée à chaque micro-lot (ex: résolution par le cache de
+modèles, pour suivre un rechargement du .cbm).
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Union
+
+import numpy as np
+
+from churn_gym.domain.entities.feature_batch import FeatureBatch
+from churn_gym.domain.interfaces.model_predictor import ModelPredictor
+from churn_gym.infrastructure.logging.loguru_logger import LoguruLogger
+
+
+@dataclass(frozen=True)
+class MicroBatchConfig:
+    max_batch_size: int = 256    # lignes max par appel au modèle
+    max_wait_ms: float = 3.0     # attente max après la première requête
+
+
+@dataclass
+class MicroBatchStats:
+    """
+    Métriques cumulées du coalesceur.
+    """
+
+    max_batch_size: int
+    batches: int = 0
+    requests: int = 0
+    rows: int = 0
+    total_queue_delay_s: float = 0.0
+    max_queue_delay_s: float = 0.0
+
+    @property
+    def mean_fill_ratio(self) -> float:
+        """Remplissage moyen des lots (rows / max_batch_size), plafonné à 1."""
+        if not self.batches:
+            return 0.0
+        return min(1.0, self.rows / (self.batches * self.max_batch_size))
+
+    @property
+    def mean_queue_delay_ms(self) -> float:
+        if not self.requests:
+            return 0.0
+        return self.total_queue_delay_s / self.requests * 1000
+
+    def as_dict(self) -> dict:
+        return {
+            "batches": self.batches,
+            "requests": self.requests,
+            "rows": self.rows,
+            "mean_fill_ratio": round(self.mean_fill_ratio, 4),
+            "mean_queue_delay_ms": round(self.mean_queue_delay_ms, 3),
+            "max_queue_delay_ms": round(self.max_queue_delay_s * 1000, 3),
+        }
+
+
+@dataclass
+class _PendingRequest:
+    batch: FeatureBatch
+    future: asyncio.Future
+    enqueued_at: float = field(default_factory=time.perf_counter)
+
+
+class MicroBatchingPredictor:
+    """
+    Façade asynchrone devant un ModelPredictor.
+
+    Responsabilités :
+    - Mettre en file les requêtes de scoring concurrentes
+    - Former des lots (taille max / attente max)
+    - Scorer chaque lot hors de la boucle asyncio (thread executor)
+    - Redistribuer les probabilités et tenir les métriques de remplissage
+    """
+
+    def __init__(
+        self,
+        predictor: Union[ModelPredictor, Callable[[], ModelPredictor]],
+        config: MicroBatchConfig = MicroBatchConfig(),
+    ):
+        if config.max_batch_size <= 0:
+            raise ValueError("max_batch_size doit être strictement positif.")
+
+        self.predictor = predictor
+        self.config = config
+        self.stats = MicroBatchStats(max_batch_size=config.max_batch_size)
+        self.logger = LoguruLogger()
+
+        self._queue: Optional[asyncio.Queue[_PendingRequest]] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._in_flight: List[_PendingRequest] = []
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+    async def start(self) -> None:
+        if self._worker is not None:
+            return
+        self._queue = asyncio.Queue()
+        self._worker = asyncio.create_task(self._run())
+        self.logger.info(
+            "Micro-batching démarré",
+            max_batch_size=self.config.max_batch_size,
+            max_wait_ms=self.config.max_wait_ms,
+        )
+
+    async def stop(self) -> None:
+        if self._worker is None:
+            return
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
+
+        # Requêtes encore en file : on les libère plutôt que de les laisser pendantes
+        # (celles du lot en cours sont libérées par _run à l'annulation)
+        remaining = []
+        while not self._queue.empty():
+            remaining.append(self._queue.get_nowait())
+        self._fail(remaining, RuntimeError("MicroBatchingPredictor arrêté."))
+        self._queue = None
+
+        self.logger.info("Micro-batching arrêté", **self.stats.as_dict())
+
+    # ------------------------------------------------------------------
+    # Scoring
+    # ------------------------------------------------------------------
+    async def score(self, batch: FeatureBatch) -> np.ndarray:
+        """
+        Probabilités de churn pour `batch`, scorées avec les requêtes concurrentes.
+        """
+        if self._queue is None or self._worker is None:
+            raise RuntimeError("MicroBatchingPredictor non démarré ou arrêté (appeler start()).")
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put(_PendingRequest(batch=batch, future=future))
+        return await future
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+
+        while True:
+            try:
+                await self._collect()
+                merged = FeatureBatch.concat([p.batch for p in self._in_flight])
+
+                self._record(self._in_flight, time.perf_counter(), len(merged))
+                probs = await loop.run_in_executor(None, self._score, merged)
+
+                offset = 0
+                for p in self._in_flight:
+                    size = len(p.batch)
+                    if not p.future.done():
+                        p.future.set_result(probs[offset:offset + size])
+                    offset += size
+            except asyncio.CancelledError:
+                self._fail(self._in_flight, RuntimeError("MicroBatchingPredictor arrêté."))
+                raise
+            except Exception as exc:
+                # Le worker survit à l'échec d'un lot : seules ses requêtes échouent
+                self.logger.error(f"Échec du scoring d'un micro-lot : {exc!r}")
+                self._fail(self._in_flight, exc)
+            finally:
+                self._in_flight = []
+
+    def _score(self, batch: FeatureBatch) -> np.ndarray:
+        # Exécuté dans l'executor : la résolution du prédicteur peut recharger le modèle
+        predictor = self.predictor if isinstance(self.predictor, ModelPredictor) else self.predictor()
+        return predictor.score_batch(batch)
+
+    @staticmethod
+    def _fail(pending: List[_PendingRequest], exc: BaseException) -> None:
+        for p in pending:
+            if not p.future.done():
+                p.future.set_exception(exc)
+
+    async def _collect(self) -> None:
+        """
+        Attend une première requête puis complète le lot (`_in_flight`)
+        jusqu'à max_batch_size lignes ou max_wait_ms.
+
+        Chaque requête sortie de la file est ajoutée à `_in_flight` aussitôt :
+        une annulation pendant la collecte ne perd aucune requête.
+        """
+        first = await self._queue.get()
+        self._in_flight.append(first)
+        rows = len(first.batch)
+
+        deadline = time.perf_counter() + self.config.max_wait_ms / 1000
+        while rows < self.config.max_batch_size:
+            timeout = deadline - time.perf_counter()
+            if timeout <= 0:
+                break
+            try:
+                nxt = await asyncio.wait_for(self._queue.get(), timeout)
+            except asyncio.TimeoutError:
+                break
+            self._in_flight.append(nxt)
+            rows += len(nxt.batch)
+
+    def _record(self, pending: List[_PendingRequest], started: float, rows: int) -> None:
+        self.stats.batches += 1
+        self.stats.requests += len(pending)
+        self.stats.rows += rows
+        for p in pending:
+            delay = started - p.enqueued_at
+            self.stats.total_queue_delay_s += delay
+            self.stats.max_queue_delay_s = max(self.stats.max_queue_delay_s, delay)
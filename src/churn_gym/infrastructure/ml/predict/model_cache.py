@@ -0,0 +1,70 @@
+# src/churn_gym/infrastructure/ml/predict/model_cache.py
+"""
+Cache process-wide des modèles CatBoost chargés.
+
+Clé : (chemin absolu, mtime du fichier). Un modèle déjà chargé est
+réutilisé tant que le fichier .cbm n'a pas été modifié ; une nouvelle
+version du fichier déclenche un rechargement.
+"""
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Tuple, Union
+
+from catboost import CatBoostClassifier
+
+from churn_gym.infrastructure.logging.loguru_logger import LoguruLogger
+from churn_gym.infrastructure.utils.exceptions import ModelLoadingError
+
+
+_CacheKey = Tuple[str, int]
+
+_models: Dict[_CacheKey, CatBoostClassifier] = {}
+_lock = threading.Lock()
+_logger = LoguruLogger()
+
+
+def load_catboost_model(model_path: Union[str, Path]) -> CatBoostClassifier:
+    """
+    Retourne le modèle CatBoost du fichier `model_path`, depuis le cache
+    si le fichier n'a pas changé depuis le dernier chargement.
+
+    Raises
+    ------
+    ModelLoadingError
+        Si le fichier est introuvable ou ne peut pas être chargé.
+    """
+    path = Path(model_path).resolve()
+
+    try:
+        key = (str(path), os.stat(path).st_mtime_ns)
+    except OSError as exc:
+        raise ModelLoadingError(f"Modèle introuvable : {path}") from exc
+
+    model = _models.get(key)
+    if model is not None:
+        return model
+
+    with _lock:
+        model = _models.get(key)
+        if model is not None:
+            return model
+
+        _logger.info(f"Chargement du modèle CatBoost : {path}")
+        model = CatBoostClassifier()
+        try:
+            model.load_model(str(path))
+        except Exception as exc:
+            raise ModelLoadingError(f"Impossible de charger le modèle : {path}") from exc
+
+        # Une seule version par fichier : on évince les anciennes
+        for stale in [k for k in _models if k[0] == key[0]]:
+            del _models[stale]
+        _models[key] = model
+
+    return model
+
+
+def clear_model_cache() -> None:
+    with _lock:
+        _models.clear()
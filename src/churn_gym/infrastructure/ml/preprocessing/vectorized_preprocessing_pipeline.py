@@ -0,0 +1,80 @@
+# src/churn_gym/infrastructure/ml/preprocessing/vectorized_preprocessing_pipeline.py
+from typing import Iterable, Union
+
+import numpy as np
+import pandas as pd
+
+from churn_gym.domain.interfaces.preprocessing_pipeline import PreprocessingPipeline
+from churn_gym.domain.entities.raw_member_record import RawMemberRecord
+from churn_gym.domain.entities.raw_member_batch import RawMemberBatch
+from churn_gym.domain.entities.member_record import MemberRecord
+from churn_gym.domain.entities.member_batch import MemberBatch
+
+
+UNKNOWN_CATEGORY = "UNKNOWN"
+
+
+class VectorizedPreprocessingPipeline(PreprocessingPipeline):
+    """
+    Same rules as RobustPreprocessingPipeline, applied to whole columns.
+
+    Responsibilities:
+    - Cast numerical columns to float64 (missing -> NaN)
+    - Normalize categorical columns (strip / lower, blank -> "UNKNOWN")
+    - Normalize target ("yes" -> 1, other -> 0, missing -> NaN)
+    - Keep dates as-is
+    """
+
+    def run(
+        self, raw_records: Union[RawMemberBatch, Iterable[RawMemberRecord]]
+    ) -> list[MemberRecord]:
+        if not isinstance(raw_records, RawMemberBatch):
+            raw_records = RawMemberBatch.from_records(raw_records)
+        return self.run_batch(raw_records).to_records()
+
+    def run_batch(self, batch: RawMemberBatch) -> MemberBatch:
+        return MemberBatch(
+            member_id=pd.Series(batch.member_id, dtype=object).astype(str).to_numpy(dtype=object),
+            age=self._to_float(batch.age),
+            gender=self._normalize_category(batch.gender, lower=True),
+            membership_type=self._normalize_category(batch.membership_type),
+            join_date=batch.join_date.astype("datetime64[D]"),
+            last_visit_date=batch.last_visit_date.astype("datetime64[D]"),
+            favorite_exercise=self._normalize_category(batch.favorite_exercise),
+            avg_workout_duration_min=self._to_float(batch.avg_workout_duration_min),
+            avg_calories_burned=self._to_float(batch.avg_calories_burned),
+            total_weight_lifted_kg=self._to_float(batch.total_weight_lifted_kg),
+            visits_per_month=self._to_float(batch.visits_per_month),
+            churn=self._normalize_target(batch.churn),
+        )
+
+    # ------------------------------------------------------------------
+    # Column kernels
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _to_float(values: np.ndarray) -> np.ndarray:
+        return np.array(values, dtype=np.float64)
+
+    @staticmethod
+    def _normalize_category(values: np.ndarray, lower: bool = False) -> np.ndarray:
+        series = pd.Series(values, dtype=object)
+        missing = (series.isna() | (series == "")).to_numpy()
+
+        normalized = series.astype(str).str.strip()
+        if lower:
+            normalized = normalized.str.lower()
+
+        out = normalized.to_numpy(dtype=object)
+        out[missing] = UNKNOWN_CATEGORY
+        return out
+
+    @staticmethod
+    def _normalize_target(values: np.ndarray) -> np.ndarray:
+        series = pd.Series(values, dtype=object)
+        missing = series.isna().to_numpy()
+
+        is_yes = (series.astype(str).str.strip().str.lower() == "yes").to_numpy()
+
+        churn = is_yes.astype(np.float64)
+        churn[missing] = np.nan
+        return churn
@@ -0,0 +1,179 @@
+# src/churn_gym/infrastructure/ml/reports/training_reports.py
+"""
+Rendu des rapports graphiques d'entraînement, hors du chemin critique.
+
+Les figures sont construites avec l'API objet de matplotlib (Figure +
+canvas Agg), sans état global pyplot : le rendu est sûr dans un thread
+ou un processus worker.
+"""
+from __future__ import annotations
+
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from churn_gym.infrastructure.logging.loguru_logger import LoguruLogger
+
+
+# inline   : rendu immédiat dans le thread appelant
+# parallel : rendu dans un pool de processus, collecté en fin de run
+# deferred : jobs conservés, rendus à la demande (render_deferred)
+# disabled : aucun rendu
+REPORT_MODES = ("inline", "parallel", "deferred", "disabled")
+
+
+# ======================================================================
+# Figures
+# ======================================================================
+def render_training_curve(
+    output_path: str,
+    metric_name: str,
+    values: Sequence[float],
+    validation_values: Optional[Sequence[float]] = None,
+) -> str:
+    fig = Figure(figsize=(8, 5))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+
+    ax.plot(values, label=f"train_{metric_name}")
+    if validation_values is not None:
+        ax.plot(validation_values, label=f"val_{metric_name}")
+    ax.set_xlabel("Iteration")
+    ax.set_ylabel(metric_name)
+    ax.set_title(f"Training Curve - {metric_name}")
+    ax.legend()
+    ax.grid(True)
+
+    fig.tight_layout()
+    fig.savefig(output_path)
+    return output_path
+
+
+def render_feature_importances(
+    output_path: str,
+    features: Sequence[str],
+    importances: Sequence[float],
+    top_n: int = 20,
+) -> str:
+    """
+    `features` / `importances` sont supposés triés par importance décroissante.
+    """
+    features = list(features)[:top_n]
+    importances = np.asarray(importances)[:top_n]
+
+    fig = Figure(figsize=(10, 6))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+
+    ax.barh(features[::-1], importances[::-1])
+    ax.set_xlabel("Importance")
+    ax.set_title(f"Top {top_n} Feature Importances (CatBoost)")
+    ax.grid(True)
+
+    fig.tight_layout()
+    fig.savefig(output_path)
+    return output_path
+
+
+_RENDERERS: Dict[str, Callable[..., str]] = {
+    "training_curve": render_training_curve,
+    "feature_importances": render_feature_importances,
+}
+
+
+@dataclass(frozen=True)
+class ReportJob:
+    """
+    Description sérialisable d'une figure à produire.
+    """
+
+    kind: str                   # clé de _RENDERERS
+    output_path: str
+    payload: Mapping[str, Any]
+
+    def __post_init__(self):
+        if self.kind not in _RENDERERS:
+            raise ValueError(f"Type de rapport inconnu : {self.kind}")
+
+
+def run_report_job(job: ReportJob) -> str:
+    return _RENDERERS[job.kind](job.output_path, **job.payload)
+
+
+# ======================================================================
+# Ordonnancement
+# ======================================================================
+class TrainingReportRenderer:
+    """
+    Exécute les ReportJob selon un mode de REPORT_MODES.
+
+    Usage côté trainer :
+        renderer.submit(job)        # autant de fois que nécessaire
+        paths = renderer.collect()  # fichiers prêts à être loggés
+
+    Le pool de processus (mode parallel) est créé à la première
+    soumission et réutilisé d'un entraînement à l'autre ; close() le libère.
+    """
+
+    def __init__(self, mode: str = "inline", max_workers: Optional[int] = None):
+        if mode not in REPORT_MODES:
+            raise ValueError(f"Mode de rendu inconnu : {mode} (attendu : {REPORT_MODES})")
+
+        self.mode = mode
+        self.max_workers = max_workers
+        self.logger = LoguruLogger()
+
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._futures: List[Future] = []
+        self._rendered: List[str] = []
+        self._deferred: List[ReportJob] = []
+
+    def submit(self, job: ReportJob) -> None:
+        if self.mode == "disabled":
+            return
+        if self.mode == "deferred":
+            self._deferred.append(job)
+        elif self.mode == "parallel":
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            self._futures.append(self._executor.submit(run_report_job, job))
+        else:
+            self._rendered.append(run_report_job(job))
+
+    def collect(self) -> List[str]:
+        """
+        Chemins des figures rendues depuis le dernier appel
+        (attend la fin des rendus parallèles).
+        """
+        futures, self._futures = self._futures, []
+        paths, self._rendered = self._rendered, []
+
+        for future in futures:
+            try:
+                paths.append(future.result())
+            except Exception as exc:
+                # Un rapport raté ne doit pas faire échouer l'entraînement
+                self.logger.error(f"Échec du rendu d'un rapport : {exc!r}")
+
+        return paths
+
+    @property
+    def pending_deferred(self) -> int:
+        return len(self._deferred)
+
+    def render_deferred(self) -> List[str]:
+        """
+        Rend les jobs différés (mode deferred) et retourne les chemins produits.
+        """
+        jobs, self._deferred = self._deferred, []
+        return [run_report_job(job) for job in jobs]
+
+    def close(self) -> None:
+        self.collect()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
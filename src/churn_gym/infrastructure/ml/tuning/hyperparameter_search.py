@@ -0,0 +1,366 @@
+# src/churn_gym/infrastructure/ml/tuning/hyperparameter_search.py
+"""
+Recherche d'hyperparamètres CatBoost (grille, aléatoire, successive halving).
+
+- Les essais tournent dans un pool de processus ; chaque worker charge une
+  seule fois les Pool quantifiés (train / validation) du QuantizedPoolCache.
+- thread_count par essai = cœurs disponibles // workers (pas de sursouscription).
+- Chaque essai est loggé comme run enfant de la run de recherche.
+- Les essais médiocres sont arrêtés tôt : overfitting detector CatBoost
+  (early_stopping_rounds) et, en successive halving, élimination par palier.
+"""
+from __future__ import annotations
+
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from catboost import CatBoostClassifier, Pool
+
+from churn_gym.domain.entities.feature_batch import FeatureBatch
+from churn_gym.domain.interfaces.experiment_tracker import ExperimentTracker
+from churn_gym.infrastructure.logging.loguru_logger import LoguruLogger
+from churn_gym.infrastructure.ml.features.features_selection import FEATURES_ALL
+from churn_gym.infrastructure.ml.models.quantized_pool_cache import QuantizedPoolCache
+from churn_gym.infrastructure.ml.pipeline.holdout_split import HoldoutConfig, holdout_split
+from churn_gym.infrastructure.ml.tuning.search_space import (
+    SearchSpace,
+    grid_configs,
+    random_configs,
+)
+from churn_gym.infrastructure.tracking.run_name_generator import generate_run_name
+
+
+# Métriques CatBoost à maximiser (les autres sont des pertes)
+_MAXIMIZED_METRICS = {"AUC", "PRAUC", "F1", "Accuracy", "Precision", "Recall", "BalancedAccuracy", "MCC"}
+
+
+@dataclass(frozen=True)
+class TrialSpec:
+    trial_id: int
+    params: Mapping[str, Any]
+    iterations: int
+    thread_count: int
+    eval_metric: str
+    early_stopping_rounds: Optional[int]
+    rung: int = 0
+
+
+@dataclass(frozen=True)
+class TrialResult:
+    trial_id: int
+    params: Dict[str, Any]
+    iterations: int
+    rung: int
+    score: float
+    best_iteration: int
+    stopped_early: bool
+    seconds: float
+
+
+@dataclass
+class SearchResult:
+    best: TrialResult
+    trials: List[TrialResult] = field(default_factory=list)
+
+    def best_config(self, base_params: Mapping[str, Any]) -> Dict[str, Any]:
+        """
+        Config complète à passer à CatBoostTrainer pour le réentraînement final
+        (nombre d'arbres = meilleure itération de l'essai).
+        """
+        return {**base_params, **self.best.params, "iterations": self.best.best_iteration + 1}
+
+
+# ======================================================================
+# Worker (Pool quantifiés chargés une fois par processus)
+# ======================================================================
+_train_pool: Optional[Pool] = None
+_valid_pool: Optional[Pool] = None
+
+
+def _init_trial_worker(train_path: str, valid_path: str) -> None:
+    global _train_pool, _valid_pool
+    _train_pool = Pool(f"quantized://{train_path}")
+    _valid_pool = Pool(f"quantized://{valid_path}")
+
+
+def _run_trial(spec: TrialSpec) -> TrialResult:
+    start = time.perf_counter()
+
+    model = CatBoostClassifier(
+        **spec.params,
+        iterations=spec.iterations,
+        eval_metric=spec.eval_metric,
+        thread_count=spec.thread_count,
+        allow_writing_files=False,
+        verbose=False,
+    )
+    model.fit(
+        _train_pool,
+        eval_set=_valid_pool,
+        use_best_model=True,
+        early_stopping_rounds=spec.early_stopping_rounds,
+    )
+
+    curve = model.get_evals_result()["validation"][spec.eval_metric]
+    return TrialResult(
+        trial_id=spec.trial_id,
+        params=dict(spec.params),
+        iterations=spec.iterations,
+        rung=spec.rung,
+        score=float(model.get_best_score()["validation"][spec.eval_metric]),
+        best_iteration=int(model.get_best_iteration()),
+        stopped_early=len(curve) < spec.iterations,
+        seconds=time.perf_counter() - start,
+    )
+
+
+# ======================================================================
+# Driver
+# ======================================================================
+class HyperparameterSearch:
+    """
+    Pilote de recherche d'hyperparamètres au-dessus de CatBoost.
+
+    Usage :
+        search = HyperparameterSearch(base_params, tracker, eval_metric="AUC")
+        result = search.random(space, n_trials=20, iterations=500, train=features)
+        CatBoostTrainer(result.best_config(base_params), tracker).train(features)
+    """
+
+    def __init__(
+        self,
+        base_params: Mapping[str, Any],
+        tracker: ExperimentTracker,
+        eval_metric: str = "AUC",
+        max_workers: Optional[int] = None,
+        total_threads: Optional[int] = None,
+        early_stopping_rounds: Optional[int] = 50,
+        border_count: int = 254,
+        holdout: HoldoutConfig = HoldoutConfig(),
+        seed: int = 42,
+        pool_cache: Optional[QuantizedPoolCache] = None,
+    ):
+        # Paramètres gérés par le driver (budget, threads, métrique, logs)
+        reserved = {"iterations", "thread_count", "eval_metric", "verbose", "allow_writing_files"}
+        self.base_params = {k: v for k, v in base_params.items() if k not in reserved}
+
+        self.tracker = tracker
+        self.eval_metric = eval_metric
+        self.maximize = eval_metric in _MAXIMIZED_METRICS
+        self.total_threads = total_threads or os.cpu_count() or 1
+        self.max_workers = max_workers
+        self.early_stopping_rounds = early_stopping_rounds
+        self.border_count = border_count
+        self.holdout = holdout
+        self.seed = seed
+        self.pool_cache = pool_cache
+        self.logger = LoguruLogger()
+
+    # ------------------------------------------------------------------
+    # Stratégies
+    # ------------------------------------------------------------------
+    def grid(
+        self,
+        space: SearchSpace,
+        iterations: int,
+        train: FeatureBatch,
+        valid: Optional[FeatureBatch] = None,
+    ) -> SearchResult:
+        configs = grid_configs(space)
+        with self._session("grid", configs, train, valid) as execute:
+            trials = execute([(i, c) for i, c in enumerate(configs)], iterations, 0)
+            return self._finish(trials)
+
+    def random(
+        self,
+        space: SearchSpace,
+        n_trials: int,
+        iterations: int,
+        train: FeatureBatch,
+        valid: Optional[FeatureBatch] = None,
+    ) -> SearchResult:
+        configs = random_configs(space, n_trials, self.seed)
+        with self._session("random", configs, train, valid) as execute:
+            trials = execute([(i, c) for i, c in enumerate(configs)], iterations, 0)
+            return self._finish(trials)
+
+    def successive_halving(
+        self,
+        space: SearchSpace,
+        n_trials: int,
+        min_iterations: int,
+        max_iterations: int,
+        train: FeatureBatch,
+        valid: Optional[FeatureBatch] = None,
+        eta: int = 3,
+    ) -> SearchResult:
+        """
+        Tous les essais démarrent avec `min_iterations` ; à chaque palier
+        seul le meilleur 1/eta est conservé et son budget multiplié par eta,
+        jusqu'à `max_iterations`.
+        """
+        if eta < 2:
+            raise ValueError("eta doit être >= 2.")
+
+        configs = random_configs(space, n_trials, self.seed)
+        trials: List[TrialResult] = []
+
+        with self._session("halving", configs, train, valid) as execute:
+            survivors: List[Tuple[int, Dict[str, Any]]] = list(enumerate(configs))
+            iterations, rung = min_iterations, 0
+
+            while True:
+                results = execute(survivors, iterations, rung)
+                trials.extend(results)
+                if iterations >= max_iterations or len(results) <= 1:
+                    break
+
+                ranked = sorted(results, key=self._sort_key)
+                keep = max(1, len(ranked) // eta)
+                survivors = [(r.trial_id, r.params) for r in ranked[:keep]]
+                self.logger.info(
+                    f"Palier {rung} terminé : {keep}/{len(ranked)} essais conservés"
+                )
+                iterations, rung = min(max_iterations, iterations * eta), rung + 1
+
+            # Le meilleur essai est cherché au palier le plus élevé atteint
+            top_rung = max(t.rung for t in trials)
+            return self._finish(trials, [t for t in trials if t.rung == top_rung])
+
+    # ------------------------------------------------------------------
+    # Exécution
+    # ------------------------------------------------------------------
+    @contextmanager
+    def _session(
+        self,
+        strategy: str,
+        configs: Sequence[Mapping[str, Any]],
+        train: FeatureBatch,
+        valid: Optional[FeatureBatch],
+    ) -> Iterator[Callable[[Sequence[Tuple[int, Dict[str, Any]]], int, int], List[TrialResult]]]:
+        """
+        Prépare les Pool partagés et le pool de processus, ouvre la run
+        parente, et fournit `execute(trials, iterations, rung)`.
+        """
+        if not configs:
+            raise ValueError("Espace de recherche vide.")
+
+        if valid is None:
+            train, valid = holdout_split(train, self.holdout)
+
+        workers = self.max_workers or min(len(configs), self.total_threads)
+        thread_count = max(1, self.total_threads // workers)
+
+        self.logger.info(
+            f"Recherche {strategy} : {len(configs)} configs, "
+            f"{workers} workers x {thread_count} threads"
+        )
+
+        self.tracker.start_run(run_name=generate_run_name("TUNE"))
+
+        with self.tracker, tempfile.TemporaryDirectory(prefix="churn_gym_tuning_") as tmp:
+            self.tracker.log_params(
+                {
+                    "strategy": strategy,
+                    "n_configs": len(configs),
+                    "eval_metric": self.eval_metric,
+                    "workers": workers,
+                    "thread_count": thread_count,
+                    "train_rows": len(train),
+                    "valid_rows": len(valid),
+                }
+            )
+
+            # Sans cache fourni : cache jetable limité à la recherche
+            cache = self.pool_cache or QuantizedPoolCache(Path(tmp), border_count=self.border_count)
+            train_key = cache.ensure(train, FEATURES_ALL)
+            train_path = str(cache.pool_path(train_key))
+            valid_path = str(cache.path(valid, FEATURES_ALL, reference_key=train_key))
+
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_trial_worker,
+                initargs=(train_path, valid_path),
+            ) as executor:
+
+                def execute(trials, iterations, rung):
+                    # Moins d'essais que de workers (derniers paliers) : plus de threads chacun
+                    threads = max(1, self.total_threads // min(workers, len(trials)))
+                    futures = {
+                        executor.submit(
+                            _run_trial,
+                            TrialSpec(
+                                trial_id=trial_id,
+                                params={**self.base_params, **params},
+                                iterations=iterations,
+                                thread_count=threads,
+                                eval_metric=self.eval_metric,
+                                early_stopping_rounds=self.early_stopping_rounds,
+                                rung=rung,
+                            ),
+                        ): trial_id
+                        for trial_id, params in trials
+                    }
+
+                    results = []
+                    for future in as_completed(futures):
+                        try:
+                            result = future.result()
+                        except Exception as exc:
+                            self.logger.error(f"Essai {futures[future]} en échec : {exc!r}")
+                            continue
+                        results.append(result)
+                        self._log_trial(result)
+
+                    return sorted(results, key=lambda r: r.trial_id)
+
+                yield execute
+
+    def _log_trial(self, result: TrialResult) -> None:
+        self.tracker.log_child_run(
+            run_name=f"trial_{result.trial_id:03d}_r{result.rung}",
+            params={**result.params, "iterations": result.iterations, "rung": result.rung},
+            metrics={
+                self.eval_metric: result.score,
+                "best_iteration": result.best_iteration,
+                "seconds": result.seconds,
+            },
+        )
+        self.logger.info(
+            f"Essai {result.trial_id} (palier {result.rung}) : "
+            f"{self.eval_metric}={result.score:.5f} en {result.seconds:.1f}s"
+            + (" [arrêt anticipé]" if result.stopped_early else "")
+        )
+
+    def _finish(
+        self,
+        trials: List[TrialResult],
+        candidates: Optional[List[TrialResult]] = None,
+    ) -> SearchResult:
+        candidates = candidates if candidates is not None else trials
+        if not candidates:
+            raise RuntimeError("Aucun essai n'a abouti.")
+
+        best = min(candidates, key=self._sort_key)
+        self.tracker.log_params({f"best_{k}": v for k, v in best.params.items()})
+        self.tracker.log_metrics(
+            {
+                f"best_{self.eval_metric}": best.score,
+                "best_trial_id": best.trial_id,
+                "n_trials_done": len(trials),
+            }
+        )
+        self.logger.info(
+            f"Meilleur essai : {best.trial_id} ({self.eval_metric}={best.score:.5f})",
+            params=best.params,
+        )
+        return SearchResult(best=best, trials=trials)
+
+    def _sort_key(self, result: TrialResult) -> float:
+        return -result.score if self.maximize else result.score
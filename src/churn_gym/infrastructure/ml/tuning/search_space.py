@@ -0,0 +1,76 @@
+# src/churn_gym/infrastructure/ml/tuning/search_space.py
+"""
+Espaces de recherche d'hyperparamètres.
+
+Un espace est un dict {nom_param: dimension}. Une dimension est soit
+une liste de valeurs (choix discret, seule forme acceptée en grille),
+soit une distribution (Uniform, LogUniform, IntUniform) pour le tirage aléatoire.
+"""
+from __future__ import annotations
+
+import itertools
+import math
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Sequence, Union
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class Uniform:
+    low: float
+    high: float
+
+    def sample(self, rng: np.random.Generator) -> float:
+        return float(rng.uniform(self.low, self.high))
+
+
+@dataclass(frozen=True)
+class LogUniform:
+    low: float
+    high: float
+
+    def sample(self, rng: np.random.Generator) -> float:
+        return float(math.exp(rng.uniform(math.log(self.low), math.log(self.high))))
+
+
+@dataclass(frozen=True)
+class IntUniform:
+    low: int
+    high: int  # inclus
+
+    def sample(self, rng: np.random.Generator) -> int:
+        return int(rng.integers(self.low, self.high + 1))
+
+
+Distribution = Union[Uniform, LogUniform, IntUniform]
+SearchSpace = Mapping[str, Union[Sequence[Any], Distribution]]
+
+
+def grid_configs(space: SearchSpace) -> List[Dict[str, Any]]:
+    """
+    Produit cartésien des valeurs (toutes les dimensions doivent être des listes).
+    """
+    names = list(space)
+    for name in names:
+        if not isinstance(space[name], (list, tuple)):
+            raise ValueError(f"Recherche en grille : '{name}' doit être une liste de valeurs.")
+
+    return [dict(zip(names, values)) for values in itertools.product(*(space[n] for n in names))]
+
+
+def random_configs(space: SearchSpace, n_trials: int, seed: int = 42) -> List[Dict[str, Any]]:
+    """
+    `n_trials` configurations tirées indépendamment (reproductible via `seed`).
+    """
+    rng = np.random.default_rng(seed)
+    configs = []
+    for _ in range(n_trials):
+        config = {}
+        for name, dimension in space.items():
+            if isinstance(dimension, (list, tuple)):
+                config[name] = dimension[int(rng.integers(len(dimension)))]
+            else:
+                config[name] = dimension.sample(rng)
+        configs.append(config)
+    return configs
@@ -0,0 +1,214 @@
+# src/churn_gym/infrastructure/profiling/stage_profiler.py
+"""
+Profiling des étapes du pipeline.
+
+Pour chaque étape : temps mur, temps CPU du processus, hausse du pic de
+RSS (getrusage) et débit en lignes/s, émis en champs structurés via le
+Logger et, si un ExperimentTracker est fourni, en métriques
+`stage/<étape>/<mesure>`.
+
+Une étape peut en plus être profilée :
+- "cprofile" : <dir>/<étape>.prof (pstats, lisible par snakeviz / pstats)
+- "sample"   : <dir>/<étape>.collapsed, échantillonnage de la pile du thread
+  de l'étape au format « folded stacks » (comme `py-spy record --format raw`),
+  utilisable avec flamegraph.pl ou speedscope
+"""
+from __future__ import annotations
+
+import cProfile
+import resource
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from churn_gym.domain.interfaces.experiment_tracker import ExperimentTracker
+from churn_gym.domain.interfaces.logger import Logger
+from churn_gym.domain.interfaces.stage_profiler import StageHandle, StageProfiler, StageTiming
+from churn_gym.infrastructure.logging.loguru_logger import LoguruLogger
+from churn_gym.infrastructure.utils.config_loader import load_yaml_config
+from churn_gym.infrastructure.utils.root_finder import get_repository_root
+
+
+PROFILE_MODES = ("cprofile", "sample")
+
+# ru_maxrss est en Ko sous Linux, en octets sous macOS
+_MAXRSS_TO_MB = 1 / 1024**2 if sys.platform == "darwin" else 1 / 1024
+
+
+class ResourceStageProfiler(StageProfiler):
+    """
+    StageProfiler basé sur perf_counter / process_time / getrusage.
+
+    Les mesures de chaque étape sont aussi conservées dans `timings`
+    (ex: pour un benchmark ou un résumé de fin de run).
+    """
+
+    def __init__(
+        self,
+        logger: Optional[Logger] = None,
+        tracker: Optional[ExperimentTracker] = None,
+        profile_stage: Optional[str] = None,
+        profile_mode: str = "cprofile",
+        profile_dir: Optional[Path] = None,
+        sample_interval_s: float = 0.005,
+    ):
+        if profile_mode not in PROFILE_MODES:
+            raise ValueError(f"Mode de profiling inconnu : {profile_mode} (attendu : {PROFILE_MODES})")
+
+        self.logger = logger or LoguruLogger()
+        self.tracker = tracker
+        self.profile_stage = profile_stage
+        self.profile_mode = profile_mode
+        if profile_dir is None:
+            root = get_repository_root()
+            cfg = load_yaml_config(root / "configs/paths.yaml")
+            profile_dir = root / Path(cfg["paths"]["profiles_dir"])
+        self.profile_dir = Path(profile_dir)
+        self.sample_interval_s = sample_interval_s
+
+        self.timings: List[StageTiming] = []
+
+        # Profils cumulés sur tous les appels de l'étape profilée
+        self._cprofile = cProfile.Profile()
+        self._samples: Counter = Counter()
+
+    @contextmanager
+    def stage(self, name: str, rows: Optional[int] = None) -> Iterator[StageHandle]:
+        handle = StageHandle(name, rows)
+
+        peak_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        cpu_start = time.process_time()
+        start = time.perf_counter()
+
+        with self._profiling(name):
+            yield handle
+
+        wall_s = time.perf_counter() - start
+        cpu_s = time.process_time() - cpu_start
+        peak_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+        timing = StageTiming(
+            stage=name,
+            wall_s=wall_s,
+            cpu_s=cpu_s,
+            peak_rss_delta_mb=(peak_after - peak_before) * _MAXRSS_TO_MB,
+            rows=handle.rows,
+        )
+        self.timings.append(timing)
+        self._emit(timing)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """
+        Cumul par étape : appels, temps mur / CPU, lignes, débit, pic RSS max.
+        """
+        summary: Dict[str, Dict[str, float]] = {}
+        for timing in self.timings:
+            entry = summary.setdefault(
+                timing.stage,
+                {"calls": 0, "wall_s": 0.0, "cpu_s": 0.0, "rows": 0, "peak_rss_delta_mb": 0.0},
+            )
+            entry["calls"] += 1
+            entry["wall_s"] += timing.wall_s
+            entry["cpu_s"] += timing.cpu_s
+            entry["rows"] += timing.rows or 0
+            entry["peak_rss_delta_mb"] = max(entry["peak_rss_delta_mb"], timing.peak_rss_delta_mb)
+
+        for entry in summary.values():
+            entry["rows_per_s"] = entry["rows"] / entry["wall_s"] if entry["wall_s"] > 0 else 0.0
+        return summary
+
+    # ------------------------------------------------------------------
+    # Utils
+    # ------------------------------------------------------------------
+    def _emit(self, timing: StageTiming) -> None:
+        rows_per_s = timing.rows_per_s
+        self.logger.info(
+            f"Étape {timing.stage} terminée",
+            stage=timing.stage,
+            wall_s=round(timing.wall_s, 4),
+            cpu_s=round(timing.cpu_s, 4),
+            peak_rss_delta_mb=round(timing.peak_rss_delta_mb, 1),
+            rows=timing.rows,
+            rows_per_s=round(rows_per_s, 1) if rows_per_s is not None else None,
+        )
+
+        if self.tracker is not None:
+            metrics = {
+                f"stage/{timing.stage}/wall_s": timing.wall_s,
+                f"stage/{timing.stage}/cpu_s": timing.cpu_s,
+                f"stage/{timing.stage}/peak_rss_delta_mb": timing.peak_rss_delta_mb,
+            }
+            if rows_per_s is not None:
+                metrics[f"stage/{timing.stage}/rows_per_s"] = rows_per_s
+            self.tracker.log_metrics(metrics)
+
+    @contextmanager
+    def _profiling(self, name: str) -> Iterator[None]:
+        # Le fichier est réécrit à chaque appel avec le cumul des appels précédents
+        if name != self.profile_stage:
+            yield
+            return
+
+        self.profile_dir.mkdir(parents=True, exist_ok=True)
+
+        if self.profile_mode == "cprofile":
+            output_path = self.profile_dir / f"{name}.prof"
+            self._cprofile.enable()
+            try:
+                yield
+            finally:
+                self._cprofile.disable()
+                self._cprofile.dump_stats(output_path)
+        else:
+            output_path = self.profile_dir / f"{name}.collapsed"
+            sampler = _StackSampler(threading.get_ident(), self.sample_interval_s, self._samples)
+            sampler.start()
+            try:
+                yield
+            finally:
+                sampler.stop()
+                sampler.write(output_path)
+
+        self.logger.info(f"Profil de l'étape {name} écrit", path=str(output_path))
+
+
+class _StackSampler:
+    """
+    Échantillonne la pile d'un thread à intervalle fixe
+    (sys._current_frames) et compte les piles identiques.
+    """
+
+    def __init__(self, thread_id: int, interval_s: float, stacks: Counter):
+        self.thread_id = thread_id
+        self.interval_s = interval_s
+        self.stacks = stacks
+
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="stage-sampler", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_s):
+            frame = sys._current_frames().get(self.thread_id)
+            frames = []
+            while frame is not None:
+                code = frame.f_code
+                frames.append(f"{code.co_name} ({code.co_filename}:{frame.f_lineno})")
+                frame = frame.f_back
+            if frames:
+                self.stacks[";".join(reversed(frames))] += 1
+
+    def write(self, path: Path) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional
+
+from mlflow.exceptions import MlflowException
+
+from churn_gym.infrastructure.logging.loguru_logger import LoguruLogger
+
+
+# Codes d'erreur MLflow (REST / client) qui valent une nouvelle tentative
+TRANSIENT_MLFLOW_ERROR_CODES = frozenset(
+    {
+        "INTERNAL_ERROR",
+        "TEMPORARILY_UNAVAILABLE",
+        "REQUEST_LIMIT_EXCEEDED",
+        "DEADLINE_EXCEEDED",
+        "ABORTED",
+        "IO_ERROR",
+    }
+)
+
+# Erreurs locales qu'une nouvelle tentative ne corrigera pas
+PERMANENT_OS_ERRORS = (FileNotFoundError, PermissionError, IsADirectoryError, NotADirectoryError)
+
+
+def is_transient_upload_error(exc: BaseException) -> bool:
+    """
+    Vrai pour les échecs qui valent une nouvelle tentative : erreurs
+    réseau / E-S (OSError, dont requests.ConnectionError / Timeout) et
+    erreurs MLflow transitoires. Chemin local invalide, droits, erreurs
+    de valeur, etc. échouent immédiatement.
+    """
+    if isinstance(exc, MlflowException):
+        return exc.error_code in TRANSIENT_MLFLOW_ERROR_CODES
+    return isinstance(exc, OSError) and not isinstance(exc, PERMANENT_OS_ERRORS)
+
+
+@dataclass
+class ArtifactUploadReport:
+    """
+    Bilan des uploads d'artefacts d'un run.
+    """
+
+    files: int = 0
+    bytes: int = 0
+    seconds: float = 0.0
+    failures: List[str] = field(default_factory=list)
+
+    def as_dict(self) -> dict:
+        return {
+            "files": self.files,
+            "bytes": self.bytes,
+            "seconds": round(self.seconds, 3),
+            "failures": len(self.failures),
+        }
+
+
+class BackgroundArtifactUploader:
+    """
+    File d'upload d'artefacts exécutée dans un pool de threads.
+
+    Responsabilités :
+    - Uploader les fichiers en parallèle, hors du thread d'entraînement
+    - Réessayer les échecs transitoires (backoff exponentiel) ; les autres
+      échouent dès la première tentative (cf. is_transient_upload_error)
+    - Attendre la fin de tous les uploads à la demande (drain)
+      et produire un ArtifactUploadReport
+
+    `upload_fn(run_id, path)` réalise l'upload effectif (ex: MlflowClient.log_artifact).
+    Les fichiers ne doivent pas être modifiés avant le drain.
+    """
+
+    def __init__(
+        self,
+        upload_fn: Callable[[str, str], None],
+        max_workers: int = 4,
+        max_retries: int = 3,
+        retry_backoff_s: float = 0.5,
+        is_retryable: Callable[[BaseException], bool] = is_transient_upload_error,
+    ):
+        self.upload_fn = upload_fn
+        self.is_retryable = is_retryable
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.retry_backoff_s = retry_backoff_s
+        self.logger = LoguruLogger()
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: List[Future] = []
+        self._lock = threading.Lock()
+        self._report = ArtifactUploadReport()
+        self._started_at: Optional[float] = None
+
+    def submit(self, run_id: str, path: str) -> None:
+        """
+        Met un fichier en file d'upload pour le run `run_id`.
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="artifact-upload",
+                )
+            if self._started_at is None:
+                self._started_at = time.perf_counter()
+            self._pending.append(self._executor.submit(self._upload, run_id, path))
+
+    def drain(self) -> ArtifactUploadReport:
+        """
+        Bloque jusqu'à la fin des uploads en cours et retourne le bilan
+        (remis à zéro pour le run suivant).
+        """
+        with self._lock:
+            pending, self._pending = self._pending, []
+
+        for future in pending:
+            future.result()
+
+        with self._lock:
+            report, self._report = self._report, ArtifactUploadReport()
+            if self._started_at is not None:
+                report.seconds = time.perf_counter() - self._started_at
+            self._started_at = None
+
+        return report
+
+    def shutdown(self) -> ArtifactUploadReport:
+        """
+        Draine la file puis libère les threads.
+        """
+        report = self.drain()
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+        return report
+
+    # ------------------------------------------------------------------
+    # Worker
+    # ------------------------------------------------------------------
+    def _upload(self, run_id: str, path: str) -> None:
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                self.upload_fn(run_id, path)
+                size = os.path.getsize(path)
+                with self._lock:
+                    self._report.files += 1
+                    self._report.bytes += size
+                return
+            except Exception as exc:
+                if attempt == self.max_retries or not self.is_retryable(exc):
+                    self.logger.error(
+                        f"Échec de l'upload de {path} après {attempt} tentative(s) : {exc!r}"
+                    )
+                    with self._lock:
+                        self._report.failures.append(path)
+                    return
+
+                delay = self.retry_backoff_s * 2 ** (attempt - 1)
+                self.logger.warning(
+                    f"Upload de {path} échoué ({exc!r}) → nouvelle tentative dans {delay:.1f}s"
+                )
+                time.sleep(delay)
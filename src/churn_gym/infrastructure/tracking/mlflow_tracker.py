@@ -1,15 +1,26 @@
 from __future__ import annotations
 
-from typing import Any, Mapping
+import time
+from typing import Any, List, Mapping, Optional, Sequence
 
 import mlflow
+from mlflow.entities import Metric, Param, RunStatus
+from mlflow.utils.mlflow_tags import MLFLOW_PARENT_RUN_ID
 
 from churn_gym.domain.interfaces.experiment_tracker import ExperimentTracker
+from churn_gym.infrastructure.tracking.artifact_uploader import (
+    ArtifactUploadReport,
+    BackgroundArtifactUploader,
+)
 from churn_gym.infrastructure.tracking.mlflow_setup import MLflowConfigurator
 from churn_gym.infrastructure.logging.loguru_logger import LoguruLogger
 from churn_gym.infrastructure.utils.exceptions import MLflowSetupError
 
 
+# Limite MLflow du nombre de métriques par appel log_batch
+MAX_METRICS_PER_BATCH = 1000
+
+
 class MLflowExperimentTracker(ExperimentTracker):
     """
     Implémentation MLflow du port ExperimentTracker.
@@ -18,14 +29,39 @@ class MLflowExperimentTracker(ExperimentTracker):
     - Gestion des expériences MLflow
     - Gestion sûre du cycle de vie des runs
     - Logging des paramètres, métriques et artefacts
+    - Mode bufferisé : les métriques sont accumulées puis envoyées via
+      MlflowClient.log_batch par paquets (vidage à end_run / __exit__)
+    - Upload asynchrone des artefacts (pool de threads, retries),
+      drainé à la fin du run
 
     Toute dépendance à MLflow est confinée à l'infrastructure.
     """
 
-    def __init__(self, configurator: MLflowConfigurator):
+    def __init__(
+        self,
+        configurator: MLflowConfigurator,
+        buffered: bool = False,
+        flush_every: int = MAX_METRICS_PER_BATCH,
+        async_artifacts: bool = False,
+        upload_workers: int = 4,
+        upload_retries: int = 3,
+    ):
         self.logger = LoguruLogger()
         self.client, self.artifact_location = configurator.configure()
 
+        self.buffered = buffered
+        self.flush_every = flush_every
+        self._metric_buffer: List[Metric] = []
+
+        self.last_upload_report: Optional[ArtifactUploadReport] = None
+        self._uploader: Optional[BackgroundArtifactUploader] = None
+        if async_artifacts:
+            self._uploader = BackgroundArtifactUploader(
+                upload_fn=self.client.log_artifact,
+                max_workers=upload_workers,
+                max_retries=upload_retries,
+            )
+
     # ------------------------------------------------------------------
     # Experiment management
     # ------------------------------------------------------------------
@@ -65,6 +101,9 @@ class MLflowExperimentTracker(ExperimentTracker):
             active_run = mlflow.active_run()
 
             if active_run:
+                # Métriques bufferisées et artefacts en file appartiennent au run courant
+                self.flush()
+                self.drain_artifacts()
                 if nested:
                     self.logger.info(
                         f"Run actif détecté ({active_run.info.run_id}) → nested=True"
@@ -86,11 +125,14 @@ class MLflowExperimentTracker(ExperimentTracker):
 
     def end_run(self) -> None:
         """
-        Termine proprement le run MLflow actif (si existant).
+        Termine proprement le run MLflow actif (si existant),
+        après avoir vidé le buffer de métriques et la file d'artefacts.
         """
         active_run = mlflow.active_run()
 
         if active_run:
+            self.flush()
+            self.drain_artifacts()
             self.logger.info(
                 f"Fermeture du run MLflow : {active_run.info.run_id}"
             )
@@ -102,11 +144,125 @@ class MLflowExperimentTracker(ExperimentTracker):
     def log_params(self, params: Mapping[str, Any]) -> None:
         mlflow.log_params(params)
 
-    def log_metrics(self, metrics: Mapping[str, float]) -> None:
-        mlflow.log_metrics(metrics)
+    def log_metrics(self, metrics: Mapping[str, float], step: Optional[int] = None) -> None:
+        if not self.buffered:
+            mlflow.log_metrics(metrics, step=step)
+            return
+
+        timestamp = _now_ms()
+        self._metric_buffer.extend(
+            Metric(key=key, value=float(value), timestamp=timestamp, step=step or 0)
+            for key, value in metrics.items()
+        )
+        if len(self._metric_buffer) >= self.flush_every:
+            self.flush()
+
+    def log_metric_series(
+        self,
+        name: str,
+        values: Sequence[float],
+        start_step: int = 0,
+    ) -> None:
+        """
+        Log d'une série complète (une valeur par step) en quelques appels
+        log_batch au lieu d'un appel par valeur.
+        """
+        timestamp = _now_ms()
+        self._metric_buffer.extend(
+            Metric(key=name, value=float(value), timestamp=timestamp, step=start_step + i)
+            for i, value in enumerate(values)
+        )
+        if not self.buffered or len(self._metric_buffer) >= self.flush_every:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Envoie les métriques bufferisées au run actif, par paquets de
+        MAX_METRICS_PER_BATCH.
+        """
+        if not self._metric_buffer:
+            return
+
+        active_run = mlflow.active_run()
+        if active_run is None:
+            self.logger.warning(
+                f"{len(self._metric_buffer)} métriques bufferisées sans run actif → ignorées"
+            )
+            self._metric_buffer.clear()
+            return
+
+        run_id = active_run.info.run_id
+        metrics, self._metric_buffer = self._metric_buffer, []
+
+        for start in range(0, len(metrics), MAX_METRICS_PER_BATCH):
+            self.client.log_batch(run_id, metrics=metrics[start:start + MAX_METRICS_PER_BATCH])
+
+        self.logger.debug(f"{len(metrics)} métriques envoyées (log_batch)")
+
+    def log_child_run(
+        self,
+        run_name: str,
+        params: Mapping[str, Any],
+        metrics: Mapping[str, float],
+    ) -> str:
+        """
+        Crée une run enfant de la run active via MlflowClient
+        (sans changer la run active du thread) et la termine aussitôt.
+        """
+        parent = mlflow.active_run()
+        if parent is None:
+            raise MLflowSetupError("Aucun run MLflow actif pour rattacher la run enfant.")
+
+        child = self.client.create_run(
+            experiment_id=parent.info.experiment_id,
+            run_name=run_name,
+            tags={MLFLOW_PARENT_RUN_ID: parent.info.run_id},
+        )
+        run_id = child.info.run_id
+        timestamp = _now_ms()
+
+        self.client.log_batch(
+            run_id,
+            metrics=[
+                Metric(key=key, value=float(value), timestamp=timestamp, step=0)
+                for key, value in metrics.items()
+            ],
+            params=[Param(key, str(value)) for key, value in params.items()],
+        )
+        self.client.set_terminated(run_id, status=RunStatus.to_string(RunStatus.FINISHED))
+        return run_id
 
     def log_artifact(self, path: str) -> None:
-        mlflow.log_artifact(path)
+        if self._uploader is None:
+            mlflow.log_artifact(path)
+            return
+
+        active_run = mlflow.active_run()
+        if active_run is None:
+            raise MLflowSetupError("Aucun run MLflow actif pour logger l'artefact.")
+        self._uploader.submit(active_run.info.run_id, path)
+
+    def drain_artifacts(self) -> Optional[ArtifactUploadReport]:
+        """
+        Attend la fin des uploads en file et log le bilan
+        (fichiers, octets, durée, échecs).
+        """
+        if self._uploader is None:
+            return None
+
+        report = self._uploader.drain()
+        if report.files or report.failures:
+            self.logger.info(
+                f"Upload des artefacts terminé : {report.files} fichiers, "
+                f"{report.bytes} octets en {report.seconds:.2f}s "
+                f"({len(report.failures)} échecs)",
+                **report.as_dict(),
+            )
+            for path in report.failures:
+                self.logger.error(f"Artefact non uploadé : {path}")
+
+        self.last_upload_report = report
+        return report
 
     def __enter__(self) -> "MLflowExperimentTracker":
         """
@@ -126,4 +282,8 @@ class MLflowExperimentTracker(ExperimentTracker):
                 f"Exception dans le contexte MLflow : {exc_type.__name__}"
             )
 
-        self.end_run()
\ No newline at end of file
+        self.end_run()
+
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
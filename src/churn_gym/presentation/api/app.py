@@ -0,0 +1,97 @@
+# src/churn_gym/presentation/api/app.py
+"""
+API FastAPI de scoring du churn.
+
+Lancement :
+    uvicorn churn_gym.presentation.api.app:app --host 0.0.0.0 --port 8000
+"""
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List
+
+from fastapi import FastAPI, Request
+
+from churn_gym.domain.entities.prediction_batch import PredictionBatch
+from churn_gym.domain.services.threshold_service import ThresholdConfig
+from churn_gym.infrastructure.logging.loguru_logger import LoguruLogger
+from churn_gym.infrastructure.ml.predict.micro_batcher import MicroBatchConfig
+from churn_gym.infrastructure.utils.config_loader import load_yaml_config
+from churn_gym.infrastructure.utils.root_finder import get_repository_root
+from churn_gym.presentation.api.schemas import (
+    BatchPredictionRequest,
+    BatchPredictionResponse,
+    HealthResponse,
+    MemberPayload,
+    PredictionResponse,
+)
+from churn_gym.presentation.api.scoring_service import ScoringService
+
+
+def create_app() -> FastAPI:
+    logger = LoguruLogger()
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        root = get_repository_root()
+        cfg = load_yaml_config(root / "configs/inference.yaml")
+
+        model_path = root / cfg["model"]["path"]
+        threshold_config = ThresholdConfig(**cfg.get("thresholds", {}))
+
+        batching_cfg = dict(cfg.get("serving", {}).get("micro_batching", {}))
+        micro_batching = (
+            MicroBatchConfig(**batching_cfg) if batching_cfg.pop("enabled", False) else None
+        )
+
+        logger.info(f"Démarrage de l'API (modèle : {model_path})")
+        app.state.scoring = ScoringService(model_path, threshold_config, micro_batching)
+        await app.state.scoring.start()
+        yield
+        await app.state.scoring.stop()
+
+    app = FastAPI(title="Gym Churn Prediction API", lifespan=lifespan)
+
+    @app.get("/health", response_model=HealthResponse)
+    async def health(request: Request) -> HealthResponse:
+        return HealthResponse(status="ok", model_path=request.app.state.scoring.model_path)
+
+    @app.post("/predict", response_model=BatchPredictionResponse)
+    async def predict(request: Request, body: BatchPredictionRequest) -> BatchPredictionResponse:
+        scoring: ScoringService = request.app.state.scoring
+        batch = await scoring.predict_async(body.members)
+        return BatchPredictionResponse(predictions=_to_responses(batch))
+
+    @app.post("/predict/member", response_model=PredictionResponse)
+    async def predict_member(request: Request, member: MemberPayload) -> PredictionResponse:
+        scoring: ScoringService = request.app.state.scoring
+        batch = await scoring.predict_async([member])
+        return _to_responses(batch)[0]
+
+    @app.get("/metrics/micro-batching")
+    async def micro_batching_metrics(request: Request) -> Dict[str, Any]:
+        batcher = request.app.state.scoring.batcher
+        if batcher is None:
+            return {"enabled": False}
+        return {"enabled": True, **batcher.stats.as_dict()}
+
+    return app
+
+
+def _to_responses(batch: PredictionBatch) -> List[PredictionResponse]:
+    return [
+        PredictionResponse(
+            member_id=member_id,
+            churn_probability=p,
+            churn_label=label,
+            risk_level=risk,
+            threshold_used=batch.threshold_used,
+        )
+        for member_id, p, label, risk in zip(
+            batch.member_id.tolist(),
+            batch.churn_probability.tolist(),
+            batch.churn_label.tolist(),
+            batch.risk_level.tolist(),
+        )
+    ]
+
+
+app = create_app()
@@ -0,0 +1,47 @@
+# src/churn_gym/presentation/api/schemas.py
+from datetime import date
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class MemberPayload(BaseModel):
+    """
+    Données brutes d'un membre (mêmes champs que RawMemberRecord, sans la target).
+    """
+
+    member_id: str
+    name: Optional[str] = None
+    age: Optional[float] = None
+    gender: Optional[str] = None
+    address: Optional[str] = None
+    phone_number: Optional[str] = None
+    membership_type: Optional[str] = None
+    join_date: Optional[date] = None
+    last_visit_date: Optional[date] = None
+    favorite_exercise: Optional[str] = None
+    avg_workout_duration_min: Optional[float] = None
+    avg_calories_burned: Optional[float] = None
+    total_weight_lifted_kg: Optional[float] = None
+    visits_per_month: Optional[float] = None
+
+
+class BatchPredictionRequest(BaseModel):
+    members: List[MemberPayload] = Field(..., min_length=1)
+
+
+class PredictionResponse(BaseModel):
+    member_id: str
+    churn_probability: float
+    churn_label: int
+    risk_level: str
+    threshold_used: float
+
+
+class BatchPredictionResponse(BaseModel):
+    predictions: List[PredictionResponse]
+
+
+class HealthResponse(BaseModel):
+    status: str
+    model_path: str
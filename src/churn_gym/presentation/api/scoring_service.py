@@ -0,0 +1,92 @@
+# src/churn_gym/presentation/api/scoring_service.py
+import asyncio
+from pathlib import Path
+from typing import List, Optional, Union
+
+from churn_gym.application.use_cases.build_features import BuildFeaturesUseCase
+from churn_gym.application.use_cases.predict import PredictUseCase
+from churn_gym.application.use_cases.preprocess_dataset import PreprocessDatasetUseCase
+from churn_gym.domain.entities.feature_batch import FeatureBatch
+from churn_gym.domain.entities.prediction_batch import PredictionBatch
+from churn_gym.domain.entities.raw_member_batch import RawMemberBatch
+from churn_gym.domain.entities.raw_member_record import RawMemberRecord
+from churn_gym.domain.services.threshold_service import ThresholdConfig, ThresholdService
+from churn_gym.infrastructure.ml.features.vectorized_feature_engineering import (
+    VectorizedFeatureEngineeringPipeline,
+)
+from churn_gym.infrastructure.ml.predict.catboost_predictor import CatBoostPredictor
+from churn_gym.infrastructure.ml.predict.micro_batcher import (
+    MicroBatchConfig,
+    MicroBatchingPredictor,
+)
+from churn_gym.infrastructure.ml.preprocessing.vectorized_preprocessing_pipeline import (
+    VectorizedPreprocessingPipeline,
+)
+from churn_gym.presentation.api.schemas import MemberPayload
+
+
+class ScoringService:
+    """
+    Assemble les use cases pour le scoring en ligne :
+    payload -> RawMemberBatch -> preprocessing -> features -> PredictUseCase.
+
+    Les pipelines sont construits une seule fois ; le modèle provient du
+    cache process-wide (rechargé uniquement si le fichier .cbm change).
+    Si `micro_batching` est fourni, les requêtes concurrentes sont scorées
+    ensemble par un MicroBatchingPredictor, qui résout lui aussi le modèle
+    via le cache à chaque micro-lot.
+    """
+
+    def __init__(
+        self,
+        model_path: Union[str, Path],
+        threshold_config: ThresholdConfig,
+        micro_batching: Optional[MicroBatchConfig] = None,
+    ):
+        self.model_path = str(model_path)
+        self.preprocess_uc = PreprocessDatasetUseCase(VectorizedPreprocessingPipeline())
+        self.build_features_uc = BuildFeaturesUseCase(VectorizedFeatureEngineeringPipeline())
+        self.threshold_service = ThresholdService(threshold_config)
+
+        # Chargement à froid au démarrage
+        self._predict_use_case()
+
+        self.batcher: Optional[MicroBatchingPredictor] = None
+        if micro_batching is not None:
+            self.batcher = MicroBatchingPredictor(self._predictor, micro_batching)
+
+    async def start(self) -> None:
+        if self.batcher is not None:
+            await self.batcher.start()
+
+    async def stop(self) -> None:
+        if self.batcher is not None:
+            await self.batcher.stop()
+
+    def predict(self, members: List[MemberPayload]) -> PredictionBatch:
+        return self._predict_use_case().execute_batch(self._build_features(members))
+
+    async def predict_async(self, members: List[MemberPayload]) -> PredictionBatch:
+        if self.batcher is None:
+            return await asyncio.to_thread(self.predict, members)
+
+        features = await asyncio.to_thread(self._build_features, members)
+        probs = await self.batcher.score(features)
+        return self._predict_use_case().decide(features, probs)
+
+    # ------------------------------------------------------------------
+    # Utils
+    # ------------------------------------------------------------------
+    def _build_features(self, members: List[MemberPayload]) -> FeatureBatch:
+        raw = RawMemberBatch.from_records(
+            RawMemberRecord(**member.model_dump(), churn=None) for member in members
+        )
+        records = self.preprocess_uc.execute_batch(raw)
+        return self.build_features_uc.execute_batch(records)
+
+    def _predictor(self) -> CatBoostPredictor:
+        # Construction peu coûteuse : le modèle vient du cache (clé chemin + mtime)
+        return CatBoostPredictor(self.model_path)
+
+    def _predict_use_case(self) -> PredictUseCase:
+        return PredictUseCase(self._predictor(), self.threshold_service)
@@ -0,0 +1,258 @@
+# src/churn_gym/presentation/cli/batch_score.py
+"""
+Scoring batch de toute la base membres, en parallèle par shards.
+
+load -> preprocessing -> feature engineering -> CatBoost -> ThresholdService,
+exécuté dans un pool de processus (modèle chargé une fois par worker),
+prédictions écrites dans l'ordre des shards.
+
+Usage :
+    python -m churn_gym.presentation.cli.batch_score \\
+        --input data/gym_churn.csv --output artifacts/predictions.csv \\
+        --workers 4 --threads-per-worker 2 --reference-date 2026-01-31
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import date
+from pathlib import Path
+from typing import Deque, Iterator, Optional
+
+import pandas as pd
+
+from churn_gym.application.use_cases.build_features import BuildFeaturesUseCase
+from churn_gym.application.use_cases.predict import PredictUseCase
+from churn_gym.application.use_cases.preprocess_dataset import PreprocessDatasetUseCase
+from churn_gym.domain.entities.raw_member_batch import RawMemberBatch
+from churn_gym.domain.interfaces.feature_engineering_pipeline import resolve_reference_date
+from churn_gym.domain.services.threshold_service import ThresholdConfig, ThresholdService
+from churn_gym.infrastructure.data_sources.csv_loader_pandas import PandasCSVLoader
+from churn_gym.infrastructure.data_sources.parquet_loader_arrow import ArrowParquetLoader
+from churn_gym.infrastructure.logging.loguru_logger import LoguruLogger
+from churn_gym.infrastructure.ml.features.vectorized_feature_engineering import (
+    VectorizedFeatureEngineeringPipeline,
+)
+from churn_gym.infrastructure.ml.predict.catboost_predictor import CatBoostPredictor
+from churn_gym.infrastructure.ml.preprocessing.vectorized_preprocessing_pipeline import (
+    VectorizedPreprocessingPipeline,
+)
+from churn_gym.infrastructure.utils.config_loader import load_yaml_config
+from churn_gym.infrastructure.utils.root_finder import get_repository_root
+
+
+DEFAULT_SHARD_SIZE = 100_000
+
+
+# ======================================================================
+# Worker (un scorer par processus)
+# ======================================================================
+class _ShardScorer:
+
+    def __init__(
+        self,
+        model_path: str,
+        thread_count: int,
+        threshold_config: ThresholdConfig,
+        reference_date: date,
+    ):
+        self.reference_date = reference_date
+        self.preprocess_uc = PreprocessDatasetUseCase(VectorizedPreprocessingPipeline())
+        self.build_features_uc = BuildFeaturesUseCase(VectorizedFeatureEngineeringPipeline())
+        self.predict_uc = PredictUseCase(
+            CatBoostPredictor(model_path, thread_count=thread_count),
+            ThresholdService(threshold_config),
+        )
+
+    def score(self, raw: RawMemberBatch) -> pd.DataFrame:
+        records = self.preprocess_uc.execute_batch(raw)
+        features = self.build_features_uc.execute_batch(records, self.reference_date)
+        preds = self.predict_uc.execute_batch(features)
+
+        return pd.DataFrame(
+            {
+                "member_id": preds.member_id,
+                "churn_probability": preds.churn_probability,
+                "churn_label": preds.churn_label,
+                "risk_level": preds.risk_level,
+                "threshold_used": preds.threshold_used,
+            }
+        )
+
+
+_scorer: Optional[_ShardScorer] = None
+
+
+def _init_worker(
+    model_path: str,
+    thread_count: int,
+    threshold_config: ThresholdConfig,
+    reference_date: date,
+) -> None:
+    global _scorer
+    _scorer = _ShardScorer(model_path, thread_count, threshold_config, reference_date)
+
+
+def _score_shard(raw: RawMemberBatch) -> pd.DataFrame:
+    return _scorer.score(raw)
+
+
+# ======================================================================
+# Entrées / sorties
+# ======================================================================
+def iter_input_shards(input_path: Path, shard_size: int) -> Iterator[RawMemberBatch]:
+    """
+    Découpe l'entrée (CSV ou Parquet) en shards de `shard_size` membres.
+    """
+    if input_path.suffix.lower() == ".parquet":
+        yield from ArrowParquetLoader(str(input_path)).iter_batches(shard_size)
+    else:
+        yield from PandasCSVLoader(str(input_path)).iter_batches(shard_size)
+
+
+class _PredictionWriter:
+    """
+    Écriture incrémentale des prédictions (CSV ou Parquet selon l'extension).
+    """
+
+    def __init__(self, output_path: Path):
+        self.output_path = output_path
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        self._parquet_writer = None
+        self._first = True
+
+    def write(self, frame: pd.DataFrame) -> None:
+        if self.output_path.suffix.lower() == ".parquet":
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            table = pa.Table.from_pandas(frame, preserve_index=False)
+            if self._parquet_writer is None:
+                self._parquet_writer = pq.ParquetWriter(self.output_path, table.schema)
+            self._parquet_writer.write_table(table)
+        else:
+            frame.to_csv(
+                self.output_path,
+                mode="w" if self._first else "a",
+                header=self._first,
+                index=False,
+            )
+        self._first = False
+
+    def close(self) -> None:
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+
+
+# ======================================================================
+# Orchestration
+# ======================================================================
+def run_batch_scoring(
+    input_path: Path,
+    output_path: Path,
+    model_path: Path,
+    threshold_config: ThresholdConfig,
+    workers: int,
+    threads_per_worker: int,
+    shard_size: int = DEFAULT_SHARD_SIZE,
+    reference_date: Optional[date] = None,
+) -> int:
+    """
+    Score toute l'entrée et retourne le nombre de membres scorés.
+
+    Au plus 2 * workers shards sont en vol : la mémoire reste bornée
+    quelle que soit la taille de l'entrée. La date de référence des
+    features est fixée une fois pour tous les shards (date du jour par défaut).
+    """
+    reference_date = resolve_reference_date(reference_date)
+    logger = LoguruLogger()
+    logger.info(
+        "Scoring batch",
+        input=str(input_path),
+        output=str(output_path),
+        workers=workers,
+        threads_per_worker=threads_per_worker,
+        shard_size=shard_size,
+        reference_date=reference_date.isoformat(),
+    )
+
+    start = time.perf_counter()
+    n_rows = 0
+    writer = _PredictionWriter(output_path)
+
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(str(model_path), threads_per_worker, threshold_config, reference_date),
+        ) as executor:
+            in_flight: Deque[Future] = deque()
+
+            for shard in iter_input_shards(input_path, shard_size):
+                in_flight.append(executor.submit(_score_shard, shard))
+                if len(in_flight) >= 2 * workers:
+                    n_rows += _write_next(in_flight, writer)
+
+            while in_flight:
+                n_rows += _write_next(in_flight, writer)
+    finally:
+        writer.close()
+
+    elapsed = time.perf_counter() - start
+    logger.info(
+        "Scoring batch terminé",
+        rows=n_rows,
+        seconds=round(elapsed, 2),
+        rows_per_s=round(n_rows / elapsed, 1) if elapsed > 0 else None,
+    )
+    return n_rows
+
+
+def _write_next(in_flight: Deque[Future], writer: _PredictionWriter) -> int:
+    # Écriture dans l'ordre de soumission (= ordre des shards)
+    frame = in_flight.popleft().result()
+    writer.write(frame)
+    return len(frame)
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    root = get_repository_root()
+    cfg = load_yaml_config(root / "configs/inference.yaml")
+
+    parser = argparse.ArgumentParser(description="Scoring batch de la base membres.")
+    parser.add_argument("--input", required=True, type=Path, help="Fichier CSV ou Parquet")
+    parser.add_argument("--output", required=True, type=Path, help="Fichier CSV ou Parquet")
+    parser.add_argument(
+        "--model",
+        type=Path,
+        default=root / cfg["model"]["path"],
+        help="Modèle CatBoost (.cbm)",
+    )
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--threads-per-worker", type=int, default=1)
+    parser.add_argument("--shard-size", type=int, default=DEFAULT_SHARD_SIZE)
+    parser.add_argument(
+        "--reference-date",
+        type=date.fromisoformat,
+        default=None,
+        help="Date de référence des features (AAAA-MM-JJ, défaut : aujourd'hui)",
+    )
+    args = parser.parse_args(argv)
+
+    run_batch_scoring(
+        input_path=args.input,
+        output_path=args.output,
+        model_path=args.model,
+        threshold_config=ThresholdConfig(**cfg.get("thresholds", {})),
+        workers=args.workers,
+        threads_per_worker=args.threads_per_worker,
+        shard_size=args.shard_size,
+        reference_date=args.reference_date,
+    )
+
+
+if __name__ == "__main__":
+    main()
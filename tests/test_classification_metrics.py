@@ -0,0 +1,18 @@
+# tests/test_classification_metrics.py
+"""
+roc_auc vectorisé : mêmes valeurs que scikit-learn, y compris avec des ex aequo.
+"""
+import numpy as np
+import pytest
+from sklearn.metrics import roc_auc_score
+
+from churn_gym.infrastructure.ml.metrics.classification_metrics import roc_auc
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_roc_auc_matches_sklearn(seed):
+    rng = np.random.default_rng(seed)
+    y_true = rng.integers(0, 2, 1_000)
+    y_score = np.round(rng.random(1_000), 2)
+
+    assert roc_auc(y_true, y_score) == pytest.approx(roc_auc_score(y_true, y_score))
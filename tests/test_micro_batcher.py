@@ -0,0 +1,74 @@
+# tests/test_micro_batcher.py
+"""
+Cycle de vie de MicroBatchingPredictor : aucune requête ne reste pendante
+après stop().
+"""
+import asyncio
+import threading
+
+import numpy as np
+import pytest
+
+from churn_gym.domain.entities.feature_batch import CategoricalColumn, FeatureBatch
+from churn_gym.domain.interfaces.model_predictor import ModelPredictor
+from churn_gym.infrastructure.ml.predict.micro_batcher import (
+    MicroBatchConfig,
+    MicroBatchingPredictor,
+)
+
+
+def make_batch(n: int) -> FeatureBatch:
+    return FeatureBatch(
+        member_id=np.array([str(i) for i in range(n)], dtype=object),
+        numerical={"age": np.arange(n, dtype=np.float64)},
+        categorical={"gender": CategoricalColumn.encode(["female"] * n)},
+        churn=np.zeros(n, dtype=np.int64),
+    )
+
+
+class BlockingPredictor(ModelPredictor):
+    """Bloque le scoring jusqu'à `release` : le lot reste en cours."""
+
+    def __init__(self):
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def score(self, features):
+        return self.score_batch(features).tolist()
+
+    def score_batch(self, batch: FeatureBatch) -> np.ndarray:
+        self.started.set()
+        self.release.wait(timeout=5)
+        return np.full(len(batch), 0.5)
+
+
+def test_score_after_stop_raises():
+    async def scenario():
+        batcher = MicroBatchingPredictor(BlockingPredictor())
+        await batcher.start()
+        await batcher.stop()
+        with pytest.raises(RuntimeError):
+            await asyncio.wait_for(batcher.score(make_batch(2)), timeout=1)
+
+    asyncio.run(scenario())
+
+
+def test_stop_fails_in_flight_and_queued_requests():
+    predictor = BlockingPredictor()
+
+    async def scenario():
+        batcher = MicroBatchingPredictor(predictor, MicroBatchConfig(max_batch_size=1, max_wait_ms=1))
+        await batcher.start()
+
+        in_flight = asyncio.create_task(batcher.score(make_batch(1)))
+        await asyncio.to_thread(predictor.started.wait, 5)
+        queued = [asyncio.create_task(batcher.score(make_batch(1))) for _ in range(3)]
+        await asyncio.sleep(0.01)
+
+        await batcher.stop()
+        predictor.release.set()
+
+        results = await asyncio.wait_for(asyncio.gather(in_flight, *queued, return_exceptions=True), timeout=1)
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    asyncio.run(scenario())
@@ -0,0 +1,19 @@
+# tests/test_threshold_service.py
+"""
+ThresholdService.to_decisions (lot) donne les mêmes décisions que
+to_decision (membre par membre).
+"""
+import numpy as np
+
+from churn_gym.domain.services.threshold_service import ThresholdConfig, ThresholdService
+
+
+def test_to_decisions_matches_to_decision():
+    service = ThresholdService(ThresholdConfig())
+    probabilities = np.array([0.0, 0.2, 0.35, 0.4, 0.5, 0.69, 0.7, 0.95, 1.0, np.nan])
+
+    labels, risk_levels = service.to_decisions(probabilities)
+
+    for p, label, risk in zip(probabilities, labels, risk_levels):
+        expected_label, expected_risk, _ = service.to_decision(float(p))
+        assert (label, risk) == (expected_label, expected_risk), f"p={p}"
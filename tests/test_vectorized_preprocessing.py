@@ -0,0 +1,110 @@
+# tests/test_vectorized_preprocessing.py
+"""
+Équivalence VectorizedPreprocessingPipeline / RobustPreprocessingPipeline :
+mêmes valeurs, champ par champ, sur data/gym_churn.csv et sur des cas limites.
+"""
+from dataclasses import fields, replace
+from datetime import date
+from typing import List
+
+import numpy as np
+import pytest
+
+from churn_gym.domain.entities.member_record import MemberRecord
+from churn_gym.domain.entities.raw_member_batch import RawMemberBatch
+from churn_gym.domain.entities.raw_member_record import RawMemberRecord
+from churn_gym.infrastructure.data_sources.csv_loader_pandas import PandasCSVLoader
+from churn_gym.infrastructure.ml.preprocessing.robust_preprocessing_pipeline import (
+    RobustPreprocessingPipeline,
+)
+from churn_gym.infrastructure.ml.preprocessing.vectorized_preprocessing_pipeline import (
+    VectorizedPreprocessingPipeline,
+)
+from churn_gym.infrastructure.utils.root_finder import get_repository_root
+
+
+BASE_RECORD = RawMemberRecord(
+    member_id="1",
+    name="Member 1",
+    age=34.0,
+    gender="Female",
+    address="Street 1, City 1",
+    phone_number="030-00000001",
+    membership_type="Premium",
+    join_date=date(2023, 3, 14),
+    last_visit_date=date(2025, 1, 2),
+    favorite_exercise="Yoga",
+    avg_workout_duration_min=45.0,
+    avg_calories_burned=320.5,
+    total_weight_lifted_kg=1200.0,
+    visits_per_month=8.0,
+    churn="Yes",
+)
+
+EDGE_CASES = {
+    "missing_target": [replace(BASE_RECORD, churn=None)],
+    "blank_categoricals": [
+        replace(BASE_RECORD, gender="", membership_type=None, favorite_exercise=""),
+        replace(BASE_RECORD, member_id="2", gender="  MALE ", membership_type=" Basic ", favorite_exercise="  "),
+    ],
+    "non_yes_churn": [
+        replace(BASE_RECORD, member_id=str(i), churn=value)
+        for i, value in enumerate(["No", "no", " YES ", "yes", "Y", "true", "", "1"])
+    ],
+    "missing_numerics_and_dates": [
+        replace(
+            BASE_RECORD,
+            age=None,
+            avg_workout_duration_min=None,
+            avg_calories_burned=None,
+            total_weight_lifted_kg=None,
+            visits_per_month=None,
+            join_date=None,
+            last_visit_date=None,
+        )
+    ],
+    "non_string_member_id": [replace(BASE_RECORD, member_id=42)],
+}
+
+
+def _is_missing(value) -> bool:
+    return value is None or (isinstance(value, float) and np.isnan(value))
+
+
+def assert_same_records(expected: List[MemberRecord], actual: List[MemberRecord]) -> None:
+    assert len(actual) == len(expected)
+    for i, (exp, act) in enumerate(zip(expected, actual)):
+        for f in fields(MemberRecord):
+            e, a = getattr(exp, f.name), getattr(act, f.name)
+            if _is_missing(e) or _is_missing(a):
+                assert _is_missing(e) and _is_missing(a), f"ligne {i}, {f.name} : {e!r} != {a!r}"
+            else:
+                assert e == a, f"ligne {i}, {f.name} : {e!r} != {a!r}"
+
+
+@pytest.fixture(scope="module")
+def csv_batch() -> RawMemberBatch:
+    return PandasCSVLoader(str(get_repository_root() / "data/gym_churn.csv")).load_batch()
+
+
+def test_run_batch_matches_robust_pipeline_on_csv(csv_batch):
+    expected = RobustPreprocessingPipeline().run(csv_batch.to_records())
+    actual = VectorizedPreprocessingPipeline().run_batch(csv_batch).to_records()
+
+    assert_same_records(expected, actual)
+
+
+@pytest.mark.parametrize("case", sorted(EDGE_CASES))
+def test_run_batch_matches_robust_pipeline_on_edge_cases(case):
+    records = EDGE_CASES[case]
+
+    expected = RobustPreprocessingPipeline().run(records)
+    actual = VectorizedPreprocessingPipeline().run_batch(RawMemberBatch.from_records(records)).to_records()
+
+    assert_same_records(expected, actual)
+
+
+def test_run_accepts_records_and_batches(csv_batch):
+    pipeline = VectorizedPreprocessingPipeline()
+
+    assert_same_records(pipeline.run(csv_batch), pipeline.run(csv_batch.to_records()))